@@ -2,6 +2,11 @@
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The upstream-bound ticker views are async, so serve the project through
+this callable (e.g. ``gunicorn config.asgi:application -k
+uvicorn_worker.UvicornWorker``, or ``uvicorn config.asgi:application``
+locally) to let one worker hold many in-flight market data requests.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
@@ -17,7 +17,11 @@ Attributes:
     TEMPLATES (list): List of template configurations.
     ASGI_APPLICATION (str): ASGI application path.
     WSGI_APPLICATION (str): WSGI application path.
-    DATABASES (dict): Database configurations.
+    DATABASES (dict): Database configurations. Connections are kept
+        open for ``DATABASE_CONN_MAX_AGE`` seconds and checked before
+        reuse. With ``DATABASE_POOL`` set, they are taken from a psycopg
+        connection pool of ``DATABASE_POOL_MIN_SIZE`` to
+        ``DATABASE_POOL_MAX_SIZE`` connections instead.
     AUTH_PASSWORD_VALIDATORS (list): List of password validators.
     LANGUAGE_CODE (str): Default language code.
     TIME_ZONE (str): Default time zone.
@@ -27,6 +31,9 @@ Attributes:
     STATIC_ROOT (Path): Root directory for static files.
     STATICFILES_DIRS (list): List of directories for static files.
     DEFAULT_AUTO_FIELD (str): Default auto field type.
+    CACHE_URL (str): URL of the Redis cache, local memory cache if unset.
+        The API only answers conditional GETs with this shared cache.
+    CACHES (dict): Cache configurations.
     CELERY_BROKER_URL (str): URL for the Celery broker.
     CELERY_RESULT_BACKEND (str): URL for the Celery result backend.
     CELERY_ACCEPT_CONTENT (list): List of accepted content types for Celery.
@@ -39,6 +46,42 @@ Attributes:
     CELERY_BROKER_CHANNEL_ERROR_RETRY (bool): Flag for retrying broker
         channel errors.
     CELERY_BEAT_SCHEDULER (str): Scheduler for Celery beat.
+    CELERY_BEAT_SCHEDULE (dict): Periodic tasks installed in the beat
+        scheduler, the watchlist digest at ``WATCHLIST_DIGEST_HOUR``.
+    WATCHLIST_MAX_TICKERS (int): The maximum number of tickers in a
+        watchlist.
+    WATCHLIST_DIGEST_RATE_LIMIT (str): The Celery rate limit of digest
+        deliveries. Celery enforces it in each worker separately, so the
+        rate sent to Telegram is this limit times the number of workers
+        consuming the deliveries; divide it accordingly.
+    ALERT_STREAM_ENABLED (bool): Flag for evaluating notifications on a
+        live price stream with ``run_alert_stream`` instead of the
+        periodic price check.
+    ALERT_STREAM_REDIS_URL (str): URL of the Redis server carrying the
+        notification changes to the alert stream.
+    ALERT_STREAM_CHANNEL (str): Redis channel of the notification changes.
+    ALERT_STREAM_RELOAD_INTERVAL (float): Seconds between full reloads of
+        the notifications by the alert stream.
+    ALERT_CHECK_ADAPTIVE (bool): Flag for checking each ticker at an
+        interval derived from its distance to the nearest threshold
+        instead of on every run of the periodic price check.
+    ALERT_CHECK_REDIS_URL (str): URL of the Redis server keeping the
+        price check schedule.
+    ALERT_CHECK_MIN_INTERVAL (float): Shortest interval in seconds between
+        two price checks of a ticker.
+    ALERT_CHECK_MAX_INTERVAL (float): Longest interval in seconds between
+        two price checks of a ticker.
+    TASK_LOCK_REDIS_URL (str): URL of the Redis server holding the
+        overlap locks of the periodic tasks.
+    TASK_LOCK_TIMEOUT (float): Lease in seconds of a task overlap lock,
+        renewed while the task runs.
+    MARKET_HOURS_MODE (str): Trading hours the price tasks run in:
+        ``regular``, ``extended`` (with pre-market and post-market) or
+        ``always``.
+    MARKET_HOURS_DEFAULT_EXCHANGE (str): Exchange calendar of the tickers
+        whose exchange is unknown.
+    ALERT_CHECK_SIGMAS (float): Size, in daily standard deviations, of the
+        price move that could reach a threshold before the next check.
     REST_FRAMEWORK (dict): Configuration for Django REST framework.
     SIMPLE_JWT (dict): Configuration for Simple JWT.
     DEFAULT_FROM_EMAIL (str): Default email address for sending emails.
@@ -52,6 +95,8 @@ Attributes:
     API_BASE_URL (str): Base URL for the API.
     TICKER_FETCHING_API_URL (str): URL for fetching ticker data.
     TICKER_FETCHING_API_KEY (str): API key for fetching ticker data.
+    MARKET_DATA_TIMEOUT (float): Timeout in seconds for a single upstream
+        market data call made by async views.
     TESTING (bool): Flag for testing mode.
 """
 
@@ -60,6 +105,7 @@ import sys
 from datetime import timedelta
 from pathlib import Path
 
+from celery.schedules import crontab
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -85,6 +131,7 @@ LOCAL_APPS = [
     "users.apps.UsersConfig",
     "notifications.apps.NotificationsConfig",
     "tickers.apps.TickersConfig",
+    "watchlists.apps.WatchlistsConfig",
 ]
 
 THIRD_PARTY_APPS = [
@@ -141,9 +188,21 @@ DATABASES = {
         "PASSWORD": os.getenv("DATABASE_PASSWORD"),
         "HOST": os.getenv("DATABASE_HOST"),
         "PORT": os.getenv("DATABASE_PORT"),
+        "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+if os.getenv("DATABASE_POOL", "False").lower() == "true":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", "20")),
+            "timeout": float(os.getenv("DATABASE_POOL_TIMEOUT", "10")),
+        }
+    }
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"  # noqa
@@ -168,6 +227,18 @@ STATICFILES_DIRS = [BASE_DIR / "static"]
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+CACHE_URL = os.getenv("CACHE_URL")
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+        }
+        if CACHE_URL
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    )
+}
+
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "redis://127.0.0.1:6379/0")
 CELERY_RESULT_BACKEND = os.getenv(
     "CELERY_RESULT_BACKEND", "redis://127.0.0.1:6379/0"
@@ -175,11 +246,44 @@ CELERY_RESULT_BACKEND = os.getenv(
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
-CELERY_IMPORTS = ("notifications.tasks",)
+CELERY_IMPORTS = ("notifications.tasks", "watchlists.tasks")
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 CELERY_BROKER_CHANNEL_ERROR_RETRY = True
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+CELERY_BEAT_SCHEDULE = {
+    "send-watchlist-digests": {
+        "task": "watchlists.tasks.send_watchlist_digests",
+        "schedule": crontab(
+            hour=os.getenv("WATCHLIST_DIGEST_HOUR", "21"), minute=0
+        ),
+    },
+}
+
+WATCHLIST_MAX_TICKERS = int(os.getenv("WATCHLIST_MAX_TICKERS", "50"))
+WATCHLIST_DIGEST_RATE_LIMIT = os.getenv("WATCHLIST_DIGEST_RATE_LIMIT", "20/s")
+
+ALERT_STREAM_ENABLED = (
+    os.getenv("ALERT_STREAM_ENABLED", "False").lower() == "true"
+)
+ALERT_STREAM_REDIS_URL = os.getenv("ALERT_STREAM_REDIS_URL", CELERY_BROKER_URL)
+ALERT_STREAM_CHANNEL = os.getenv("ALERT_STREAM_CHANNEL", "stocktic:alerts")
+ALERT_STREAM_RELOAD_INTERVAL = float(
+    os.getenv("ALERT_STREAM_RELOAD_INTERVAL", "300")
+)
+ALERT_CHECK_ADAPTIVE = (
+    os.getenv("ALERT_CHECK_ADAPTIVE", "True").lower() == "true"
+)
+ALERT_CHECK_REDIS_URL = os.getenv("ALERT_CHECK_REDIS_URL", CELERY_BROKER_URL)
+ALERT_CHECK_MIN_INTERVAL = float(os.getenv("ALERT_CHECK_MIN_INTERVAL", "60"))
+ALERT_CHECK_MAX_INTERVAL = float(os.getenv("ALERT_CHECK_MAX_INTERVAL", "3600"))
+ALERT_CHECK_SIGMAS = float(os.getenv("ALERT_CHECK_SIGMAS", "3"))
+TASK_LOCK_REDIS_URL = os.getenv("TASK_LOCK_REDIS_URL", CELERY_BROKER_URL)
+TASK_LOCK_TIMEOUT = float(os.getenv("TASK_LOCK_TIMEOUT", "60"))
+MARKET_HOURS_MODE = os.getenv("MARKET_HOURS_MODE", "regular")
+MARKET_HOURS_DEFAULT_EXCHANGE = os.getenv(
+    "MARKET_HOURS_DEFAULT_EXCHANGE", "NYSE"
+)
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
@@ -216,5 +320,6 @@ AUTH_USER_MODEL = "users.User"
 API_BASE_URL = os.getenv("API_BASE_URL")
 TICKER_FETCHING_API_URL = os.getenv("TICKER_FETCHING_API_URL")
 TICKER_FETCHING_API_KEY = os.getenv("TICKER_FETCHING_API_KEY")
+MARKET_DATA_TIMEOUT = float(os.getenv("MARKET_DATA_TIMEOUT", "10"))
 
 TESTING = "test" in sys.argv
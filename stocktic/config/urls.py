@@ -28,6 +28,7 @@ api_urlpatterns = [
     path(API_V1, include("users.urls")),
     path(API_V1, include("notifications.api_urls")),
     path(API_V1, include("tickers.api_urls")),
+    path(API_V1, include("watchlists.api_urls")),
 ]
 
 api_token_urlpatterns = [
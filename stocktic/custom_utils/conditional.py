@@ -0,0 +1,173 @@
+"""This module provides helpers for conditional GET handling based on
+per-table version counters stored in the Django cache.
+
+Every tracked model gets a version stamp (a nanosecond timestamp) that is
+bumped on each save or delete. ETag and Last-Modified values are derived
+from the stamp, so answering a conditional request costs a single cache
+lookup instead of a query and a serialization pass.
+
+The stamps must be seen by every process that changes or serves a
+table, so validators are only emitted with a shared cache (``CACHE_URL``);
+with a per-process cache the views are left unconditional. A bump is
+deferred until the transaction commits, so a reader never pairs a new
+stamp with the old rows. Bulk operations that send no signals must call
+``bump_table_version`` themselves.
+
+Any delete receiver keeps Django from deleting a queryset without
+loading and signalling each row, so models that are deleted in bulk are
+tracked without one and use ``TableVersionQuerySet``, whose deletes bump
+the version once.
+
+Classes:
+    TableVersionQuerySet: A queryset whose deletes bump the table version.
+
+Functions:
+    has_shared_cache: Checks whether the default cache is shared between
+        processes.
+    get_table_version: Returns the current version stamp of a model table.
+    bump_table_version: Bumps the version stamp once the transaction
+        commits.
+    track_table_version: Connects the version receivers for a model.
+    table_condition: Returns a ``condition`` decorator for a model table.
+"""
+
+import hashlib
+import threading
+import time
+import weakref
+from datetime import UTC, datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.views.decorators.http import condition
+
+TABLE_VERSION_KEY = "table_version:{label}"
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+_pending = threading.local()
+
+
+def has_shared_cache():
+    """Checks whether the default cache is shared between processes.
+
+    Returns:
+        bool: False for the local memory and dummy caches.
+    """
+    return settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHES
+
+
+def get_table_version(model):
+    """Returns the current version stamp of a model table.
+
+    The stamp is initialised lazily, so a cold cache yields a fresh
+    version and clients simply re-download once.
+
+    Args:
+        model (type[Model]): The model class.
+
+    Returns:
+        int: The version stamp in nanoseconds since the epoch.
+    """
+    key = TABLE_VERSION_KEY.format(label=model._meta.label_lower)
+    cache.add(key, time.time_ns(), None)
+    return cache.get(key) or time.time_ns()
+
+
+def bump_table_version(sender, **kwargs):
+    """Bumps the version stamp of a table once the transaction commits.
+
+    It is the signal receiver of tracked models, and is called directly
+    after bulk operations that send no signals. Several bumps of a table
+    within one transaction are merged into one: the pending bump of each
+    table is remembered until it runs. It is only held weakly, so it is
+    forgotten with the commit callbacks of a rolled back transaction or
+    savepoint.
+
+    Args:
+        sender (type[Model]): The model class that has been changed.
+        **kwargs: Arbitrary signal keyword arguments.
+    """
+    key = TABLE_VERSION_KEY.format(label=sender._meta.label_lower)
+    if not hasattr(_pending, "bumps"):
+        _pending.bumps = weakref.WeakValueDictionary()
+    if key in _pending.bumps:
+        return
+
+    def bump():
+        _pending.bumps.pop(key, None)
+        cache.set(key, time.time_ns(), None)
+
+    _pending.bumps[key] = bump
+    transaction.on_commit(bump)
+
+
+class TableVersionQuerySet(QuerySet):
+    """A queryset whose deletes bump the table version once.
+
+    It is the manager of tracked models that are deleted in bulk, which
+    must also bump the version in their own ``delete`` method.
+    """
+
+    def delete(self):
+        """Deletes the rows and bumps the version of their table.
+
+        Returns:
+            tuple: The number of deleted objects and the number per model.
+        """
+        deleted = super().delete()
+        bump_table_version(self.model)
+        return deleted
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+def track_table_version(model, deletes=True):
+    """Connects the version receivers for a model.
+
+    Args:
+        model (type[Model]): The model class to track.
+        deletes (bool): Whether to receive deletes too. False for models
+            that bump the version of their deletes themselves.
+    """
+    uid = f"table_version:{model._meta.label_lower}"
+    post_save.connect(bump_table_version, sender=model, dispatch_uid=uid)
+    if deletes:
+        post_delete.connect(bump_table_version, sender=model, dispatch_uid=uid)
+
+
+def table_condition(model):
+    """Returns a ``condition`` decorator for a model table.
+
+    The ETag covers the table version and the full request path, so
+    filtered and paginated responses get their own validators. Requests
+    carrying a matching ``If-None-Match`` are answered with 304 before the
+    view runs. Without a shared cache the view is returned unchanged.
+
+    Args:
+        model (type[Model]): The model class the view is built on.
+
+    Returns:
+        Callable: The decorator for the view function.
+    """
+    if not has_shared_cache():
+        return lambda view: view
+
+    def etag_func(request, *args, **kwargs):
+        version = get_table_version(model)
+        raw = f"{model._meta.label_lower}:{version}:{request.get_full_path()}"
+        return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+    def last_modified_func(request, *args, **kwargs):
+        version = get_table_version(model)
+        return datetime.fromtimestamp(version / 1_000_000_000, tz=UTC)
+
+    return condition(
+        etag_func=etag_func, last_modified_func=last_modified_func
+    )
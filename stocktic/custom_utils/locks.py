@@ -0,0 +1,143 @@
+"""This module prevents overlapping runs of periodic Celery tasks.
+
+A run of a locked task first takes a Redis lease lock named after the
+task. The lease expires after ``TASK_LOCK_TIMEOUT`` seconds, so a worker
+that dies does not block the task for long, and a heartbeat thread
+renews it while the run goes on, so a slow run keeps it. A run that
+finds the lock taken does not start: it is skipped, or with
+``on_overlap="queue"`` it is retried once the current run is expected to
+end, at most one retry being queued per lease. Every overlap is counted
+in Redis, and ``get_overlap_counts`` returns the counts by task.
+
+If Redis cannot be reached the run goes ahead unlocked, as it would
+without the decorator.
+
+Functions:
+    get_lock_redis: Returns the Redis connection of the task locks.
+    get_overlap_counts: Returns the number of overlapping runs by task.
+    overlap_lock: Decorates a task so that its runs do not overlap.
+"""
+
+import functools
+import logging
+import threading
+
+from celery import current_task
+from django.conf import settings
+from redis import Redis
+from redis.exceptions import LockError, RedisError
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY = "stocktic:task_lock:{name}"
+QUEUED_KEY = "stocktic:task_queued:{name}"
+OVERLAPS_KEY = "stocktic:task_overlaps"
+
+
+@functools.cache
+def get_lock_redis():
+    """Returns the Redis connection of the task locks.
+
+    Returns:
+        Redis: The connection to ``TASK_LOCK_REDIS_URL``.
+    """
+    return Redis.from_url(settings.TASK_LOCK_REDIS_URL)
+
+
+def get_overlap_counts():
+    """Returns the number of overlapping runs by task.
+
+    Returns:
+        dict: The number of skipped or queued runs by task name.
+    """
+    counts = get_lock_redis().hgetall(OVERLAPS_KEY)
+    return {name.decode(): int(count) for name, count in counts.items()}
+
+
+def _renew(lock, timeout, stopped):
+    while not stopped.wait(timeout / 3):
+        try:
+            lock.extend(timeout, replace_ttl=True)
+        except (LockError, RedisError) as e:
+            logger.error(f"Lost the lock {lock.name}: {e}")
+            return
+
+
+def _overlap(name, timeout, on_overlap, args, kwargs):
+    redis = get_lock_redis()
+    redis.hincrby(OVERLAPS_KEY, name)
+    if on_overlap != "queue" or not current_task:
+        logger.warning(f"{name} is already running, skipping this run")
+        return
+    queued = QUEUED_KEY.format(name=name)
+    if redis.set(queued, 1, nx=True, ex=max(int(timeout), 1)):
+        logger.warning(f"{name} is already running, queueing another run")
+        current_task.apply_async(args=args, kwargs=kwargs, countdown=timeout)
+    else:
+        logger.warning(f"{name} is already running and queued, skipping")
+
+
+def overlap_lock(name=None, timeout=None, on_overlap="skip"):
+    """Decorates a task so that its runs do not overlap.
+
+    Apply it below ``shared_task``, so the task keeps the name of the
+    decorated function.
+
+    Args:
+        name (str, optional): The lock name, by default the module and
+            name of the function.
+        timeout (float, optional): The lease in seconds, by default
+            ``TASK_LOCK_TIMEOUT``.
+        on_overlap (str): ``skip`` to drop a run that finds the lock
+            taken, ``queue`` to retry it after the lease.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func):
+        lock_name = name or f"{func.__module__}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            lease = timeout or settings.TASK_LOCK_TIMEOUT
+            redis = get_lock_redis()
+            lock = redis.lock(
+                LOCK_KEY.format(name=lock_name),
+                timeout=lease,
+                blocking=False,
+                thread_local=False,
+            )
+            try:
+                acquired = lock.acquire()
+            except RedisError as e:
+                logger.warning(f"Running {lock_name} unlocked: {e}")
+                return func(*args, **kwargs)
+            if not acquired:
+                try:
+                    _overlap(lock_name, lease, on_overlap, args, kwargs)
+                except RedisError as e:
+                    logger.warning(f"Could not record the overlap: {e}")
+                return None
+
+            stopped = threading.Event()
+            heartbeat = threading.Thread(
+                target=_renew,
+                args=(lock, lease, stopped),
+                name=f"lock-{lock_name}",
+                daemon=True,
+            )
+            heartbeat.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stopped.set()
+                heartbeat.join()
+                try:
+                    lock.release()
+                except (LockError, RedisError) as e:
+                    logger.warning(f"Could not release {lock_name}: {e}")
+
+        return wrapper
+
+    return decorator
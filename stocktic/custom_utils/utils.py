@@ -6,10 +6,14 @@ Functions:
         instance and current date.
     format_market_cap: Formats a market capitalization value into a h
         uman-readable string with appropriate units (K, M, B, T).
+    lttb_downsample: Selects the points of a series to keep when
+        downsampling it with the Largest-Triangle-Three-Buckets algorithm.
 """
 
 from datetime import datetime
 
+import numpy as np
+
 
 def save_picture(instance, filename):
     """Saves a picture with a formatted filename based on the instance
@@ -72,3 +76,47 @@ def format_market_cap(value):
         return f"{value / thousand:.2f}K"
 
     return str(value)
+
+
+def lttb_downsample(x, y, threshold):
+    """Selects the points of a series to keep when downsampling it with
+    the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept. The remaining points are
+    split into ``threshold - 2`` buckets, and from each bucket the point
+    forming the largest triangle with the previously kept point and the
+    average of the next bucket is kept, which preserves peaks and troughs
+    that plain striding would drop.
+
+    Args:
+        x (numpy.ndarray): The monotonically increasing x values.
+        y (numpy.ndarray): The y values.
+        threshold (int): The number of points to keep.
+
+    Returns:
+        numpy.ndarray: The sorted indices of the points to keep.
+    """
+    size = len(x)
+    if threshold >= size or threshold < 3:
+        return np.arange(size)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, size - 1, threshold - 1).astype(int)
+    indices = np.empty(threshold, dtype=int)
+    indices[0], indices[-1] = 0, size - 1
+
+    selected = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else size
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(area.argmax())
+        indices[bucket + 1] = selected
+    return indices
@@ -7,15 +7,22 @@ ViewSets:
 
 from typing import ClassVar
 
+from custom_utils.conditional import table_condition
+from django.utils.decorators import method_decorator
 from rest_framework import viewsets
 
 from .models import Notification
 from .serializers import NotificationSerializer
 
 
+@method_decorator(table_condition(Notification), name="list")
+@method_decorator(table_condition(Notification), name="retrieve")
 class NotificationViewSet(viewsets.ModelViewSet):
     """A viewset for viewing and editing notification instances.
 
+    Read actions emit ETag and Last-Modified headers derived from the
+    notification table version and answer conditional requests with 304.
+
     Attributes:
         queryset (QuerySet): The queryset of Notification objects.
         serializer_class (Serializer): The serializer class for
@@ -18,3 +18,20 @@ class NotificationsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "notifications"
+
+    def ready(self):
+        """Connects the table version receivers for conditional GET and
+        the receivers keeping the alert stream or the adaptive price
+        checks up to date.
+        """
+        from custom_utils.conditional import track_table_version
+        from django.conf import settings
+
+        from .models import Notification
+        from .signals import track_alert_changes, track_price_checks
+
+        track_table_version(Notification)
+        if settings.ALERT_STREAM_ENABLED:
+            track_alert_changes(Notification)
+        elif settings.ALERT_CHECK_ADAPTIVE:
+            track_price_checks(Notification)
@@ -0,0 +1,71 @@
+"""This module defines a management command that evaluates notifications
+on a live price stream.
+
+Classes:
+    Command: Runs the alert evaluator on the Yahoo Finance stream or on a
+        recorded one.
+"""
+
+import asyncio
+import contextlib
+
+from django.core.management.base import BaseCommand, CommandError
+from tickers.price_streams import ReplayPriceSource, YahooPriceSource
+
+from notifications.streaming import AlertEvaluator
+
+
+class Command(BaseCommand):
+    help = "Evaluate notifications on a live price stream."
+
+    def add_arguments(self, parser):
+        """Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument(
+            "--replay",
+            metavar="CSV",
+            help=(
+                "Replay the ticks of a CSV file with offset, symbol and "
+                "price columns instead of streaming from Yahoo Finance."
+            ),
+        )
+        parser.add_argument(
+            "--speed",
+            type=float,
+            default=1.0,
+            help="Replay speed relative to the recording, 0 for no delays.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Restart the replay once it has ended.",
+        )
+
+    def handle(self, *args, **options):
+        """Runs the evaluator until the stream ends or it is interrupted.
+
+        Args:
+            *args: Variable length argument list.
+            **options: The parsed command line options.
+        """
+        if options["replay"]:
+            try:
+                source = ReplayPriceSource.from_csv(
+                    options["replay"],
+                    speed=options["speed"],
+                    loop=options["loop"],
+                )
+            except (OSError, KeyError, ValueError) as e:
+                raise CommandError(f"Cannot read the replay: {e}") from e
+        else:
+            source = YahooPriceSource()
+        evaluator = AlertEvaluator(source)
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(evaluator.run())
+        self.stdout.write(
+            f"{evaluator.ticks} ticks evaluated, "
+            f"{evaluator.fired} notifications fired"
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-19 12:43
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['ticker', 'notification_criteria', 'notification_value'], name='notification_threshold_idx'),
+        ),
+    ]
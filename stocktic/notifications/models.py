@@ -68,6 +68,18 @@ class Notification(models.Model):
     )
     date_created = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = (
+            models.Index(
+                fields=[
+                    "ticker",
+                    "notification_criteria",
+                    "notification_value",
+                ],
+                name="notification_threshold_idx",
+            ),
+        )
+
     def __str__(self):
         """Returns a string representation of the Notification instance."""
         return self.ticker
@@ -0,0 +1,172 @@
+"""This module schedules the periodic price checks of the notifications.
+
+Checking every alerted symbol on every run spends most upstream calls on
+prices that are nowhere near a threshold. Each symbol is instead given a
+next check time from the distance between its price and its nearest
+threshold, relative to its recent daily volatility: the delay is the
+time over which reaching the threshold would be an
+``ALERT_CHECK_SIGMAS``-sigma move, bounded by ``ALERT_CHECK_MIN_INTERVAL``
+and ``ALERT_CHECK_MAX_INTERVAL``. A symbol 0.1% from a threshold is
+checked on every run, one 20% away about once an hour.
+
+The check times are kept in a Redis sorted set, so every worker shares
+them. A symbol is due when its time has passed or it has none, and it is
+made due again when one of its notifications is saved. If Redis cannot
+be reached every symbol is due, as without the schedule.
+
+Classes:
+    PriceCheckSchedule: The next price check time of each symbol.
+
+Functions:
+    get_schedule_redis: Returns the Redis connection of the schedule.
+    get_volatility: Returns the daily volatility of a price history.
+    next_check_delay: Returns the seconds until the next price check.
+"""
+
+import functools
+import logging
+import math
+import time
+
+from django.conf import settings
+from redis import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAY_SECONDS = 6.5 * 3600
+DEFAULT_VOLATILITY = 0.02
+
+
+@functools.cache
+def get_schedule_redis():
+    """Returns the Redis connection of the price check schedule.
+
+    Returns:
+        Redis: The connection to ``ALERT_CHECK_REDIS_URL``.
+    """
+    return Redis.from_url(settings.ALERT_CHECK_REDIS_URL)
+
+
+def get_volatility(history):
+    """Returns the daily volatility of a price history.
+
+    Args:
+        history (pandas.Series): The daily closing prices, oldest first.
+
+    Returns:
+        float | None: The standard deviation of the daily returns, or
+            None without enough prices.
+    """
+    returns = history.pct_change().dropna()
+    if len(returns) < 2:
+        return None
+    volatility = float(returns.std())
+    return volatility if math.isfinite(volatility) else None
+
+
+def next_check_delay(price, thresholds, volatility=None):
+    """Returns the seconds until the next price check of a symbol.
+
+    Args:
+        price (float): The current price.
+        thresholds (Iterable): The notification thresholds of the symbol.
+        volatility (float, optional): The daily volatility, by default
+            ``DEFAULT_VOLATILITY``.
+
+    Returns:
+        float: The delay, between ``ALERT_CHECK_MIN_INTERVAL`` and
+            ``ALERT_CHECK_MAX_INTERVAL``.
+    """
+    thresholds = [float(threshold) for threshold in thresholds]
+    if not thresholds or price <= 0:
+        return settings.ALERT_CHECK_MIN_INTERVAL
+    distance = min(abs(threshold - price) for threshold in thresholds)
+    move = settings.ALERT_CHECK_SIGMAS * (volatility or DEFAULT_VOLATILITY)
+    delay = (distance / price / move) ** 2 * TRADING_DAY_SECONDS
+    return min(
+        max(delay, settings.ALERT_CHECK_MIN_INTERVAL),
+        settings.ALERT_CHECK_MAX_INTERVAL,
+    )
+
+
+class PriceCheckSchedule:
+    """The next price check time of each symbol.
+
+    Attributes:
+        key (str): The Redis key of the sorted set.
+    """
+
+    def __init__(self, url=None, key="stocktic:price_checks") -> None:
+        """Initializes the schedule.
+
+        Args:
+            url (str, optional): The Redis URL, by default the shared
+                connection to ``ALERT_CHECK_REDIS_URL``.
+            key (str): The Redis key of the sorted set.
+        """
+        self.key = key
+        self._redis = Redis.from_url(url) if url else get_schedule_redis()
+
+    def due(self, symbols, now=None) -> list:
+        """Returns the symbols to check.
+
+        Args:
+            symbols (list): The alerted symbols.
+            now (float, optional): The current UNIX time.
+
+        Returns:
+            list: The symbols whose check time has passed or that have
+                none, or every symbol if Redis cannot be reached.
+        """
+        if not symbols:
+            return []
+        now = time.time() if now is None else now
+        try:
+            scores = self._redis.zmscore(self.key, symbols)
+        except RedisError as e:
+            logger.warning(f"Price check schedule unavailable: {e}")
+            return list(symbols)
+        return [
+            symbol
+            for symbol, score in zip(symbols, scores, strict=True)
+            if score is None or score <= now
+        ]
+
+    def schedule(self, check_times) -> None:
+        """Sets the next check time of symbols.
+
+        Args:
+            check_times (dict): The UNIX time of the next check by symbol.
+        """
+        if not check_times:
+            return
+        try:
+            self._redis.zadd(self.key, check_times)
+        except RedisError as e:
+            logger.warning(f"Could not schedule price checks: {e}")
+
+    def reset(self, symbol) -> None:
+        """Makes a symbol due at the next run.
+
+        Args:
+            symbol (str): The ticker symbol.
+        """
+        self.schedule({symbol: 0})
+
+    def forget(self, symbols) -> None:
+        """Removes the symbols that are no longer alerted.
+
+        Args:
+            symbols (Iterable): The alerted symbols to keep.
+        """
+        try:
+            scheduled = {
+                member.decode()
+                for member in self._redis.zrange(self.key, 0, -1)
+            }
+            stale = scheduled - set(symbols)
+            if stale:
+                self._redis.zrem(self.key, *stale)
+        except RedisError as e:
+            logger.warning(f"Could not clean the price check schedule: {e}")
@@ -2,9 +2,12 @@
 
 Serializers:
     NotificationSerializer: A serializer for Notification instances.
+    NotificationWithTickerSerializer: A serializer for Notification
+        instances with the ticker nested.
 """
 
 from rest_framework import serializers
+from tickers.serializers import TickerSummarySerializer
 
 from .models import Notification
 
@@ -20,3 +23,21 @@ class NotificationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Notification
         fields = "__all__"
+
+
+class NotificationWithTickerSerializer(serializers.ModelSerializer):
+    """A serializer for Notification instances with the ticker nested.
+
+    The queryset should select the related ticker, so serializing many
+    notifications does not issue a query per ticker.
+
+    Meta:
+        model (Model): The model associated with the serializer.
+        fields (str): The fields to include in the serializer.
+    """
+
+    ticker = TickerSummarySerializer(read_only=True)
+
+    class Meta:
+        model = Notification
+        fields = "__all__"
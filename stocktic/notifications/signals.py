@@ -0,0 +1,104 @@
+"""This module publishes notification changes to the alert evaluator.
+
+The streaming alert evaluator runs in its own process and keeps the
+notifications in memory, so every save and delete is announced on the
+``ALERT_STREAM_CHANNEL`` Redis channel once its transaction commits,
+and the evaluator reloads only the notification that changed. Saves
+that only record a delivery time are not announced. A failed
+publish is logged and otherwise ignored: the evaluator also reloads all
+notifications every ``ALERT_STREAM_RELOAD_INTERVAL`` seconds.
+
+A saved notification also makes its symbol due in the price check
+schedule, so a new or moved threshold is checked at the next periodic
+run.
+
+Functions:
+    get_publisher: Returns the Redis connection used for publishing.
+    publish_alert_change: Announces a change of a notification.
+    track_alert_changes: Connects the publishing receivers for a model.
+    reset_price_check: Makes the symbol of a notification due.
+    track_price_checks: Connects the price check receiver for a model.
+"""
+
+import json
+import logging
+from functools import cache
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from redis import Redis
+from redis.exceptions import RedisError
+
+from notifications.scheduling import PriceCheckSchedule
+
+logger = logging.getLogger(__name__)
+
+
+@cache
+def get_publisher():
+    """Returns the Redis connection used for publishing.
+
+    Returns:
+        Redis: The connection to ``ALERT_STREAM_REDIS_URL``.
+    """
+    return Redis.from_url(settings.ALERT_STREAM_REDIS_URL)
+
+
+def publish_alert_change(sender, instance, **kwargs):
+    """Signal receiver that announces a change of a notification.
+
+    Args:
+        sender (type[Model]): The model class that has been changed.
+        instance (Notification): The changed notification.
+        **kwargs: Arbitrary signal keyword arguments.
+    """
+    if kwargs.get("update_fields") == frozenset({"last_notification"}):
+        return
+    message = json.dumps({"notification_id": instance.pk})
+
+    def publish():
+        try:
+            get_publisher().publish(settings.ALERT_STREAM_CHANNEL, message)
+        except RedisError as e:
+            logger.warning(f"Could not publish alert change: {e}")
+
+    transaction.on_commit(publish)
+
+
+def track_alert_changes(model):
+    """Connects the publishing receivers for a model.
+
+    Args:
+        model (type[Model]): The notification model.
+    """
+    uid = f"alert_change:{model._meta.label_lower}"
+    post_save.connect(publish_alert_change, sender=model, dispatch_uid=uid)
+    post_delete.connect(publish_alert_change, sender=model, dispatch_uid=uid)
+
+
+def reset_price_check(sender, instance, **kwargs):
+    """Signal receiver that makes the symbol of a notification due.
+
+    Args:
+        sender (type[Model]): The model class that has been saved.
+        instance (Notification): The saved notification.
+        **kwargs: Arbitrary signal keyword arguments.
+    """
+    if kwargs.get("update_fields") == frozenset({"last_notification"}):
+        return
+    symbol = instance.ticker.symbol
+    transaction.on_commit(lambda: PriceCheckSchedule().reset(symbol))
+
+
+def track_price_checks(model):
+    """Connects the price check receiver for a model.
+
+    Args:
+        model (type[Model]): The notification model.
+    """
+    post_save.connect(
+        reset_price_check,
+        sender=model,
+        dispatch_uid=f"price_check:{model._meta.label_lower}",
+    )
@@ -0,0 +1,328 @@
+"""This module evaluates notifications on a live price stream.
+
+The periodic ``check_ticker_prices`` task fetches every price on each run
+and only notices a crossed threshold at the next run. The evaluator
+instead keeps the notifications in memory, indexed by symbol and sorted
+by threshold, and checks each tick from a ``PriceSource`` against the
+last price of its symbol. Only the notifications whose threshold lies
+between the two prices are touched, and their deliveries are queued as
+soon as the tick arrives.
+
+A notification fires when the price crosses its threshold, and again
+only after the price has gone back and crossed it anew. The first tick of
+a symbol fires every notification whose condition holds, as a run of the
+periodic check would, and so does a created or changed notification
+whose condition holds at the last price.
+
+Notification changes arrive on the ``ALERT_STREAM_CHANNEL`` Redis channel
+(see ``notifications.signals``) and every notification is reloaded each
+``ALERT_STREAM_RELOAD_INTERVAL`` seconds, so a lost message is corrected.
+A change or reload that fails is logged and retried with the next one.
+Should either background loop still die, the evaluator stops with its
+error rather than running on without it.
+
+Classes:
+    AlertIndex: The notifications of each symbol sorted by threshold.
+    AlertEvaluator: Fires notifications from a live price stream.
+"""
+
+import asyncio
+import bisect
+import functools
+import json
+import logging
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from notifications.models import Notification
+from notifications.tasks import deliver_notification
+
+logger = logging.getLogger(__name__)
+
+ALERT_FIELDS = (
+    "pk",
+    "ticker__symbol",
+    "notification_criteria",
+    "notification_value",
+)
+LISTEN_RETRY_DELAY = 5
+
+
+class AlertIndex:
+    """The notifications of each symbol sorted by threshold.
+
+    Each symbol has a sorted list of thresholds per criteria with a
+    parallel list of notification IDs, so the notifications crossed by a
+    price move are found with two binary searches.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty index."""
+        self._values = defaultdict(list)
+        self._ids = defaultdict(list)
+        self._alerts = {}
+
+    def __len__(self) -> int:
+        """Returns the number of indexed notifications."""
+        return len(self._alerts)
+
+    @property
+    def symbols(self) -> set:
+        """set: The symbols with at least one notification."""
+        return {symbol for symbol, _, _ in self._alerts.values()}
+
+    def add(self, notification_id, symbol, criteria, value) -> None:
+        """Adds or replaces a notification.
+
+        Args:
+            notification_id (int): The notification ID.
+            symbol (str): The ticker symbol.
+            criteria (str): ``more_than`` or ``less_than``.
+            value (float): The threshold.
+        """
+        self.remove(notification_id)
+        key = (symbol, criteria)
+        position = bisect.bisect_right(self._values[key], value)
+        self._values[key].insert(position, value)
+        self._ids[key].insert(position, notification_id)
+        self._alerts[notification_id] = (symbol, criteria, value)
+
+    def remove(self, notification_id) -> None:
+        """Removes a notification if it is indexed.
+
+        Args:
+            notification_id (int): The notification ID.
+        """
+        alert = self._alerts.pop(notification_id, None)
+        if alert is None:
+            return
+        symbol, criteria, value = alert
+        key = (symbol, criteria)
+        values, ids = self._values[key], self._ids[key]
+        start = bisect.bisect_left(values, value)
+        position = ids.index(notification_id, start)
+        del values[position], ids[position]
+        if not values:
+            del self._values[key], self._ids[key]
+
+    def clear(self) -> None:
+        """Removes every notification."""
+        self._values.clear()
+        self._ids.clear()
+        self._alerts.clear()
+
+    def crossed(self, symbol, previous, price) -> list:
+        """Returns the notifications crossed by a price move.
+
+        Args:
+            symbol (str): The ticker symbol.
+            previous (float | None): The previous price, None for the
+                first tick of the symbol.
+            price (float): The new price.
+
+        Returns:
+            list: The IDs of the notifications whose condition holds at
+                ``price`` but did not at ``previous``.
+        """
+        crossed = []
+        key = (symbol, "more_than")
+        if key in self._values:
+            values = self._values[key]
+            start = (
+                0 if previous is None else bisect.bisect_left(values, previous)
+            )
+            end = bisect.bisect_left(values, price)
+            crossed.extend(self._ids[key][start:end])
+        key = (symbol, "less_than")
+        if key in self._values:
+            values = self._values[key]
+            start = bisect.bisect_right(values, price)
+            end = (
+                len(values)
+                if previous is None
+                else bisect.bisect_right(values, previous)
+            )
+            crossed.extend(self._ids[key][start:end])
+        return crossed
+
+
+class AlertEvaluator:
+    """Fires notifications from a live price stream.
+
+    Attributes:
+        source (PriceSource): The price stream.
+        index (AlertIndex): The indexed notifications.
+        prices (dict): The last price of each symbol.
+        ticks (int): The number of ticks evaluated.
+        fired (int): The number of deliveries queued.
+    """
+
+    def __init__(self, source) -> None:
+        """Initializes the evaluator.
+
+        Args:
+            source (PriceSource): The price stream.
+        """
+        self.source = source
+        self.index = AlertIndex()
+        self.prices = {}
+        self.ticks = 0
+        self.fired = 0
+        self._failure = None
+
+    async def run(self) -> None:
+        """Evaluates the stream until it ends or the task is cancelled.
+
+        Raises:
+            Exception: The error of a background task that has died.
+        """
+        await self.reload_all()
+        self._failure = None
+        supervise = functools.partial(self._supervise, asyncio.current_task())
+        background = [
+            asyncio.create_task(
+                self._listen_for_changes(), name="alert-changes"
+            ),
+            asyncio.create_task(self._reload_forever(), name="alert-reload"),
+        ]
+        for task in background:
+            task.add_done_callback(supervise)
+        try:
+            async for symbol, price in self.source:
+                await self.handle_tick(symbol, price)
+        except asyncio.CancelledError:
+            if self._failure is None:
+                raise
+            raise self._failure from None
+        finally:
+            for task in background:
+                task.cancel()
+            await self.source.close()
+            logger.info(
+                f"Alert stream stopped after {self.ticks} ticks, "
+                f"{self.fired} notifications fired"
+            )
+
+    async def handle_tick(self, symbol, price) -> list:
+        """Evaluates a tick and queues the crossed notifications.
+
+        Args:
+            symbol (str): The ticker symbol.
+            price (float): The new price.
+
+        Returns:
+            list: The IDs of the notifications fired.
+        """
+        self.ticks += 1
+        previous = self.prices.get(symbol)
+        self.prices[symbol] = price
+        crossed = self.index.crossed(symbol, previous, price)
+        if crossed:
+            self.fired += len(crossed)
+            await asyncio.to_thread(self._deliver, crossed, price)
+            logger.info(f"{symbol} at {price:.2f} fired {crossed}")
+        return crossed
+
+    async def reload_all(self) -> None:
+        """Reloads every notification and updates the subscriptions."""
+        alerts = await sync_to_async(self._load)()
+        self.index.clear()
+        for alert in alerts:
+            self._index(*alert)
+        await self._update_subscriptions()
+        logger.info(
+            f"Loaded {len(self.index)} notifications for "
+            f"{len(self.source.symbols)} symbols"
+        )
+
+    async def reload(self, notification_id) -> None:
+        """Reloads one notification and updates the subscriptions.
+
+        Args:
+            notification_id (int): The ID of the changed notification.
+        """
+        alerts = await sync_to_async(self._load)(pk=notification_id)
+        self.index.remove(notification_id)
+        for alert in alerts:
+            self._index(*alert)
+        await self._update_subscriptions()
+
+        for _, symbol, _, _ in alerts:
+            price = self.prices.get(symbol)
+            if price is None:
+                continue
+            if notification_id in self.index.crossed(symbol, None, price):
+                self.fired += 1
+                await asyncio.to_thread(
+                    self._deliver, [notification_id], price
+                )
+
+    def _index(self, notification_id, symbol, criteria, value) -> None:
+        if criteria in ("more_than", "less_than") and value is not None:
+            self.index.add(notification_id, symbol, criteria, float(value))
+
+    async def _update_subscriptions(self) -> None:
+        symbols = self.index.symbols
+        await self.source.unsubscribe(self.source.symbols - symbols)
+        await self.source.subscribe(symbols - self.source.symbols)
+        for symbol in set(self.prices) - symbols:
+            del self.prices[symbol]
+
+    @staticmethod
+    def _load(**filters) -> list:
+        close_old_connections()
+        return list(
+            Notification.objects.filter(**filters).values_list(*ALERT_FIELDS)
+        )
+
+    @staticmethod
+    def _deliver(notification_ids, price) -> None:
+        for notification_id in notification_ids:
+            deliver_notification.delay(notification_id, price)
+
+    async def _listen_for_changes(self) -> None:
+        while True:
+            redis = Redis.from_url(settings.ALERT_STREAM_REDIS_URL)
+            try:
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(settings.ALERT_STREAM_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            await self._apply_change(message["data"])
+            except RedisError as e:
+                logger.warning(f"Alert change channel unavailable: {e}")
+            except Exception:
+                logger.exception("Alert change listener failed")
+            finally:
+                await redis.aclose()
+            await asyncio.sleep(LISTEN_RETRY_DELAY)
+
+    async def _apply_change(self, data) -> None:
+        try:
+            change = json.loads(data)
+            await self.reload(change["notification_id"])
+        except Exception:
+            logger.exception(f"Could not apply alert change {data!r}")
+
+    async def _reload_forever(self) -> None:
+        while True:
+            await asyncio.sleep(settings.ALERT_STREAM_RELOAD_INTERVAL)
+            try:
+                await self.reload_all()
+            except Exception:
+                logger.exception("Could not reload the notifications")
+
+    def _supervise(self, main, task) -> None:
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.error(
+            f"Alert stream task {task.get_name()} died",
+            exc_info=task.exception(),
+        )
+        self._failure = task.exception()
+        main.cancel()
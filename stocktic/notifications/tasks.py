@@ -1,55 +1,213 @@
 """This module defines the tasks for the notifications app.
 
+The periodic check only fetches the symbols that are due in the
+``PriceCheckSchedule`` (see ``notifications.scheduling``) and whose
+exchange is trading in ``MARKET_HOURS_MODE`` (see
+``tickers.market_hours``), all of them in one batched download that
+also yields their recent volatility. The prices are upserted into the
+``LatestQuote`` table, and the triggered notifications and the nearest
+thresholds are found by the database, so the work in Python grows with
+the number of triggered notifications rather than with the number of
+notifications. Each symbol is then rescheduled from its distance to the
+nearest threshold.
+
+With ``ALERT_STREAM_ENABLED`` the notifications are evaluated on live
+prices by the ``run_alert_stream`` command instead, which queues
+``deliver_notification`` as soon as a threshold is crossed, and the
+periodic check does nothing.
+
 Tasks:
     check_ticker_prices: A periodic task to check ticker prices and
         send notifications.
+    deliver_notification: Sends a notification whose threshold has been
+        crossed.
+    get_triggered_notifications: Returns the notifications triggered by
+        the latest quotes.
+    get_nearest_thresholds: Returns the thresholds closest to the latest
+        quote of tickers.
     send_notification: A helper function to send notifications to users.
 """
 
 import logging
+import time
 
 from celery import shared_task
+from custom_utils.locks import overlap_lock
 from django.conf import settings
 from django.core.mail import send_mail
+from django.db.models import Exists, F, Max, Min, OuterRef, Q
 from django.utils import timezone
+from tickers.market_hours import is_market_open, next_market_open
+from tickers.models import LatestQuote, Ticker
 from tickers.services import Finance
 
 from notifications.models import Notification
+from notifications.scheduling import (
+    PriceCheckSchedule,
+    get_volatility,
+    next_check_delay,
+)
 from telegram_bot.utils import send_telegram_message
 
 logger = logging.getLogger(__name__)
 
 
 @shared_task
+@overlap_lock()
 def check_ticker_prices():
     """A periodic task to check ticker prices and send notifications.
 
-    This task fetches the latest price for each ticker and sends a notification
-    to the user if the price meets the criteria specified in the notification.
+    This task fetches the latest price of each due ticker and sends a
+    notification to the user if the price meets the criteria specified in
+    the notification. With ``ALERT_CHECK_ADAPTIVE`` disabled every ticker
+    is due on every run. Tickers whose exchange is closed are skipped and
+    scheduled for its next opening.
 
     Logs an error if the price cannot be fetched.
 
     Returns:
         None
     """
-    notifications = Notification.objects.all()
-    for notification in notifications:
-        ticker = notification.ticker.symbol
-        finance = Finance(ticker)
-        current_price = finance.get_latest_price()
-
-        if current_price is None:
+    if settings.ALERT_STREAM_ENABLED:
+        logger.info("Prices are checked by the alert stream, skipping")
+        return
+    tickers = {
+        symbol: (ticker_id, exchange)
+        for symbol, ticker_id, exchange in Ticker.objects
+        .filter(Exists(Notification.objects.filter(ticker=OuterRef("pk"))))
+        .values_list("symbol", "pk", "stock_exchange")
+        .order_by("symbol")
+    }
+    symbols = list(tickers)
+    schedule = PriceCheckSchedule() if settings.ALERT_CHECK_ADAPTIVE else None
+    due = schedule.due(symbols) if schedule else symbols
+    closed = {
+        symbol for symbol in due if not is_market_open(tickers[symbol][1])
+    }
+    if closed and schedule:
+        schedule.schedule({
+            symbol: next_market_open(tickers[symbol][1]).timestamp()
+            for symbol in closed
+        })
+    due = [symbol for symbol in due if symbol not in closed]
+    logger.info(
+        f"Checking prices of {len(due)} of {len(symbols)} tickers, "
+        f"{len(closed)} with their market closed"
+    )
+    if not due:
+        return
+
+    histories = Finance.get_daily_closes(due, period="1mo")
+    prices = {
+        symbol: float(history.iloc[-1])
+        for symbol, history in histories.items()
+    }
+    LatestQuote.upsert(
+        {tickers[symbol][0]: price for symbol, price in prices.items()},
+        timezone.now(),
+    )
+    priced = [tickers[symbol][0] for symbol in prices]
+    triggered = 0
+    for notification in get_triggered_notifications(priced).iterator():
+        send_notification(notification, prices[notification.ticker.symbol])
+        triggered += 1
+    logger.info(f"{triggered} notifications triggered")
+
+    thresholds = get_nearest_thresholds(priced)
+    now = time.time()
+    check_times = {}
+    for ticker in due:
+        if ticker not in prices:
             logger.error(f"Could not fetch price for {ticker}")
+            check_times[ticker] = now + settings.ALERT_CHECK_MIN_INTERVAL
             continue
+        check_times[ticker] = now + next_check_delay(
+            prices[ticker],
+            thresholds.get(tickers[ticker][0], []),
+            get_volatility(histories[ticker]),
+        )
+    if schedule:
+        schedule.schedule(check_times)
+        schedule.forget(symbols)
+
+
+def get_triggered_notifications(ticker_ids):
+    """Returns the notifications triggered by the latest quotes.
+
+    The conditions are evaluated in the database by joining the
+    notifications to the ``LatestQuote`` of their ticker, along the
+    ``(ticker, criteria, value)`` index, so only the triggered
+    notifications are loaded.
+
+    Args:
+        ticker_ids (list): The IDs of the tickers with fresh quotes.
+
+    Returns:
+        QuerySet: The triggered notifications with their user and
+            ticker.
+    """
+    price = F("ticker__latest_quote__price")
+    return (
+        Notification.objects
+        .filter(ticker_id__in=ticker_ids)
+        .filter(
+            Q(notification_criteria="more_than", notification_value__lt=price)
+            | Q(
+                notification_criteria="less_than", notification_value__gt=price
+            )
+        )
+        .select_related("user", "ticker")
+    )
+
+
+def get_nearest_thresholds(ticker_ids):
+    """Returns the thresholds closest to the latest quote of tickers.
 
-        if (
-            notification.notification_criteria == "more_than"
-            and current_price > notification.notification_value
-        ) or (
-            notification.notification_criteria == "less_than"
-            and current_price < notification.notification_value
-        ):
-            send_notification(notification, current_price)
+    Args:
+        ticker_ids (list): The IDs of the tickers with fresh quotes.
+
+    Returns:
+        dict: The nearest thresholds above and below the quote by ticker
+            ID, without the missing ones.
+    """
+    value = "notifications__notification_value"
+    price = F("latest_quote__price")
+    rows = (
+        Ticker.objects
+        .filter(pk__in=ticker_ids)
+        .values_list("pk")
+        .annotate(
+            above=Min(value, filter=Q(**{f"{value}__gte": price})),
+            below=Max(value, filter=Q(**{f"{value}__lte": price})),
+        )
+    )
+    return {
+        ticker_id: [value for value in (above, below) if value is not None]
+        for ticker_id, above, below in rows
+    }
+
+
+@shared_task
+def deliver_notification(notification_id, current_price):
+    """Sends a notification whose threshold has been crossed.
+
+    Args:
+        notification_id (int): The ID of the notification.
+        current_price (float): The price that crossed the threshold.
+
+    Returns:
+        None
+    """
+    notification = (
+        Notification.objects
+        .select_related("user", "ticker")
+        .filter(pk=notification_id)
+        .first()
+    )
+    if notification is None:
+        logger.info(f"Notification {notification_id} no longer exists")
+        return
+    send_notification(notification, current_price)
 
 
 def send_notification(notification, current_price):
@@ -85,4 +243,4 @@ def send_notification(notification, current_price):
         send_telegram_message(user.telegram_user_id, message)
 
     notification.last_notification = timezone.now()
-    notification.save()
+    notification.save(update_fields=["last_notification"])
@@ -1 +1,295 @@
-# noqa
+"""This module contains the tests of the notifications app.
+
+Classes:
+    AlertIndexTestCase: Tests the notifications crossed by a price move.
+    AlertEvaluatorTestCase: Tests the evaluation of a price stream.
+    TriggeredNotificationsTestCase: Tests the notifications triggered by
+        the latest quotes.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase, TransactionTestCase
+
+from notifications.models import Notification
+from notifications.streaming import AlertEvaluator, AlertIndex
+from notifications.tasks import (
+    get_nearest_thresholds,
+    get_triggered_notifications,
+)
+from tickers.models import LatestQuote, Ticker
+from tickers.price_streams import ReplayPriceSource
+from users.models import User
+
+
+async def idle(self):
+    """Stands in for a background task of the evaluator.
+
+    Args:
+        self (AlertEvaluator): The evaluator.
+    """
+    await asyncio.Event().wait()
+
+
+class AlertIndexTestCase(TestCase):
+    """Tests the notifications crossed by a price move."""
+
+    def setUp(self):
+        """Sets up an index with two thresholds per criteria."""
+        self.index = AlertIndex()
+        self.index.add(1, "AAPL", "more_than", 150.0)
+        self.index.add(2, "AAPL", "more_than", 160.0)
+        self.index.add(3, "AAPL", "less_than", 140.0)
+        self.index.add(4, "AAPL", "less_than", 130.0)
+
+    def test_first_tick_fires_every_condition_that_holds(self):
+        """Tests that the first tick fires the conditions already met."""
+        self.assertEqual(self.index.crossed("AAPL", None, 155), [1])
+        self.assertEqual(self.index.crossed("AAPL", None, 165), [1, 2])
+        self.assertEqual(self.index.crossed("AAPL", None, 135), [3])
+        self.assertEqual(self.index.crossed("AAPL", None, 145), [])
+
+    def test_crossing_up(self):
+        """Tests that a rise fires only the thresholds it passes."""
+        self.assertEqual(self.index.crossed("AAPL", 145, 155), [1])
+        self.assertEqual(self.index.crossed("AAPL", 155, 165), [2])
+        self.assertEqual(self.index.crossed("AAPL", 145, 165), [1, 2])
+        self.assertEqual(self.index.crossed("AAPL", 155, 158), [])
+
+    def test_crossing_down(self):
+        """Tests that a fall fires only the thresholds it passes."""
+        self.assertEqual(self.index.crossed("AAPL", 145, 135), [3])
+        self.assertEqual(self.index.crossed("AAPL", 135, 125), [4])
+        self.assertEqual(self.index.crossed("AAPL", 145, 125), [4, 3])
+        self.assertEqual(self.index.crossed("AAPL", 135, 132), [])
+
+    def test_price_at_threshold(self):
+        """Tests that a threshold fires only once the price is past it."""
+        self.assertEqual(self.index.crossed("AAPL", 145, 150), [])
+        self.assertEqual(self.index.crossed("AAPL", 150, 151), [1])
+        self.assertEqual(self.index.crossed("AAPL", 145, 140), [])
+        self.assertEqual(self.index.crossed("AAPL", 140, 139), [3])
+        self.assertEqual(self.index.crossed("AAPL", None, 150), [])
+        self.assertEqual(self.index.crossed("AAPL", None, 140), [])
+
+    def test_unchanged_price(self):
+        """Tests that an unchanged price fires nothing."""
+        for price in (125, 135, 140, 145, 150, 155, 165):
+            self.assertEqual(self.index.crossed("AAPL", price, price), [])
+
+    def test_fires_again_after_crossing_back(self):
+        """Tests that a threshold fires again once crossed anew."""
+        self.assertEqual(self.index.crossed("AAPL", 145, 155), [1])
+        self.assertEqual(self.index.crossed("AAPL", 155, 149), [])
+        self.assertEqual(self.index.crossed("AAPL", 149, 151), [1])
+
+    def test_equal_thresholds(self):
+        """Tests that notifications on the same threshold fire together."""
+        self.index.add(5, "AAPL", "more_than", 150.0)
+        self.assertEqual(self.index.crossed("AAPL", 145, 155), [1, 5])
+
+    def test_remove(self):
+        """Tests that a removed notification no longer fires."""
+        self.index.remove(1)
+        self.index.remove(3)
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.crossed("AAPL", 135, 165), [2])
+        self.assertEqual(self.index.crossed("AAPL", 145, 125), [4])
+
+    def test_other_symbol(self):
+        """Tests that a symbol without notifications fires nothing."""
+        self.assertEqual(self.index.symbols, {"AAPL"})
+        self.assertEqual(self.index.crossed("MSFT", None, 155), [])
+
+
+@mock.patch.object(AlertEvaluator, "_reload_forever", idle)
+@mock.patch.object(AlertEvaluator, "_listen_for_changes", idle)
+@mock.patch("notifications.streaming.deliver_notification")
+class AlertEvaluatorTestCase(TransactionTestCase):
+    """Tests the evaluation of a price stream.
+
+    The evaluator loads the notifications from another thread, so the
+    test data is committed rather than kept in a test transaction.
+    """
+
+    def setUp(self):
+        """Sets up two notifications on one ticker."""
+        user = User.objects.create_user(
+            email="alerts@example.com", password="password"
+        )
+        ticker = Ticker.objects.create(symbol="AAPL")
+        self.above = Notification.objects.create(
+            user=user,
+            ticker=ticker,
+            notification_value=Decimal(150),
+            notification_criteria="more_than",
+        )
+        self.below = Notification.objects.create(
+            user=user,
+            ticker=ticker,
+            notification_value=Decimal(140),
+            notification_criteria="less_than",
+        )
+
+    def replay(self, records):
+        """Evaluates a replayed stream to its end.
+
+        Args:
+            records (list): The ``(offset, symbol, price)`` records.
+
+        Returns:
+            AlertEvaluator: The evaluator after the stream has ended.
+        """
+        evaluator = AlertEvaluator(ReplayPriceSource(records, speed=0))
+        asyncio.run(evaluator.run())
+        return evaluator
+
+    def test_handle_tick(self, deliver_notification):
+        """Tests that a tick queues a delivery per crossed notification."""
+        evaluator = AlertEvaluator(ReplayPriceSource([]))
+        asyncio.run(evaluator.reload_all())
+
+        self.assertEqual(asyncio.run(evaluator.handle_tick("AAPL", 145)), [])
+        self.assertEqual(
+            asyncio.run(evaluator.handle_tick("AAPL", 151)), [self.above.pk]
+        )
+        self.assertEqual(asyncio.run(evaluator.handle_tick("AAPL", 152)), [])
+        deliver_notification.delay.assert_called_once_with(self.above.pk, 151)
+        self.assertEqual(evaluator.prices, {"AAPL": 152})
+        self.assertEqual((evaluator.ticks, evaluator.fired), (3, 1))
+
+    def test_replayed_stream(self, deliver_notification):
+        """Tests that a replayed stream fires each crossing once."""
+        evaluator = self.replay([
+            (0, "AAPL", 145),
+            (1, "MSFT", 400),
+            (2, "AAPL", 151),
+            (3, "AAPL", 152),
+            (4, "AAPL", 139),
+            (5, "AAPL", 155),
+        ])
+
+        self.assertEqual(
+            deliver_notification.delay.call_args_list,
+            [
+                mock.call(self.above.pk, 151),
+                mock.call(self.below.pk, 139),
+                mock.call(self.above.pk, 155),
+            ],
+        )
+        self.assertEqual(evaluator.source.symbols, {"AAPL"})
+        self.assertEqual((evaluator.ticks, evaluator.fired), (5, 3))
+
+    def test_first_tick_fires_condition_that_holds(self, deliver_notification):
+        """Tests that the first tick fires a condition already met."""
+        self.replay([(0, "AAPL", 135), (1, "AAPL", 138)])
+
+        deliver_notification.delay.assert_called_once_with(self.below.pk, 135)
+
+
+class TriggeredNotificationsTestCase(TestCase):
+    """Tests the notifications triggered by the latest quotes."""
+
+    def setUp(self):
+        """Sets up thresholds around 150 on a quoted and a new ticker."""
+        user = User.objects.create_user(
+            email="quotes@example.com", password="password"
+        )
+        self.quoted = Ticker.objects.create(symbol="AAPL")
+        self.unquoted = Ticker.objects.create(symbol="MSFT")
+        self.notifications = {}
+        for ticker in (self.quoted, self.unquoted):
+            for criteria, value in (
+                ("more_than", 140),
+                ("more_than", 150),
+                ("more_than", 160),
+                ("less_than", 145),
+                ("less_than", 150),
+                ("less_than", 155),
+            ):
+                self.notifications[ticker.symbol, criteria, value] = (
+                    Notification.objects.create(
+                        user=user,
+                        ticker=ticker,
+                        notification_value=Decimal(value),
+                        notification_criteria=criteria,
+                    )
+                )
+        self.ticker_ids = [self.quoted.pk, self.unquoted.pk]
+
+    def quote(self, price):
+        """Records the latest price of the quoted ticker.
+
+        Args:
+            price (float): The price.
+        """
+        LatestQuote.upsert(
+            {self.quoted.pk: price}, datetime(2024, 7, 8, 15, tzinfo=UTC)
+        )
+
+    def triggered(self):
+        """Returns the keys of the triggered notifications.
+
+        Returns:
+            set: ``(symbol, criteria, value)`` of each notification.
+        """
+        return {
+            (n.ticker.symbol, n.notification_criteria, n.notification_value)
+            for n in get_triggered_notifications(self.ticker_ids)
+        }
+
+    def test_triggered_notifications(self):
+        """Tests that the conditions are strict comparisons."""
+        self.quote(150)
+        self.assertEqual(
+            self.triggered(),
+            {("AAPL", "more_than", 140), ("AAPL", "less_than", 155)},
+        )
+
+    def test_triggered_after_quote_update(self):
+        """Tests that the updated quote is the one compared."""
+        self.quote(150)
+        self.quote(150.01)
+        self.assertEqual(
+            self.triggered(),
+            {
+                ("AAPL", "more_than", 140),
+                ("AAPL", "more_than", 150),
+                ("AAPL", "less_than", 155),
+            },
+        )
+        self.quote(144)
+        self.assertEqual(
+            self.triggered(),
+            {
+                ("AAPL", "more_than", 140),
+                ("AAPL", "less_than", 145),
+                ("AAPL", "less_than", 150),
+                ("AAPL", "less_than", 155),
+            },
+        )
+
+    def test_missing_quote_triggers_nothing(self):
+        """Tests that a ticker without a quote triggers nothing."""
+        self.assertEqual(self.triggered(), set())
+
+    def test_nearest_thresholds(self):
+        """Tests that a threshold equal to the quote counts on both sides."""
+        self.quote(150)
+        self.assertEqual(
+            get_nearest_thresholds(self.ticker_ids),
+            {self.quoted.pk: [150, 150], self.unquoted.pk: []},
+        )
+        self.quote(152)
+        self.assertEqual(
+            get_nearest_thresholds([self.quoted.pk]),
+            {self.quoted.pk: [155, 150]},
+        )
+        self.quote(170)
+        self.assertEqual(
+            get_nearest_thresholds([self.quoted.pk]),
+            {self.quoted.pk: [160]},
+        )
@@ -6,7 +6,9 @@ Classes:
 """
 
 import requests
+from custom_utils.conditional import table_condition
 from django.conf import settings
+from django.utils.decorators import method_decorator
 from rest_framework import status, views, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -15,9 +17,16 @@ from tickers.models import Ticker
 from tickers.serializers import TickerSerializer
 
 
+@method_decorator(table_condition(Ticker), name="list")
+@method_decorator(table_condition(Ticker), name="retrieve")
+@method_decorator(table_condition(Ticker), name="get_by_symbol")
+@method_decorator(table_condition(Ticker), name="symbols")
 class TickerViewSet(viewsets.ModelViewSet):
     """A viewset for viewing and editing ticker instances.
 
+    Read actions emit ETag and Last-Modified headers derived from the
+    ticker table version and answer conditional requests with 304.
+
     Attributes:
         queryset (QuerySet): The queryset of Ticker objects.
         serializer_class (Serializer): The serializer class for Ticker objects.
@@ -45,6 +54,24 @@ class TickerViewSet(viewsets.ModelViewSet):
                 return Response(serializer.data)
         return Response({"detail": "Not found."}, status=404)
 
+    @action(detail=False, methods=["get"])
+    def symbols(self, request):
+        """Lists the symbol, name and market cap of every ticker.
+
+        The compact ``[symbol, name, market_cap]`` rows let clients build
+        a local symbol search index without downloading full tickers.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The response containing the ticker rows.
+        """
+        rows = self.queryset.order_by("symbol").values_list(
+            "symbol", "name", "market_cap"
+        )
+        return Response(list(rows))
+
 
 class FetchTickersAPIView(views.APIView):
     """An API view for fetching tickers from an external API.
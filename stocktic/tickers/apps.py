@@ -18,3 +18,11 @@ class TickersConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "tickers"
+
+    def ready(self):
+        """Connects the table version receivers for conditional GET."""
+        from custom_utils.conditional import track_table_version
+
+        from .models import Ticker
+
+        track_table_version(Ticker, deletes=False)
@@ -0,0 +1,212 @@
+"""This module serves parameterized, cached and downsampled price history
+for chart clients.
+
+History is cached in a compact columnar form keyed by its query, with a
+TTL that follows the bar interval: intraday bars go stale within a
+minute, while weekly bars or ranges that ended in the past barely
+change. Long series are reduced to a requested number of points with
+LTTB, which keeps the visual shape of the chart.
+
+Functions:
+    validate_history_params: Validates the history query parameters.
+    get_history_ttl: Returns the cache lifetime for a history query.
+    frame_to_columns: Converts a history DataFrame to columnar arrays.
+    get_history_columns: Fetches history, using the cache when possible.
+    downsample_columns: Downsamples columnar history to N points.
+    format_history_rows: Formats history into plain tuples for templates.
+"""
+
+from datetime import date
+
+import numpy as np
+from custom_utils.utils import lttb_downsample
+from django.conf import settings
+from django.core.cache import cache
+
+from .services import AsyncFinance
+
+HISTORY_CACHE_KEY = "ticker_history:{symbol}:{period}:{interval}:{start}:{end}"
+HISTORY_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+
+VALID_PERIODS = (
+    "1d",
+    "5d",
+    "1mo",
+    "3mo",
+    "6mo",
+    "1y",
+    "2y",
+    "5y",
+    "10y",
+    "ytd",
+    "max",
+)
+HISTORY_TTLS = {
+    "1m": 30,
+    "2m": 60,
+    "5m": 60,
+    "15m": 60 * 5,
+    "30m": 60 * 5,
+    "60m": 60 * 10,
+    "90m": 60 * 10,
+    "1h": 60 * 10,
+    "1d": 60 * 30,
+    "5d": 60 * 60,
+    "1wk": 60 * 60 * 6,
+    "1mo": 60 * 60 * 12,
+    "3mo": 60 * 60 * 12,
+}
+CLOSED_RANGE_TTL = 60 * 60 * 24
+MAX_POINTS = 10_000
+
+
+def validate_history_params(params):
+    """Validates the history query parameters.
+
+    Args:
+        params (QueryDict): The request query parameters.
+
+    Returns:
+        tuple: The cleaned parameters as a dict, and an error message or
+            None if the parameters are valid.
+    """
+    cleaned = {
+        "period": params.get("period", "1mo"),
+        "interval": params.get("interval", "1d"),
+        "start": params.get("start"),
+        "end": params.get("end"),
+        "points": params.get("points"),
+    }
+    if cleaned["period"] not in VALID_PERIODS:
+        return cleaned, f"Invalid period. Use one of {VALID_PERIODS}."
+    if cleaned["interval"] not in HISTORY_TTLS:
+        return cleaned, f"Invalid interval. Use one of {tuple(HISTORY_TTLS)}."
+    for name in ("start", "end"):
+        if cleaned[name]:
+            try:
+                date.fromisoformat(cleaned[name])
+            except ValueError:
+                return cleaned, f"Invalid {name} date. Use YYYY-MM-DD."
+    if cleaned["points"]:
+        try:
+            cleaned["points"] = min(int(cleaned["points"]), MAX_POINTS)
+        except ValueError:
+            return cleaned, "Invalid points. Use a positive integer."
+        if cleaned["points"] < 3:
+            return cleaned, "Invalid points. Use at least 3 points."
+    return cleaned, None
+
+
+def get_history_ttl(interval, end=None):
+    """Returns the cache lifetime for a history query.
+
+    Args:
+        interval (str): The bar interval.
+        end (str, optional): The end date (YYYY-MM-DD) of the range.
+
+    Returns:
+        int: The cache lifetime in seconds.
+    """
+    if end and date.fromisoformat(end) < date.today():
+        return CLOSED_RANGE_TTL
+    return HISTORY_TTLS[interval]
+
+
+def frame_to_columns(frame):
+    """Converts a history DataFrame to columnar arrays.
+
+    Rows without prices are dropped and timestamps become epoch
+    milliseconds, which is what chart libraries consume directly.
+
+    Args:
+        frame (pandas.DataFrame): The history returned by yfinance.
+
+    Returns:
+        dict: The column names mapped to numpy arrays.
+    """
+    frame = frame.dropna(subset=list(HISTORY_COLUMNS[:4])).fillna({
+        "Volume": 0
+    })
+    columns = {
+        "t": frame.index.to_numpy(dtype="datetime64[ms]").astype("int64")
+    }
+    for name in HISTORY_COLUMNS:
+        columns[name.lower()] = frame[name].to_numpy(dtype=float)
+    return columns
+
+
+async def get_history_columns(symbol, period, interval, start, end):
+    """Fetches history, using the cache when possible.
+
+    Args:
+        symbol (str): The ticker symbol.
+        period (str): The period for which to fetch the data.
+        interval (str): The bar interval.
+        start (str): The start date (YYYY-MM-DD) or None.
+        end (str): The end date (YYYY-MM-DD) or None.
+
+    Returns:
+        dict: The columnar history, or None if it is unavailable.
+    """
+    key = HISTORY_CACHE_KEY.format(
+        symbol=symbol, period=period, interval=interval, start=start, end=end
+    )
+    columns = await cache.aget(key)
+    if columns is not None:
+        return columns
+
+    finance = AsyncFinance(symbol, timeout=settings.MARKET_DATA_TIMEOUT)
+    frame = await finance.get_history(
+        period=period, interval=interval, start=start, end=end
+    )
+    if frame is None or frame.empty:
+        return None
+    columns = frame_to_columns(frame)
+    await cache.aset(key, columns, get_history_ttl(interval, end))
+    return columns
+
+
+def downsample_columns(columns, points):
+    """Downsamples columnar history to N points.
+
+    The kept rows are chosen by LTTB on the close price and keep all of
+    their OHLCV values.
+
+    Args:
+        columns (dict): The columnar history.
+        points (int): The number of points to keep, or None.
+
+    Returns:
+        dict: The columnar history as JSON-compatible lists.
+    """
+    if points:
+        indices = lttb_downsample(columns["t"], columns["close"], points)
+        columns = {name: values[indices] for name, values in columns.items()}
+    return {
+        name: np.round(values, 4).tolist() if name != "t" else values.tolist()
+        for name, values in columns.items()
+    }
+
+
+def format_history_rows(frame):
+    """Formats history into plain tuples for templates.
+
+    Every column is formatted in a single vectorized pass, so the
+    template only unpacks ready-made strings instead of building a
+    pandas Series per row and resolving attributes on it.
+
+    Args:
+        frame (pandas.DataFrame): The history returned by yfinance.
+
+    Returns:
+        list: ``(date, open, high, low, close, volume)`` string tuples.
+    """
+    dates = frame.index.strftime("%Y-%m-%d %H:%M").tolist()
+    prices = [
+        np.char.mod("%.2f", frame[name].to_numpy(dtype=float)).tolist()
+        for name in HISTORY_COLUMNS[:4]
+    ]
+    volumes = np.char.mod(
+        "%d", frame["Volume"].fillna(0).to_numpy(dtype="int64")
+    ).tolist()
+    return list(zip(dates, *prices, volumes, strict=True))
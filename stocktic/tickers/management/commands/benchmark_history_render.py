@@ -0,0 +1,118 @@
+"""This module defines a management command that benchmarks rendering of
+the history table.
+
+Classes:
+    Command: Compares the legacy ``iterrows`` table with the vectorized
+        row tuples used by the history page.
+"""
+
+import timeit
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand
+from django.template import engines
+
+from tickers.history import format_history_rows
+
+LEGACY_TABLE = """
+{% for date, row in history.iterrows %}
+<tr><td>{{ date }}</td><td>{{ row.Open }}</td><td>{{ row.High }}</td>
+<td>{{ row.Low }}</td><td>{{ row.Close }}</td><td>{{ row.Volume }}</td></tr>
+{% endfor %}
+"""
+ROWS_TABLE = """
+{% for date, open, high, low, close, volume in rows %}
+<tr><td>{{ date }}</td><td>{{ open }}</td><td>{{ high }}</td>
+<td>{{ low }}</td><td>{{ close }}</td><td>{{ volume }}</td></tr>
+{% endfor %}
+"""
+
+
+class Command(BaseCommand):
+    help = "Benchmark rendering of the ticker history table."
+
+    def add_arguments(self, parser):
+        """Adds the command line arguments.
+
+        Args:
+            parser (ArgumentParser): The argument parser.
+        """
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[1_000, 10_000],
+            help="History sizes (rows) to benchmark.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Number of runs per measurement; the best one is reported.",
+        )
+
+    def handle(self, *args, **options):
+        """Runs the benchmark and prints the timings.
+
+        Args:
+            *args: Variable length argument list.
+            **options: The parsed command line options.
+        """
+        engine = engines["django"]
+        legacy = engine.from_string(LEGACY_TABLE)
+        vectorized = engine.from_string(ROWS_TABLE)
+
+        for size in options["sizes"]:
+            history = self.make_history(size)
+            legacy_time = self.measure(
+                lambda history=history: legacy.render({"history": history}),
+                options["repeat"],
+            )
+            vectorized_time = self.measure(
+                lambda history=history: vectorized.render({
+                    "rows": format_history_rows(history)
+                }),
+                options["repeat"],
+            )
+            self.stdout.write(
+                f"{size:>7} rows: iterrows {legacy_time * 1000:9.1f} ms | "
+                f"vectorized {vectorized_time * 1000:9.1f} ms | "
+                f"speedup x{legacy_time / vectorized_time:.1f}"
+            )
+
+    @staticmethod
+    def make_history(size):
+        """Builds a synthetic daily history DataFrame.
+
+        Args:
+            size (int): The number of rows.
+
+        Returns:
+            pandas.DataFrame: The synthetic history.
+        """
+        rng = np.random.default_rng(0)
+        close = 100 + rng.standard_normal(size).cumsum()
+        return pd.DataFrame(
+            {
+                "Open": close + rng.random(size),
+                "High": close + 1,
+                "Low": close - 1,
+                "Close": close,
+                "Volume": rng.integers(1_000, 1_000_000, size),
+            },
+            index=pd.date_range("2000-01-03", periods=size, freq="D"),
+        )
+
+    @staticmethod
+    def measure(func, repeat):
+        """Returns the best wall time of several runs.
+
+        Args:
+            func (Callable): The function to measure.
+            repeat (int): The number of runs.
+
+        Returns:
+            float: The best run time in seconds.
+        """
+        return min(timeit.repeat(func, number=1, repeat=repeat))
@@ -0,0 +1,349 @@
+"""This module provides the trading calendars of the stock exchanges.
+
+A calendar knows an exchange's time zone, its regular session, the
+pre-market and post-market hours of its extended session, and which days
+are holidays or close early. Holidays and early closes are derived from
+the exchange's rules and computed once per year. A calendar can also be
+built from explicit dates, which fixes it regardless of the rules, for
+example to check a schedule offline.
+
+The price tasks ask ``is_market_open`` whether a ticker's exchange is
+trading and ``next_market_open`` when it will. ``MARKET_HOURS_MODE``
+selects the ``regular`` session, the ``extended`` session or ``always``,
+which treats every exchange as open. Tickers whose exchange is unknown
+follow ``MARKET_HOURS_DEFAULT_EXCHANGE``.
+
+Classes:
+    ExchangeCalendar: The trading calendar of an exchange.
+
+Functions:
+    nth_weekday: Returns the n-th given weekday of a month.
+    easter: Returns the date of Easter Sunday.
+    us_holidays: Returns the holidays and early closes of the US stock
+        exchanges in a year.
+    get_calendar: Returns the calendar of an exchange.
+    is_market_open: Checks whether an exchange is trading.
+    next_market_open: Returns when an exchange next starts trading.
+"""
+
+import calendar
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+
+SESSION_MODES = ("regular", "extended")
+MAX_CLOSED_DAYS = 14
+US_SPECIAL_CLOSURES = frozenset({
+    date(2012, 10, 29),
+    date(2012, 10, 30),
+    date(2018, 12, 5),
+    date(2025, 1, 9),
+})
+
+
+def nth_weekday(year, month, weekday, n):
+    """Returns the n-th given weekday of a month.
+
+    Args:
+        year (int): The year.
+        month (int): The month.
+        weekday (int): The weekday, 0 for Monday.
+        n (int): The occurrence, starting at 1, or -1 for the last one.
+
+    Returns:
+        date: The date.
+    """
+    if n < 0:
+        last = date(year, month, calendar.monthrange(year, month)[1])
+        return last - timedelta(days=(last.weekday() - weekday) % 7)
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def easter(year):
+    """Returns the date of Easter Sunday in the Gregorian calendar.
+
+    Args:
+        year (int): The year.
+
+    Returns:
+        date: The date.
+    """
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    m = (32 + 2 * e + 2 * i - h - k) % 7
+    n = (a + 11 * h + 22 * m) // 451
+    month, day = divmod(h + m - 7 * n + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day):
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def us_holidays(year):
+    """Returns the holidays and early closes of the US stock exchanges.
+
+    These follow the NYSE rules, which NASDAQ shares: a holiday on a
+    Saturday is observed on the Friday before, except New Year's Day,
+    and one on a Sunday on the Monday after. The exchanges close at 1
+    p.m. on the day after Thanksgiving and on July 3 and December 24
+    when they fall on Monday to Thursday.
+
+    Args:
+        year (int): The year.
+
+    Returns:
+        tuple: The holidays and the early close days, as frozensets of
+            dates.
+    """
+    new_year = date(year, 1, 1)
+    holidays = {
+        new_year + timedelta(days=1) if new_year.weekday() == 6 else new_year,
+        nth_weekday(year, 1, 0, 3),
+        nth_weekday(year, 2, 0, 3),
+        easter(year) - timedelta(days=2),
+        nth_weekday(year, 5, 0, -1),
+        _observed(date(year, 7, 4)),
+        nth_weekday(year, 9, 0, 1),
+        nth_weekday(year, 11, 3, 4),
+        _observed(date(year, 12, 25)),
+    }
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))
+    holidays.update(day for day in US_SPECIAL_CLOSURES if day.year == year)
+    holidays = {day for day in holidays if day.year == year}
+
+    early_closes = {nth_weekday(year, 11, 3, 4) + timedelta(days=1)}
+    for day in (date(year, 7, 3), date(year, 12, 24)):
+        if day.weekday() < 4:
+            early_closes.add(day)
+    return frozenset(holidays), frozenset(early_closes - holidays)
+
+
+class ExchangeCalendar:
+    """The trading calendar of an exchange.
+
+    Attributes:
+        name (str): The exchange name.
+        timezone (ZoneInfo): The time zone of the sessions.
+        sessions (dict): The ``(open, close)`` local times by session
+            mode.
+        early_closes (dict): The local closing time on early close days
+            by session mode.
+    """
+
+    def __init__(
+        self,
+        name,
+        timezone,
+        regular=(time(9, 30), time(16)),
+        extended=(time(4), time(20)),
+        early_close=time(13),
+        early_extended_close=time(17),
+        rules=us_holidays,
+        holidays=None,
+        early_close_days=None,
+    ) -> None:
+        """Initializes the calendar.
+
+        Args:
+            name (str): The exchange name.
+            timezone (str): The IANA time zone of the sessions.
+            regular (tuple): The local opening and closing times of the
+                regular session.
+            extended (tuple): The local opening and closing times of the
+                extended session, from pre-market to post-market.
+            early_close (time): The regular closing time on early close
+                days.
+            early_extended_close (time): The extended closing time on
+                early close days.
+            rules (Callable): Returns the holidays and early close days
+                of a year.
+            holidays (Iterable, optional): Fixed holidays, replacing the
+                rules.
+            early_close_days (Iterable, optional): Fixed early close
+                days, replacing the rules.
+        """
+        self.name = name
+        self.timezone = ZoneInfo(timezone)
+        self.sessions = {"regular": regular, "extended": extended}
+        self.early_closes = {
+            "regular": early_close,
+            "extended": early_extended_close,
+        }
+        if holidays is not None or early_close_days is not None:
+            fixed = (
+                frozenset(holidays or ()),
+                frozenset(early_close_days or ()),
+            )
+
+            def rules(year):
+                return fixed
+
+        self._rules = rules
+        self._years = {}
+
+    def holidays(self, year) -> tuple:
+        """Returns the holidays and early close days of a year.
+
+        Args:
+            year (int): The year.
+
+        Returns:
+            tuple: The holidays and the early close days, as frozensets
+                of dates.
+        """
+        if year not in self._years:
+            self._years[year] = self._rules(year)
+        return self._years[year]
+
+    def today(self) -> date:
+        """Returns the current date at the exchange."""
+        return datetime.now(self.timezone).date()
+
+    def is_trading_day(self, day=None) -> bool:
+        """Checks whether the exchange trades on a day.
+
+        Args:
+            day (date, optional): The local date, by default today.
+
+        Returns:
+            bool: True on weekdays that are not holidays.
+        """
+        day = day or self.today()
+        return day.weekday() < 5 and day not in self.holidays(day.year)[0]
+
+    def session(self, day, mode="regular"):
+        """Returns the session of a day.
+
+        Args:
+            day (date): The local date.
+            mode (str): ``regular`` or ``extended``.
+
+        Returns:
+            tuple | None: The aware opening and closing datetimes, or None
+                if the exchange does not trade that day.
+        """
+        if not self.is_trading_day(day):
+            return None
+        opens, closes = self.sessions[mode]
+        if day in self.holidays(day.year)[1]:
+            closes = self.early_closes[mode]
+        return (
+            datetime.combine(day, opens, self.timezone),
+            datetime.combine(day, closes, self.timezone),
+        )
+
+    def is_open(self, at=None, mode="regular") -> bool:
+        """Checks whether the exchange is trading at a time.
+
+        Args:
+            at (datetime, optional): An aware datetime, by default now.
+            mode (str): ``regular`` or ``extended``.
+
+        Returns:
+            bool: True during a session.
+        """
+        local = (at or datetime.now(self.timezone)).astimezone(self.timezone)
+        session = self.session(local.date(), mode)
+        return session is not None and session[0] <= local < session[1]
+
+    def next_open(self, at=None, mode="regular"):
+        """Returns when the exchange next starts trading.
+
+        Args:
+            at (datetime, optional): An aware datetime, by default now.
+            mode (str): ``regular`` or ``extended``.
+
+        Returns:
+            datetime: ``at`` itself during a session, otherwise the start
+                of the next session.
+        """
+        local = (at or datetime.now(self.timezone)).astimezone(self.timezone)
+        for offset in range(MAX_CLOSED_DAYS):
+            session = self.session(local.date() + timedelta(days=offset), mode)
+            if session is None or local >= session[1]:
+                continue
+            return max(local, session[0])
+        raise ValueError(
+            f"{self.name} has no session within {MAX_CLOSED_DAYS} days"
+        )
+
+
+NYSE = ExchangeCalendar("NYSE", "America/New_York")
+CALENDARS = {
+    "NYSE": NYSE,
+    "NASDAQ": NYSE,
+    "AMEX": NYSE,
+    "NYSE AMERICAN": NYSE,
+    "NYSE ARCA": NYSE,
+    "NYSEARCA": NYSE,
+    "NYSE MKT": NYSE,
+    "NASDAQGS": NYSE,
+    "NASDAQGM": NYSE,
+    "NASDAQCM": NYSE,
+    "NMS": NYSE,
+    "NYQ": NYSE,
+    "BATS": NYSE,
+    "CBOE": NYSE,
+}
+
+
+def get_calendar(exchange=None):
+    """Returns the calendar of an exchange.
+
+    Args:
+        exchange (str, optional): The exchange name, as stored in
+            ``Ticker.stock_exchange``.
+
+    Returns:
+        ExchangeCalendar: The calendar, or the one of
+            ``MARKET_HOURS_DEFAULT_EXCHANGE`` for an unknown exchange.
+    """
+    return CALENDARS.get(
+        (exchange or "").strip().upper(),
+        CALENDARS[settings.MARKET_HOURS_DEFAULT_EXCHANGE],
+    )
+
+
+def is_market_open(exchange=None, at=None) -> bool:
+    """Checks whether an exchange is trading in ``MARKET_HOURS_MODE``.
+
+    Args:
+        exchange (str, optional): The exchange name.
+        at (datetime, optional): An aware datetime, by default now.
+
+    Returns:
+        bool: True during a session, or always in the ``always`` mode.
+    """
+    if settings.MARKET_HOURS_MODE not in SESSION_MODES:
+        return True
+    return get_calendar(exchange).is_open(at, settings.MARKET_HOURS_MODE)
+
+
+def next_market_open(exchange=None, at=None):
+    """Returns when an exchange next trades in ``MARKET_HOURS_MODE``.
+
+    Args:
+        exchange (str, optional): The exchange name.
+        at (datetime, optional): An aware datetime, by default now.
+
+    Returns:
+        datetime: ``at`` itself while the exchange is trading, otherwise
+            the start of its next session.
+    """
+    at = at or datetime.now(get_calendar(exchange).timezone)
+    if settings.MARKET_HOURS_MODE not in SESSION_MODES:
+        return at
+    return get_calendar(exchange).next_open(at, settings.MARKET_HOURS_MODE)
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-19 12:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickers', '0004_alter_ticker_sector_alter_ticker_stock_exchange_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LatestQuote',
+            fields=[
+                ('ticker', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='latest_quote', serialize=False, to='tickers.ticker', verbose_name='Ticker')),
+                ('price', models.DecimalField(decimal_places=4, max_digits=14, verbose_name='Price')),
+                ('updated_at', models.DateTimeField(verbose_name='Updated at')),
+            ],
+        ),
+    ]
@@ -2,19 +2,26 @@
 
 Classes:
     Ticker: A Django model representing a stock ticker.
+    LatestQuote: A Django model holding the latest fetched price of a
+        ticker.
 """
 
 import csv
+from decimal import Decimal
 from io import TextIOWrapper
 
 from custom_utils.common.constants import NULLABLE
 from custom_utils.common.mixins import DateFieldsMixin
+from custom_utils.conditional import TableVersionQuerySet, bump_table_version
 from django.db import models
 
 
 class Ticker(DateFieldsMixin, models.Model):
     """A Django model representing a stock ticker.
 
+    Tickers are replaced in bulk on import, so their deletes bump the
+    table version once rather than through a signal per row.
+
     Attributes:
         symbol (CharField): The stock symbol.
         name (CharField): The stock name.
@@ -28,8 +35,12 @@ class Ticker(DateFieldsMixin, models.Model):
         percent_change (CharField): The percent change in price.
         market_cap (CharField): The market capitalization.
         volume (CharField): The trading volume.
+        objects (Manager): The manager bumping the table version on
+            deletes.
     """
 
+    objects = TableVersionQuerySet.as_manager()
+
     symbol = models.CharField(
         max_length=255,
         unique=True,
@@ -94,6 +105,20 @@ class Ticker(DateFieldsMixin, models.Model):
         max_length=50, **NULLABLE, verbose_name="Volume", help_text="Volume"
     )
 
+    def delete(self, *args, **kwargs):
+        """Deletes the ticker and bumps the version of the table.
+
+        Args:
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            tuple: The number of deleted objects and the number per model.
+        """
+        deleted = super().delete(*args, **kwargs)
+        bump_table_version(type(self))
+        return deleted
+
     @classmethod
     def create_from_csv(cls, csv_file):
         """Create Ticker instances from a CSV file.
@@ -172,3 +197,58 @@ class Ticker(DateFieldsMixin, models.Model):
             str: The stock symbol.
         """
         return self.symbol
+
+
+class LatestQuote(models.Model):
+    """A Django model holding the latest fetched price of a ticker.
+
+    The periodic price check upserts the prices it fetches here, so the
+    notifications they trigger can be found with a join in the database.
+
+    Attributes:
+        ticker (OneToOneField): The ticker, also the primary key.
+        price (DecimalField): The latest price.
+        updated_at (DateTimeField): When the price was fetched.
+    """
+
+    ticker = models.OneToOneField(
+        Ticker,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="latest_quote",
+        verbose_name="Ticker",
+    )
+    price = models.DecimalField(
+        max_digits=14, decimal_places=4, verbose_name="Price"
+    )
+    updated_at = models.DateTimeField(verbose_name="Updated at")
+
+    @classmethod
+    def upsert(cls, prices, updated_at):
+        """Creates or updates the quotes of several tickers in one query.
+
+        Args:
+            prices (dict): The latest price by ticker ID.
+            updated_at (datetime): When the prices were fetched.
+        """
+        cls.objects.bulk_create(
+            [
+                cls(
+                    ticker_id=ticker_id,
+                    price=Decimal(f"{price:.4f}"),
+                    updated_at=updated_at,
+                )
+                for ticker_id, price in prices.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["ticker"],
+            update_fields=["price", "updated_at"],
+        )
+
+    def __str__(self):
+        """Return the string representation of the LatestQuote instance.
+
+        Returns:
+            str: The ticker and its price.
+        """
+        return f"{self.ticker}: {self.price}"
@@ -0,0 +1,139 @@
+"""This module builds the aggregated ticker overview from several market
+data sections fetched concurrently.
+
+Each section is cached on its own with a TTL that matches how fast the
+underlying data changes, and is fetched with its own timeout. A slow or
+failing section is reported as missing instead of holding back the rest
+of the overview.
+
+Classes:
+    OverviewSection: The definition of a single overview section.
+
+Functions:
+    to_serializable: Converts a market data value to plain Python data.
+    get_section: Fetches a single section, using the cache when possible.
+    get_overview: Fetches all requested sections concurrently.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass
+
+import pandas as pd
+from django.conf import settings
+from django.core.cache import cache
+
+from .services import AsyncFinance
+
+OVERVIEW_CACHE_KEY = "ticker_overview:{symbol}:{section}"
+
+
+@dataclass(frozen=True)
+class OverviewSection:
+    """The definition of a single overview section.
+
+    Attributes:
+        method (str): The Finance method that loads the section.
+        ttl (int): The cache lifetime of the section in seconds.
+        timeout (float): The upstream timeout of the section in seconds.
+    """
+
+    method: str
+    ttl: int
+    timeout: float = 5
+
+
+OVERVIEW_SECTIONS = {
+    "info": OverviewSection("get_info", ttl=60 * 15),
+    "history": OverviewSection("get_history", ttl=60 * 60),
+    "news": OverviewSection("get_news", ttl=60 * 5),
+    "recommendations": OverviewSection(
+        "get_recommendations", ttl=60 * 60 * 24
+    ),
+    "major_holders": OverviewSection("get_major_holders", ttl=60 * 60 * 24),
+    "institutional_holders": OverviewSection(
+        "get_institutional_holders", ttl=60 * 60 * 24
+    ),
+}
+
+
+def to_serializable(value):
+    """Converts a market data value to plain Python data.
+
+    DataFrames become ``{"columns": [...], "data": [[...], ...]}`` with
+    a meaningful index moved into the first column, so the result can be
+    cached, dumped to JSON and rendered as a generic table. An empty
+    DataFrame, which yfinance returns when it has no data, becomes None
+    so the section is reported as missing instead of being cached.
+
+    Args:
+        value (Any): The value returned by a Finance method.
+
+    Returns:
+        Any: The JSON-compatible representation of the value.
+    """
+    if isinstance(value, pd.Series):
+        value = value.to_frame()
+    if isinstance(value, pd.DataFrame):
+        if value.empty:
+            return None
+        if not isinstance(value.index, pd.RangeIndex):
+            value = value.reset_index()
+        return json.loads(
+            value.to_json(orient="split", index=False, date_format="iso")
+        )
+    return value
+
+
+async def get_section(symbol, name):
+    """Fetches a single section, using the cache when possible.
+
+    Args:
+        symbol (str): The ticker symbol.
+        name (str): The name of the section in OVERVIEW_SECTIONS.
+
+    Returns:
+        Any: The serializable section data, or None if it is unavailable.
+    """
+    section = OVERVIEW_SECTIONS[name]
+    key = OVERVIEW_CACHE_KEY.format(symbol=symbol, section=name)
+    data = await cache.aget(key)
+    if data is not None:
+        return data
+
+    finance = AsyncFinance(
+        symbol, timeout=min(section.timeout, settings.MARKET_DATA_TIMEOUT)
+    )
+    value = await finance.run(section.method)
+    data = to_serializable(value)
+    if data:
+        await cache.aset(key, data, section.ttl)
+    return data
+
+
+async def get_overview(symbol, sections=None):
+    """Fetches all requested sections concurrently.
+
+    Args:
+        symbol (str): The ticker symbol.
+        sections (list, optional): The section names to fetch. Defaults
+            to all sections.
+
+    Returns:
+        dict: The symbol, the available sections and the names of the
+            sections that could not be loaded.
+    """
+    names = [
+        name
+        for name in sections or OVERVIEW_SECTIONS
+        if name in OVERVIEW_SECTIONS
+    ]
+    results = await asyncio.gather(
+        *(get_section(symbol, name) for name in names)
+    )
+    loaded = dict(zip(names, results, strict=True))
+    return {
+        "symbol": symbol,
+        "sections": {name: data for name, data in loaded.items() if data},
+        "missing": [name for name, data in loaded.items() if not data],
+    }
@@ -0,0 +1,200 @@
+"""This module provides streams of live ticker prices.
+
+A price source pushes ``(symbol, price)`` ticks for the symbols it is
+subscribed to, instead of being polled. The Yahoo Finance source streams
+real trades over a websocket; the replay source plays back recorded
+ticks from a CSV file or a list, for development and tests.
+
+Classes:
+    PriceSource: The interface of a live price source.
+    YahooPriceSource: Streams prices from the Yahoo Finance websocket.
+    ReplayPriceSource: Replays recorded ticks.
+"""
+
+import asyncio
+import csv
+import logging
+from pathlib import Path
+
+import yfinance as yf
+
+logger = logging.getLogger(__name__)
+
+
+class PriceSource:
+    """The interface of a live price source.
+
+    Sources are async iterables of ``(symbol, price)`` ticks, limited to
+    the subscribed symbols.
+
+    Attributes:
+        symbols (set): The subscribed ticker symbols.
+    """
+
+    def __init__(self) -> None:
+        """Initializes a source without subscriptions."""
+        self.symbols = set()
+
+    async def subscribe(self, symbols) -> None:
+        """Adds symbols to the stream.
+
+        Args:
+            symbols (Iterable): The ticker symbols.
+        """
+        self.symbols.update(symbols)
+
+    async def unsubscribe(self, symbols) -> None:
+        """Removes symbols from the stream.
+
+        Args:
+            symbols (Iterable): The ticker symbols.
+        """
+        self.symbols.difference_update(symbols)
+
+    def __aiter__(self):
+        """Returns the iterator of the ticks."""
+        return self.ticks()
+
+    async def ticks(self):
+        """Yields the ticks of the subscribed symbols.
+
+        Yields:
+            tuple: The ticker symbol and its price.
+        """
+        raise NotImplementedError
+        yield
+
+    async def close(self) -> None:
+        """Releases the resources of the source."""
+
+
+class YahooPriceSource(PriceSource):
+    """Streams prices from the Yahoo Finance websocket.
+
+    The websocket client delivers messages to a callback, which puts
+    them on a queue read by ``ticks``.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the websocket client."""
+        super().__init__()
+        self._socket = yf.AsyncWebSocket(verbose=False)
+        self._queue = asyncio.Queue()
+        self._listener = None
+
+    async def subscribe(self, symbols) -> None:
+        """Adds symbols to the stream.
+
+        Args:
+            symbols (Iterable): The ticker symbols.
+        """
+        symbols = set(symbols) - self.symbols
+        if symbols:
+            await super().subscribe(symbols)
+            await self._socket.subscribe(sorted(symbols))
+
+    async def unsubscribe(self, symbols) -> None:
+        """Removes symbols from the stream.
+
+        Args:
+            symbols (Iterable): The ticker symbols.
+        """
+        symbols = set(symbols) & self.symbols
+        if symbols:
+            await super().unsubscribe(symbols)
+            await self._socket.unsubscribe(sorted(symbols))
+
+    async def ticks(self):
+        """Yields the ticks of the subscribed symbols.
+
+        Yields:
+            tuple: The ticker symbol and its price.
+        """
+        if self._listener is None:
+            self._listener = asyncio.create_task(
+                self._socket.listen(self._queue.put_nowait)
+            )
+        while True:
+            message = await self._queue.get()
+            if message.get("id") in self.symbols and message.get("price"):
+                yield message["id"], float(message["price"])
+
+    async def close(self) -> None:
+        """Stops listening and closes the websocket."""
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        await self._socket.close()
+
+
+class ReplayPriceSource(PriceSource):
+    """Replays recorded ticks.
+
+    Attributes:
+        records (list): The ``(offset, symbol, price)`` records, the
+            offset being the seconds since the start of the recording.
+        speed (float): The replay speed relative to the recording, 0 to
+            replay without waiting.
+        loop (bool): Whether the recording restarts once it has ended.
+    """
+
+    def __init__(self, records, speed=1.0, loop=False) -> None:
+        """Initializes the source.
+
+        Args:
+            records (Iterable): The ``(offset, symbol, price)`` records.
+            speed (float): The replay speed relative to the recording, 0
+                to replay without waiting.
+            loop (bool): Whether the recording restarts once it has
+                ended.
+        """
+        super().__init__()
+        self.records = sorted(
+            (float(offset), symbol.upper(), float(price))
+            for offset, symbol, price in records
+        )
+        self.speed = speed
+        self.loop = loop
+
+    @classmethod
+    def from_csv(cls, path, speed=1.0, loop=False):
+        """Loads a recording from a CSV file.
+
+        The file has ``offset``, ``symbol`` and ``price`` columns, the
+        offset being the seconds since the start of the recording.
+
+        Args:
+            path (str | Path): The CSV file.
+            speed (float): The replay speed relative to the recording, 0
+                to replay without waiting.
+            loop (bool): Whether the recording restarts once it has
+                ended.
+
+        Returns:
+            ReplayPriceSource: The source.
+        """
+        with Path(path).open(newline="") as file:
+            records = [
+                (row["offset"], row["symbol"], row["price"])
+                for row in csv.DictReader(file)
+            ]
+        return cls(records, speed=speed, loop=loop)
+
+    async def ticks(self):
+        """Yields the ticks of the subscribed symbols.
+
+        Yields:
+            tuple: The ticker symbol and its price.
+        """
+        while True:
+            started = asyncio.get_running_loop().time()
+            for offset, symbol, price in self.records:
+                if self.speed:
+                    due = started + offset / self.speed
+                    delay = due - asyncio.get_running_loop().time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                if symbol in self.symbols:
+                    yield symbol, price
+            if not self.loop or not self.records:
+                return
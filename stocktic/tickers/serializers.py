@@ -2,8 +2,11 @@
 
 Classes:
     TickerSerializer: A serializer for the Ticker model.
+    TickerSummarySerializer: A serializer for the main Ticker fields.
 """
 
+from typing import ClassVar
+
 from rest_framework import serializers
 
 from .models import Ticker
@@ -20,3 +23,22 @@ class TickerSerializer(serializers.ModelSerializer):
     class Meta:
         model = Ticker
         fields = "__all__"
+
+
+class TickerSummarySerializer(serializers.ModelSerializer):
+    """A serializer for the main Ticker fields.
+
+    Meta:
+        model (Ticker): The model to be serialized.
+        fields (list): The fields to be included in the serialization.
+    """
+
+    class Meta:
+        model = Ticker
+        fields: ClassVar = [
+            "id",
+            "symbol",
+            "name",
+            "stock_exchange",
+            "last_sale",
+        ]
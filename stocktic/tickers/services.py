@@ -3,9 +3,15 @@ yfinance library.
 
 Classes:
     Finance: A class to interact with financial data for a given ticker symbol.
+    AsyncFinance: An asyncio facade over Finance that runs the blocking
+        yfinance calls in a bounded thread pool with per-call timeouts.
 """
 
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import yfinance as yf
 
@@ -13,6 +19,9 @@ import yfinance as yf
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+MARKET_DATA_MAX_WORKERS = 32
+MARKET_DATA_TIMEOUT = 10
+
 
 class Finance:
     """A class to interact with financial data for a given ticker symbol.
@@ -43,13 +52,15 @@ class Finance:
             logger.error(f"Error fetching info for {self.symbol}: {e}")
             return None
 
-    def get_history(self, period="1mo", interval="1d"):
+    def get_history(self, period="1mo", interval="1d", start=None, end=None):
         """Fetches the historical market data for the specified period.
 
         Args:
             period (str): The period for which to fetch the data
-                (e.g., "1mo", "1y").
+                (e.g., "1mo", "1y"). Ignored when start is given.
             interval (str): The interval for the data (e.g., "1d", "1wk").
+            start (str, optional): The start date (YYYY-MM-DD).
+            end (str, optional): The end date (YYYY-MM-DD).
 
         Returns:
             pandas.DataFrame: A DataFrame containing the historical
@@ -57,10 +68,10 @@ class Finance:
         """
         try:
             return self.ticker.history(
-                period=period,
+                period=None if start else period,
                 interval=interval,
-                start=None,
-                end=None,
+                start=start,
+                end=end,
                 prepost=False,
                 actions=True,
                 auto_adjust=True,
@@ -443,7 +454,7 @@ class Finance:
         """Fetches the latest news for the company.
 
         Returns:
-            list: A list of dictionaries containing the news data.
+            list: The news items, each with its article under ``content``.
         """
         try:
             return self.ticker.news
@@ -477,6 +488,81 @@ class Finance:
             logger.error(f"Error fetching latest price for {self.symbol}: {e}")
             return None
 
+    @staticmethod
+    def get_daily_closes(symbols, period="5d"):
+        """Fetches the daily closing prices of several stocks in one
+        request.
+
+        Args:
+            symbols (list): The ticker symbols.
+            period (str): The period to fetch (e.g., "5d").
+
+        Returns:
+            dict: The closing prices by symbol as pandas Series, oldest
+                first. Symbols without prices are left out.
+        """
+        try:
+            data = yf.download(
+                list(symbols),
+                period=period,
+                interval="1d",
+                auto_adjust=True,
+                progress=False,
+                threads=True,
+            )
+            closes = data["Close"]
+        except Exception as e:
+            logger.error(f"Error fetching closing prices for {symbols}: {e}")
+            return {}
+        if closes.empty:
+            logger.warning(f"No closing prices returned for {symbols}")
+            return {}
+        if closes.ndim == 1:
+            closes = closes.to_frame(symbols[0])
+        series = {}
+        for symbol in symbols:
+            if symbol not in closes:
+                continue
+            history = closes[symbol].dropna()
+            if not history.empty:
+                series[symbol] = history
+        return series
+
+    @staticmethod
+    def get_latest_prices(symbols):
+        """Fetches the latest prices of several stocks in one request.
+
+        Args:
+            symbols (list): The ticker symbols.
+
+        Returns:
+            dict: The latest price by symbol. Symbols without a price are
+                left out.
+        """
+        return {
+            symbol: float(history.iloc[-1])
+            for symbol, history in Finance.get_daily_closes(symbols).items()
+        }
+
+    @staticmethod
+    def key_metrics(info):
+        """Extracts the key valuation metrics from company information.
+
+        Args:
+            info (dict): The company information returned by get_info.
+
+        Returns:
+            dict: The P/E ratio, EPS, dividend yield in percent, market
+                capitalization and beta.
+        """
+        return {
+            "pe_ratio": info.get("forwardPE") or info.get("trailingPE"),
+            "eps": info.get("trailingEps"),
+            "dividend_yield": info.get("dividendYield"),
+            "market_cap": info.get("marketCap"),
+            "beta": info.get("beta"),
+        }
+
     def get_pe_ratio(self):
         """Fetches the Price-to-Earnings (P/E) ratio of the company.
 
@@ -499,7 +585,7 @@ class Finance:
         """Fetches the dividend yield of the company.
 
         Returns:
-            float: The dividend yield.
+            float: The dividend yield in percent.
         """
         info = self.get_info()
         return info.get("dividendYield")
@@ -521,3 +607,201 @@ class Finance:
         """
         info = self.get_info()
         return info.get("beta")
+
+
+class AsyncFinance:
+    """An asyncio facade over Finance for use in async views and handlers.
+
+    yfinance is a blocking library, so every call is dispatched to a
+    shared, bounded thread pool and awaited with a timeout. A slow
+    upstream response then only occupies a pool thread instead of the
+    event loop or a whole WSGI worker.
+
+    A timed out call cannot be interrupted and keeps its thread until
+    yfinance returns, so the calls are counted until they finish. Once
+    every thread is taken, new calls are shed at once and fail like a
+    timeout, which the views answer with 503, instead of queueing behind
+    stuck ones.
+
+    Attributes:
+        executor (ThreadPoolExecutor): The thread pool shared by all
+            instances.
+        max_workers (int): The number of threads of the pool.
+        in_flight (int): The number of calls submitted and not finished.
+        symbol (str): The ticker symbol of the company.
+        timeout (float): The per-call timeout in seconds.
+        finance (Finance): The wrapped synchronous Finance instance.
+    """
+
+    executor = ThreadPoolExecutor(
+        max_workers=MARKET_DATA_MAX_WORKERS, thread_name_prefix="market-data"
+    )
+    max_workers = MARKET_DATA_MAX_WORKERS
+    in_flight = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def set_max_workers(cls, max_workers):
+        """Replaces the shared thread pool with one of a different size.
+
+        Args:
+            max_workers (int): The maximum number of concurrent upstream
+                calls.
+        """
+        previous = cls.executor
+        cls.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="market-data"
+        )
+        cls.max_workers = max_workers
+        previous.shutdown(wait=False)
+
+    @classmethod
+    def submit(cls, func):
+        """Runs a function in the thread pool unless every thread is taken.
+
+        Args:
+            func (Callable): The blocking function to run.
+
+        Returns:
+            asyncio.Future: The future of the result, or None if the call
+                has been shed.
+        """
+        with cls._lock:
+            if cls.in_flight >= cls.max_workers:
+                return None
+            cls.in_flight += 1
+        future = cls.executor.submit(func)
+        future.add_done_callback(cls._release)
+        return asyncio.wrap_future(future)
+
+    @classmethod
+    def _release(cls, future):
+        with cls._lock:
+            cls.in_flight -= 1
+
+    def __init__(self, symbol, timeout=MARKET_DATA_TIMEOUT):
+        """Initializes the AsyncFinance class with a ticker symbol.
+
+        Args:
+            symbol (str): The ticker symbol of the company.
+            timeout (float): The per-call timeout in seconds.
+        """
+        self.symbol = symbol
+        self.timeout = timeout
+        self.finance = Finance(symbol)
+
+    async def run(self, method, *args, timeout=None, **kwargs):
+        """Runs a Finance method in the thread pool.
+
+        Args:
+            method (str): The name of the Finance method to call.
+            *args: Positional arguments for the method.
+            timeout (float, optional): Overrides the instance timeout.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            Any: The method result, or None on timeout, error or a
+                saturated pool.
+        """
+        func = partial(getattr(self.finance, method), *args, **kwargs)
+        future = self.submit(func)
+        if future is None:
+            logger.warning(f"Market data pool saturated, shed {method}")
+            return None
+        try:
+            return await asyncio.wait_for(
+                future, timeout=timeout or self.timeout
+            )
+        except TimeoutError:
+            logger.error(f"Timed out calling {method} for {self.symbol}")
+        except Exception as e:
+            logger.error(f"Error calling {method} for {self.symbol}: {e}")
+        return None
+
+    async def gather(self, **calls):
+        """Runs several Finance methods concurrently.
+
+        Args:
+            **calls: Result names mapped to a method name or to a
+                ``(method, kwargs)`` tuple.
+
+        Returns:
+            dict: The result names mapped to the method results.
+        """
+        names = list(calls)
+        coroutines = []
+        for call in calls.values():
+            method, kwargs = (call, {}) if isinstance(call, str) else call
+            coroutines.append(self.run(method, **kwargs))
+        return dict(zip(names, await asyncio.gather(*coroutines), strict=True))
+
+    async def get_info(self):
+        """Fetches the basic information of the company.
+
+        Returns:
+            dict: A dictionary containing the company's information.
+        """
+        return await self.run("get_info")
+
+    async def get_history(
+        self, period="1mo", interval="1d", start=None, end=None
+    ):
+        """Fetches the historical market data for the specified period.
+
+        Args:
+            period (str): The period for which to fetch the data.
+            interval (str): The interval for the data.
+            start (str, optional): The start date (YYYY-MM-DD).
+            end (str, optional): The end date (YYYY-MM-DD).
+
+        Returns:
+            pandas.DataFrame: A DataFrame containing the historical
+                market data.
+        """
+        return await self.run(
+            "get_history",
+            period=period,
+            interval=interval,
+            start=start,
+            end=end,
+        )
+
+    async def get_latest_price(self):
+        """Fetches the latest price of the company's stock.
+
+        Returns:
+            float: The latest stock price.
+        """
+        return await self.run("get_latest_price")
+
+    @classmethod
+    async def get_latest_prices(cls, symbols, timeout=MARKET_DATA_TIMEOUT):
+        """Fetches the latest prices of several stocks in one request.
+
+        Args:
+            symbols (list): The ticker symbols.
+            timeout (float): The timeout in seconds.
+
+        Returns:
+            dict: The latest price by symbol, empty on timeout, error or
+                a saturated pool.
+        """
+        future = cls.submit(partial(Finance.get_latest_prices, symbols))
+        if future is None:
+            logger.warning("Market data pool saturated, shed latest prices")
+            return {}
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except TimeoutError:
+            logger.error(f"Timed out fetching latest prices for {symbols}")
+        except Exception as e:
+            logger.error(f"Error fetching latest prices for {symbols}: {e}")
+        return {}
+
+    async def get_news(self):
+        """Fetches the latest news for the company.
+
+        Returns:
+            list: The news items, each with its article under ``content``.
+        """
+        return await self.run("get_news")
@@ -9,6 +9,7 @@ import logging
 
 import requests
 from celery import shared_task
+from custom_utils.locks import overlap_lock
 from django.conf import settings
 
 from .models import Ticker
@@ -17,6 +18,7 @@ logger = logging.getLogger(__name__)
 
 
 @shared_task
+@overlap_lock()
 def fetch_tickers_from_api():
     """A Celery task to fetch tickers from an external API and update
     the database.
@@ -1 +1,365 @@
-# noqa
+"""This module contains the tests of the tickers app.
+
+Classes:
+    ExchangeCalendarTestCase: Tests the sessions of a fixed calendar.
+    MarketHoursModeTestCase: Tests the market hours modes.
+    LatestQuoteTestCase: Tests the upsert of the latest quotes.
+    TableVersionTestCase: Tests the version bumps of the ticker table.
+    AsyncFinanceTestCase: Tests the load shedding of the market data pool.
+    OverviewSectionTestCase: Tests the caching of overview sections.
+"""
+
+import asyncio
+import threading
+from datetime import UTC, date, datetime, time
+from decimal import Decimal
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+from custom_utils.conditional import TABLE_VERSION_KEY
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.test import TestCase, override_settings
+
+from tickers import market_hours
+from tickers.market_hours import (
+    ExchangeCalendar,
+    is_market_open,
+    next_market_open,
+)
+from tickers.models import LatestQuote, Ticker
+from tickers.overview import OVERVIEW_CACHE_KEY, get_section
+from tickers.services import AsyncFinance, Finance
+
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def new_york(*args):
+    """Returns an aware datetime in New York.
+
+    Args:
+        *args: The year, month, day, hour and minute.
+
+    Returns:
+        datetime: The datetime.
+    """
+    return datetime(*args, tzinfo=NEW_YORK)
+
+
+def fixed_calendar():
+    """Returns a calendar with a holiday and an early close in July 2024.
+
+    Returns:
+        ExchangeCalendar: The calendar, closed on Thursday July 4 and
+            closing at 1 p.m. on Wednesday July 3.
+    """
+    return ExchangeCalendar(
+        "TEST",
+        "America/New_York",
+        holidays=[date(2024, 7, 4)],
+        early_close_days=[date(2024, 7, 3)],
+    )
+
+
+class ExchangeCalendarTestCase(TestCase):
+    """Tests the sessions of a fixed calendar."""
+
+    def setUp(self):
+        """Sets up the calendar."""
+        self.calendar = fixed_calendar()
+
+    def test_is_open_during_regular_session(self):
+        """Tests that the exchange is open from 9:30 to 16:00."""
+        self.assertFalse(self.calendar.is_open(new_york(2024, 7, 8, 9, 29)))
+        self.assertTrue(self.calendar.is_open(new_york(2024, 7, 8, 9, 30)))
+        self.assertTrue(self.calendar.is_open(new_york(2024, 7, 8, 15, 59)))
+        self.assertFalse(self.calendar.is_open(new_york(2024, 7, 8, 16)))
+
+    def test_weekend(self):
+        """Tests that the exchange is closed over the weekend."""
+        saturday = new_york(2024, 7, 6, 12)
+        self.assertFalse(self.calendar.is_open(saturday))
+        self.assertFalse(self.calendar.is_open(saturday, "extended"))
+        self.assertEqual(
+            self.calendar.next_open(saturday), new_york(2024, 7, 8, 9, 30)
+        )
+        self.assertEqual(
+            self.calendar.next_open(new_york(2024, 7, 5, 16)),
+            new_york(2024, 7, 8, 9, 30),
+        )
+
+    def test_holiday(self):
+        """Tests that the exchange is closed on a holiday."""
+        holiday = new_york(2024, 7, 4, 11)
+        self.assertFalse(self.calendar.is_trading_day(holiday.date()))
+        self.assertFalse(self.calendar.is_open(holiday))
+        self.assertFalse(self.calendar.is_open(holiday, "extended"))
+        self.assertEqual(
+            self.calendar.next_open(holiday), new_york(2024, 7, 5, 9, 30)
+        )
+        self.assertEqual(
+            self.calendar.next_open(holiday, "extended"),
+            new_york(2024, 7, 5, 4),
+        )
+
+    def test_early_close(self):
+        """Tests that the exchange closes at 13:00 on an early close day."""
+        self.assertTrue(self.calendar.is_open(new_york(2024, 7, 3, 12, 59)))
+        self.assertFalse(self.calendar.is_open(new_york(2024, 7, 3, 13)))
+        self.assertEqual(
+            self.calendar.next_open(new_york(2024, 7, 3, 13)),
+            new_york(2024, 7, 5, 9, 30),
+        )
+        self.assertTrue(
+            self.calendar.is_open(new_york(2024, 7, 3, 16, 59), "extended")
+        )
+        self.assertFalse(
+            self.calendar.is_open(new_york(2024, 7, 3, 17), "extended")
+        )
+
+    def test_next_open_during_session(self):
+        """Tests that the next opening during a session is now."""
+        at = new_york(2024, 7, 8, 11)
+        self.assertEqual(self.calendar.next_open(at), at)
+        self.assertEqual(
+            self.calendar.next_open(new_york(2024, 7, 8, 8)),
+            new_york(2024, 7, 8, 9, 30),
+        )
+
+    def test_daylight_saving_time_change(self):
+        """Tests that the session follows the local clock across DST."""
+        calendar = ExchangeCalendar(
+            "TEST", "America/New_York", holidays=[], early_close_days=[]
+        )
+        # Friday March 8 2024 is on EST (UTC-5), Monday March 11 on EDT.
+        self.assertFalse(
+            calendar.is_open(datetime(2024, 3, 8, 14, 29, tzinfo=UTC))
+        )
+        self.assertTrue(
+            calendar.is_open(datetime(2024, 3, 8, 14, 30, tzinfo=UTC))
+        )
+        self.assertFalse(
+            calendar.is_open(datetime(2024, 3, 11, 13, 29, tzinfo=UTC))
+        )
+        self.assertTrue(
+            calendar.is_open(datetime(2024, 3, 11, 13, 30, tzinfo=UTC))
+        )
+        self.assertFalse(
+            calendar.is_open(datetime(2024, 3, 11, 20, tzinfo=UTC))
+        )
+
+        next_open = calendar.next_open(datetime(2024, 3, 9, 12, tzinfo=UTC))
+        self.assertEqual(next_open, datetime(2024, 3, 11, 13, 30, tzinfo=UTC))
+        self.assertEqual(next_open.timetz().replace(tzinfo=None), time(9, 30))
+
+
+@mock.patch.dict(market_hours.CALENDARS, {"TEST": fixed_calendar()})
+class MarketHoursModeTestCase(TestCase):
+    """Tests the market hours modes."""
+
+    premarket = new_york(2024, 7, 8, 8)
+    session = new_york(2024, 7, 8, 11)
+    saturday = new_york(2024, 7, 6, 12)
+
+    @override_settings(MARKET_HOURS_MODE="regular")
+    def test_regular(self):
+        """Tests that only the regular session is open."""
+        self.assertTrue(is_market_open("TEST", self.session))
+        self.assertFalse(is_market_open("TEST", self.premarket))
+        self.assertFalse(is_market_open("TEST", self.saturday))
+        self.assertEqual(
+            next_market_open("TEST", self.premarket),
+            new_york(2024, 7, 8, 9, 30),
+        )
+
+    @override_settings(MARKET_HOURS_MODE="extended")
+    def test_extended(self):
+        """Tests that the pre-market and post-market hours are open."""
+        self.assertTrue(is_market_open("TEST", self.session))
+        self.assertTrue(is_market_open("TEST", self.premarket))
+        self.assertTrue(is_market_open("TEST", new_york(2024, 7, 8, 19)))
+        self.assertFalse(is_market_open("TEST", new_york(2024, 7, 8, 20)))
+        self.assertFalse(is_market_open("TEST", self.saturday))
+        self.assertEqual(
+            next_market_open("TEST", self.saturday),
+            new_york(2024, 7, 8, 4),
+        )
+
+    @override_settings(MARKET_HOURS_MODE="always")
+    def test_always(self):
+        """Tests that every exchange is treated as open."""
+        self.assertTrue(is_market_open("TEST", self.premarket))
+        self.assertTrue(is_market_open("TEST", self.saturday))
+        self.assertTrue(is_market_open("UNKNOWN", self.saturday))
+        self.assertEqual(
+            next_market_open("TEST", self.saturday), self.saturday
+        )
+
+    @override_settings(
+        MARKET_HOURS_MODE="regular", MARKET_HOURS_DEFAULT_EXCHANGE="TEST"
+    )
+    def test_unknown_exchange_uses_default(self):
+        """Tests that an unknown exchange follows the default calendar."""
+        self.assertFalse(is_market_open("UNKNOWN", new_york(2024, 7, 4, 11)))
+        self.assertTrue(is_market_open(None, new_york(2024, 7, 5, 11)))
+
+
+class LatestQuoteTestCase(TestCase):
+    """Tests the upsert of the latest quotes."""
+
+    def setUp(self):
+        """Sets up two tickers."""
+        self.apple = Ticker.objects.create(symbol="AAPL")
+        self.microsoft = Ticker.objects.create(symbol="MSFT")
+
+    def test_upsert_creates_and_updates(self):
+        """Tests that a quote is created once and then updated."""
+        fetched = datetime(2024, 7, 8, 15, tzinfo=UTC)
+        LatestQuote.upsert({self.apple.pk: 150.123456}, fetched)
+
+        quote = LatestQuote.objects.get(ticker=self.apple)
+        self.assertEqual(quote.price, Decimal("150.1235"))
+        self.assertEqual(quote.updated_at, fetched)
+
+        refetched = datetime(2024, 7, 8, 15, 5, tzinfo=UTC)
+        LatestQuote.upsert(
+            {self.apple.pk: 151, self.microsoft.pk: 400.5}, refetched
+        )
+
+        self.assertEqual(LatestQuote.objects.count(), 2)
+        quote.refresh_from_db()
+        self.assertEqual(quote.price, Decimal("151.0000"))
+        self.assertEqual(quote.updated_at, refetched)
+        self.assertEqual(
+            LatestQuote.objects.get(ticker=self.microsoft).price,
+            Decimal("400.5000"),
+        )
+
+    def test_upsert_nothing(self):
+        """Tests that an empty upsert leaves the quotes unchanged."""
+        LatestQuote.upsert({}, datetime(2024, 7, 8, 15, tzinfo=UTC))
+        self.assertFalse(LatestQuote.objects.exists())
+
+
+@mock.patch("custom_utils.conditional.cache")
+class TableVersionTestCase(TestCase):
+    """Tests the version bumps of the ticker table."""
+
+    key = TABLE_VERSION_KEY.format(label="tickers.ticker")
+
+    def test_bumps_once_per_transaction(self, cache):
+        """Tests that the saves of a transaction bump the version once."""
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Ticker.objects.create(symbol="AAPL")
+            Ticker.objects.create(symbol="MSFT")
+        self.assertEqual(len(callbacks), 1)
+        cache.set.assert_called_once_with(self.key, mock.ANY, None)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Ticker.objects.create(symbol="TSLA")
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(cache.set.call_count, 2)
+
+    def test_bumps_after_rollback(self, cache):
+        """Tests that a rolled back bump does not hide the next one."""
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(ValueError), transaction.atomic():
+                Ticker.objects.create(symbol="AAPL")
+                raise ValueError
+            Ticker.objects.create(symbol="MSFT")
+        self.assertEqual(len(callbacks), 1)
+        cache.set.assert_called_once_with(self.key, mock.ANY, None)
+
+    def test_bulk_delete_bumps_once(self, cache):
+        """Tests that a bulk delete bumps without a signal per row."""
+        with self.captureOnCommitCallbacks(execute=True):
+            Ticker.objects.create(symbol="AAPL")
+            Ticker.objects.create(symbol="MSFT")
+        self.assertFalse(post_delete.has_listeners(Ticker))
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Ticker.objects.all().delete()
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(cache.set.call_count, 2)
+
+    def test_delete_bumps(self, cache):
+        """Tests that deleting one ticker bumps the version."""
+        with self.captureOnCommitCallbacks(execute=True):
+            ticker = Ticker.objects.create(symbol="AAPL")
+        with self.captureOnCommitCallbacks(execute=True):
+            ticker.delete()
+        self.assertEqual(cache.set.call_count, 2)
+
+
+class AsyncFinanceTestCase(TestCase):
+    """Tests the load shedding of the market data pool."""
+
+    def setUp(self):
+        """Sets up a pool of two threads."""
+        self.addCleanup(AsyncFinance.set_max_workers, AsyncFinance.max_workers)
+        AsyncFinance.set_max_workers(2)
+
+    def test_sheds_calls_while_threads_are_stuck(self):
+        """Tests that calls are shed until the stuck calls finish."""
+        released = threading.Event()
+        self.addCleanup(released.set)
+
+        def stuck(finance):
+            released.wait(5)
+            return {"shortName": finance.symbol}
+
+        async def request():
+            return await AsyncFinance("AAPL", timeout=0.05).get_info()
+
+        with mock.patch.object(Finance, "get_info", stuck):
+            self.assertEqual(asyncio.run(request()), None)
+            self.assertEqual(asyncio.run(request()), None)
+            self.assertEqual(AsyncFinance.in_flight, 2)
+            with self.assertLogs("tickers.services", "WARNING"):
+                self.assertEqual(asyncio.run(request()), None)
+
+            released.set()
+            AsyncFinance.executor.shutdown(wait=True)
+            self.assertEqual(AsyncFinance.in_flight, 0)
+            AsyncFinance.set_max_workers(2)
+            self.assertEqual(asyncio.run(request()), {"shortName": "AAPL"})
+
+
+class OverviewSectionTestCase(TestCase):
+    """Tests the caching of overview sections."""
+
+    key = OVERVIEW_CACHE_KEY.format(symbol="AAPL", section="major_holders")
+
+    def setUp(self):
+        """Clears the cached section."""
+        cache.delete(self.key)
+        self.addCleanup(cache.delete, self.key)
+
+    def test_empty_frame_is_missing(self):
+        """Tests that an empty DataFrame is neither returned nor cached."""
+        with mock.patch.object(
+            AsyncFinance, "run", return_value=pd.DataFrame()
+        ):
+            self.assertIsNone(
+                asyncio.run(get_section("AAPL", "major_holders"))
+            )
+        self.assertIsNone(cache.get(self.key))
+
+    def test_frame_is_cached(self):
+        """Tests that a DataFrame is cached as columns and rows."""
+        frame = pd.DataFrame({
+            "Breakdown": ["insidersPercentHeld"],
+            "Value": [0.1],
+        })
+        with mock.patch.object(AsyncFinance, "run", return_value=frame):
+            data = asyncio.run(get_section("AAPL", "major_holders"))
+        self.assertEqual(
+            data,
+            {
+                "columns": ["Breakdown", "Value"],
+                "data": [["insidersPercentHeld", 0.1]],
+            },
+        )
+        self.assertEqual(cache.get(self.key), data)
@@ -20,6 +20,19 @@ urlpatterns = [
     path(
         "<str:symbol>/history/", views.get_stock_history, name="ticker_history"
     ),
+    path(
+        "<str:symbol>/history/data/",
+        views.ticker_history_data,
+        name="ticker_history_data",
+    ),
+    path(
+        "<str:symbol>/overview/", views.ticker_overview, name="ticker_overview"
+    ),
+    path(
+        "<str:symbol>/overview/data/",
+        views.ticker_overview_data,
+        name="ticker_overview_data",
+    ),
     path(
         "fetch-tickers-async/",
         FetchTickersAsyncView.as_view(),
@@ -7,13 +7,20 @@ Views:
     import_tickers: Imports tickers from a CSV file.
     get_stock_info: Renders the stock information of a specific ticker.
     get_stock_history: Renders the stock history of a specific ticker.
+    market_data_unavailable: Builds the response for a failed upstream call.
+    ticker_overview: Renders the aggregated overview of a specific ticker.
+    ticker_overview_data: Returns the aggregated overview as JSON.
+    ticker_history_data: Returns parameterized, downsampled history as JSON.
     search_tickers: Searches for tickers based on a query.
     FetchTickersAsyncView: A view to fetch tickers asynchronously using Celery.
 """
 
 import csv
 
+from custom_utils.conditional import table_condition
+from django.conf import settings
 from django.core.cache import cache
+from django.core.paginator import Paginator
 from django.db import transaction
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, render
@@ -21,8 +28,17 @@ from django.views import View
 
 from tickers.tasks import fetch_tickers_from_api
 
+from .history import (
+    downsample_columns,
+    format_history_rows,
+    get_history_columns,
+    validate_history_params,
+)
 from .models import Ticker
-from .services import Finance
+from .overview import get_overview
+from .services import AsyncFinance
+
+HISTORY_PAGE_SIZE = 250
 
 
 def ticker_list(request):
@@ -63,6 +79,7 @@ def ticker_detail(request, symbol):
     return render(request, "tickers/ticker_detail.html", {"ticker": ticker})
 
 
+@table_condition(Ticker)
 def export_tickers(request):
     """Exports tickers to a CSV file.
 
@@ -80,17 +97,11 @@ def export_tickers(request):
         ["Symbol", "Name", "Country", "IPO Year", "Sector", "Industry"]
     )
 
-    for ticker in Ticker.objects.all():
-        writer.writerow(
-            [
-                ticker.symbol,
-                ticker.name,
-                ticker.country,
-                ticker.ipo_year,
-                ticker.sector,
-                ticker.industry,
-            ]
-        )
+    writer.writerows(
+        Ticker.objects.values_list(
+            "symbol", "name", "country", "ipo_year", "sector", "industry"
+        ).iterator()
+    )
 
     return response
 
@@ -114,9 +125,12 @@ def import_tickers(request):
     return None
 
 
-def get_stock_info(request, symbol):
+async def get_stock_info(request, symbol):
     """Renders the stock information of a specific ticker.
 
+    The upstream call runs in the market data thread pool, so under ASGI
+    the worker keeps serving other requests while yfinance responds.
+
     Args:
         request (HttpRequest): The request object.
         symbol (str): The symbol of the ticker.
@@ -125,8 +139,10 @@ def get_stock_info(request, symbol):
         HttpResponse: The response object containing the rendered template.
     """
     if request.method == "GET":
-        finance = Finance(symbol)
-        info = finance.get_info()
+        finance = AsyncFinance(symbol, timeout=settings.MARKET_DATA_TIMEOUT)
+        info = await finance.get_info()
+        if not info:
+            return market_data_unavailable(symbol)
         return render(
             request,
             "tickers/company_profile.html",
@@ -135,27 +151,142 @@ def get_stock_info(request, symbol):
     return None
 
 
-def get_stock_history(request, symbol):
+async def get_stock_history(request, symbol):
     """Renders the stock history of a specific ticker.
 
+    The history and the company information are fetched concurrently,
+    so the page costs the slower of the two upstream calls. Only the
+    requested page of rows is formatted and rendered.
+
     Args:
-        request (HttpRequest): The request object.
+        request (HttpRequest): The request object. The optional ``page``
+            query parameter selects the page of rows.
         symbol (str): The symbol of the ticker.
 
     Returns:
         HttpResponse: The response object containing the rendered template.
     """
     if request.method == "GET":
-        finance = Finance(symbol)
-        history = finance.get_history()
+        finance = AsyncFinance(symbol, timeout=settings.MARKET_DATA_TIMEOUT)
+        data = await finance.gather(info="get_info", history="get_history")
+        history = data["history"]
+        if history is None:
+            return market_data_unavailable(symbol)
+        name = (data["info"] or {}).get("shortName") or symbol
+
+        paginator = Paginator(range(len(history)), HISTORY_PAGE_SIZE)
+        page = paginator.get_page(request.GET.get("page"))
+        rows = format_history_rows(
+            history.iloc[page.object_list.start : page.object_list.stop]
+        )
         return render(
             request,
             "tickers/history.html",
-            {"history": history, "title": f"{symbol} History"},
+            {"rows": rows, "page": page, "title": f"{name} History"},
         )
     return None
 
 
+def market_data_unavailable(symbol):
+    """Builds the response for a failed or timed out upstream call.
+
+    Args:
+        symbol (str): The symbol of the ticker.
+
+    Returns:
+        HttpResponse: The 503 response object.
+    """
+    return HttpResponse(
+        f"Market data for {symbol} is temporarily unavailable.", status=503
+    )
+
+
+async def ticker_overview(request, symbol):
+    """Renders the aggregated overview of a specific ticker.
+
+    All sections are fetched concurrently with their own timeouts, so the
+    page is ready after the slowest section instead of the sum of them.
+
+    Args:
+        request (HttpRequest): The request object.
+        symbol (str): The symbol of the ticker.
+
+    Returns:
+        HttpResponse: The response object containing the rendered template.
+    """
+    overview = await get_overview(symbol)
+    if not overview["sections"]:
+        return market_data_unavailable(symbol)
+    info = overview["sections"].get("info", {})
+    return render(
+        request,
+        "tickers/overview.html",
+        {
+            "overview": overview,
+            "title": f"{info.get('shortName') or symbol} Overview",
+        },
+    )
+
+
+async def ticker_overview_data(request, symbol):
+    """Returns the aggregated overview of a specific ticker as JSON.
+
+    Args:
+        request (HttpRequest): The request object. The optional ``sections``
+            query parameter holds a comma-separated list of section names.
+        symbol (str): The symbol of the ticker.
+
+    Returns:
+        JsonResponse: The response object containing the overview.
+    """
+    sections = request.GET.get("sections")
+    overview = await get_overview(
+        symbol, sections.split(",") if sections else None
+    )
+    return JsonResponse(overview)
+
+
+async def ticker_history_data(request, symbol):
+    """Returns parameterized, downsampled history of a ticker as JSON.
+
+    Args:
+        request (HttpRequest): The request object. Supported query
+            parameters are ``period``, ``interval``, ``start``, ``end``
+            and ``points``, the number of points to downsample to.
+        symbol (str): The symbol of the ticker.
+
+    Returns:
+        JsonResponse: The response object containing columnar history
+            with epoch millisecond timestamps in ``t``.
+    """
+    params, error = validate_history_params(request.GET)
+    if error:
+        return JsonResponse({"error": error}, status=400)
+
+    columns = await get_history_columns(
+        symbol,
+        params["period"],
+        params["interval"],
+        params["start"],
+        params["end"],
+    )
+    if columns is None:
+        return JsonResponse(
+            {"error": f"No history available for {symbol}."}, status=404
+        )
+    return JsonResponse(
+        {
+            "symbol": symbol,
+            "period": params["period"],
+            "interval": params["interval"],
+            "start": params["start"],
+            "end": params["end"],
+            "count": len(columns["t"]),
+            "points": downsample_columns(columns, params["points"]),
+        }
+    )
+
+
 def search_tickers(request):
     """Searches for tickers based on a query.
 
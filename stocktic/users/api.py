@@ -8,6 +8,8 @@ Functions:
     get_token_by_telegram_id: A function to get JWT tokens by Telegram user ID.
 """
 
+from django.db.models import Prefetch
+from notifications.models import Notification
 from rest_framework import status, viewsets
 from rest_framework.decorators import action as action_decorator
 from rest_framework.decorators import api_view
@@ -16,7 +18,7 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from .models import User
-from .serializers import UserSerializer
+from .serializers import UserDashboardSerializer, UserSerializer
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -65,6 +67,29 @@ class UserViewSet(viewsets.ModelViewSet):
             {"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND
         )
 
+    @action_decorator(detail=False, methods=["get"])
+    def me(self, request):
+        """Get the authenticated user with their notifications and the
+        referenced tickers.
+
+        Everything is loaded with two queries, the user and the
+        notifications joined with their tickers, so clients can render
+        any user screen with a single round trip.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The response object containing the user data.
+        """
+        notifications = Notification.objects.select_related("ticker").order_by(
+            "date_created"
+        )
+        user = self.queryset.prefetch_related(
+            Prefetch("notifications", queryset=notifications)
+        ).get(pk=request.user.pk)
+        return Response(UserDashboardSerializer(user).data)
+
     def create(self, request, *args, **kwargs):
         """Create a new user instance.
 
@@ -2,10 +2,13 @@
 
 Classes:
     UserSerializer: A serializer for the User model.
+    UserDashboardSerializer: A serializer for a user with their
+        notifications and the referenced tickers.
 """
 
 from typing import ClassVar
 
+from notifications.serializers import NotificationWithTickerSerializer
 from rest_framework import serializers
 
 from .models import User
@@ -71,3 +74,18 @@ class UserSerializer(serializers.ModelSerializer):
             instance.set_password(validated_data["password"])
         instance.save()
         return instance
+
+
+class UserDashboardSerializer(UserSerializer):
+    """A serializer for a user with their notifications and the referenced
+    tickers.
+
+    Meta:
+        model (User): The model to be serialized.
+        fields (list): The fields to be included in the serialization.
+    """
+
+    notifications = NotificationWithTickerSerializer(many=True, read_only=True)
+
+    class Meta(UserSerializer.Meta):
+        fields: ClassVar = [*UserSerializer.Meta.fields, "notifications"]
@@ -0,0 +1,17 @@
+"""This module registers the Watchlist model with the Django admin site.
+
+Admin:
+    WatchlistAdmin: Admin interface for the Watchlist model.
+"""
+
+from django.contrib import admin
+
+from watchlists.models import Watchlist
+
+
+@admin.register(Watchlist)
+class WatchlistAdmin(admin.ModelAdmin):
+    """Admin interface for the Watchlist model."""
+
+    list_display = ("user", "digest_enabled", "last_digest")
+    filter_horizontal = ("tickers",)
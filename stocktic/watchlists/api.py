@@ -0,0 +1,70 @@
+"""This module provides the API views of the watchlists app.
+
+ViewSets:
+    WatchlistViewSet: A viewset for the watchlist of the authenticated
+        user.
+"""
+
+from rest_framework import viewsets
+from rest_framework.decorators import action as action_decorator
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from .models import Watchlist
+from .serializers import WatchlistSerializer
+
+
+class WatchlistViewSet(viewsets.GenericViewSet):
+    """A viewset for the watchlist of the authenticated user.
+
+    Attributes:
+        serializer_class (Serializer): The serializer class for Watchlist
+            objects.
+        permission_classes (list): The permission classes of the viewset.
+    """
+
+    serializer_class = WatchlistSerializer
+    permission_classes = (IsAuthenticated,)
+
+    def get_queryset(self):
+        """Returns the watchlist of the authenticated user.
+
+        Returns:
+            QuerySet: The watchlists of the user, at most one.
+        """
+        return Watchlist.objects.filter(
+            user=self.request.user
+        ).prefetch_related("tickers")
+
+    @action_decorator(detail=False, methods=["get", "put", "patch"])
+    def me(self, request):
+        """Get or update the watchlist of the authenticated user.
+
+        The watchlist is created on the first update; until then an empty
+        watchlist is returned.
+
+        Args:
+            request (Request): The request object.
+
+        Returns:
+            Response: The response object containing the watchlist data.
+        """
+        watchlist = self.get_queryset().first()
+        if request.method == "GET":
+            if watchlist is None:
+                return Response({
+                    "id": None,
+                    "tickers": [],
+                    "digest_enabled": True,
+                    "last_digest": None,
+                })
+            return Response(self.get_serializer(watchlist).data)
+
+        serializer = self.get_serializer(
+            watchlist,
+            data=request.data,
+            partial=request.method == "PATCH",
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save(user=request.user)
+        return Response(serializer.data)
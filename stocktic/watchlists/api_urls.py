@@ -0,0 +1,18 @@
+"""This module defines the URL patterns for the watchlists API.
+
+URL Patterns:
+    urlpatterns: A list of URL patterns for the watchlists API, including
+        the WatchlistViewSet.
+"""
+
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .api import WatchlistViewSet
+
+router = DefaultRouter()
+router.register(r"watchlists", WatchlistViewSet, basename="watchlist")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
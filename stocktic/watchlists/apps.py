@@ -0,0 +1,20 @@
+"""This module defines the configuration for the Watchlists app.
+
+Classes:
+    WatchlistsConfig: Configuration class for the Watchlists app.
+"""
+
+from django.apps import AppConfig
+
+
+class WatchlistsConfig(AppConfig):
+    """Configuration class for the Watchlists app.
+
+    Attributes:
+        default_auto_field (str): The default auto field type for models
+            in this app.
+        name (str): The name of the app.
+    """
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "watchlists"
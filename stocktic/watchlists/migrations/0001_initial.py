@@ -0,0 +1,82 @@
+# Generated by Django 5.1.15 on 2026-10-19 12:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        (
+            "tickers",
+            "0004_alter_ticker_sector_alter_ticker_stock_exchange_and_more",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Watchlist",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "date_created",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="Date Created",
+                        verbose_name="Date Created",
+                    ),
+                ),
+                (
+                    "date_modified",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="Date Modified",
+                        verbose_name="Date Modified",
+                    ),
+                ),
+                (
+                    "digest_enabled",
+                    models.BooleanField(
+                        default=True, verbose_name="Digest enabled"
+                    ),
+                ),
+                (
+                    "last_digest",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Last digest"
+                    ),
+                ),
+                (
+                    "tickers",
+                    models.ManyToManyField(
+                        blank=True,
+                        related_name="watchlists",
+                        to="tickers.ticker",
+                        verbose_name="Tickers",
+                    ),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="watchlist",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+    ]
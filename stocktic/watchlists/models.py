@@ -0,0 +1,39 @@
+"""This module defines the models for the watchlists app.
+
+Models:
+    Watchlist: The tickers a user follows in a periodic digest.
+"""
+
+from custom_utils.common.constants import NULLABLE
+from custom_utils.common.mixins import DateFieldsMixin
+from django.db import models
+
+
+class Watchlist(DateFieldsMixin, models.Model):
+    """The tickers a user follows in a periodic digest.
+
+    Attributes:
+        user (OneToOneField): The owner of the watchlist.
+        tickers (ManyToManyField): The watched tickers.
+        digest_enabled (BooleanField): Whether the user receives the
+            digest.
+        last_digest (DateTimeField): The date and time of the last digest.
+    """
+
+    user = models.OneToOneField(
+        "users.User", on_delete=models.CASCADE, related_name="watchlist"
+    )
+    tickers = models.ManyToManyField(
+        "tickers.Ticker",
+        related_name="watchlists",
+        blank=True,
+        verbose_name="Tickers",
+    )
+    digest_enabled = models.BooleanField(
+        default=True, verbose_name="Digest enabled"
+    )
+    last_digest = models.DateTimeField(**NULLABLE, verbose_name="Last digest")
+
+    def __str__(self):
+        """Returns a string representation of the Watchlist instance."""
+        return f"Watchlist of {self.user}"
@@ -0,0 +1,51 @@
+"""This module defines the serializers for the watchlists app.
+
+Serializers:
+    WatchlistSerializer: A serializer for Watchlist instances.
+"""
+
+from django.conf import settings
+from rest_framework import serializers
+from tickers.models import Ticker
+
+from .models import Watchlist
+
+
+class WatchlistSerializer(serializers.ModelSerializer):
+    """A serializer for Watchlist instances.
+
+    Tickers are read and written as a list of symbols.
+
+    Meta:
+        model (Model): The model associated with the serializer.
+        fields (list): The fields to include in the serializer.
+    """
+
+    tickers = serializers.SlugRelatedField(
+        many=True, slug_field="symbol", queryset=Ticker.objects.all()
+    )
+
+    class Meta:
+        model = Watchlist
+        fields = ("id", "tickers", "digest_enabled", "last_digest")
+        read_only_fields = ("last_digest",)
+
+    def validate_tickers(self, tickers):
+        """Limits the number of watched tickers.
+
+        Args:
+            tickers (list): The watched tickers.
+
+        Returns:
+            list: The tickers without duplicates.
+
+        Raises:
+            ValidationError: If too many tickers are watched.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if len(tickers) > settings.WATCHLIST_MAX_TICKERS:
+            raise serializers.ValidationError(
+                f"A watchlist holds at most "
+                f"{settings.WATCHLIST_MAX_TICKERS} tickers."
+            )
+        return tickers
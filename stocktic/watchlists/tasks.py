@@ -0,0 +1,158 @@
+"""This module defines the tasks for the watchlists app.
+
+The digest is priced once for the union of all watched symbols, with a
+single batched download, and each user's message is rendered from those
+shared prices. Its cost therefore grows with the number of distinct
+symbols, not with the number of users. The messages are then queued as
+separate delivery tasks, retried when Telegram asks the sender to slow
+down. Their ``WATCHLIST_DIGEST_RATE_LIMIT`` is enforced by each worker
+on its own, not across workers, so with several workers the limit must
+be divided by their number to stay under Telegram's rate.
+
+The digest runs on the ``CELERY_BEAT_SCHEDULE`` entry defined in the
+settings, at ``WATCHLIST_DIGEST_HOUR``, and is skipped on the days the
+``MARKET_HOURS_DEFAULT_EXCHANGE`` does not trade, when the prices have
+not changed since the last one.
+
+Tasks:
+    send_watchlist_digests: Prices all watchlists and queues the digests.
+    deliver_watchlist_digest: Sends one digest to a Telegram user.
+
+Functions:
+    get_price_changes: Returns the latest price and daily change of
+        several symbols.
+    render_digest: Renders the digest of one watchlist.
+"""
+
+import logging
+
+import httpx
+from celery import shared_task
+from custom_utils.locks import overlap_lock
+from django.conf import settings
+from django.utils import timezone
+from tickers.market_hours import get_calendar
+from tickers.services import Finance
+
+from telegram_bot.utils import send_telegram_message
+from watchlists.models import Watchlist
+
+logger = logging.getLogger(__name__)
+
+
+def get_price_changes(symbols):
+    """Returns the latest price and daily change of several symbols.
+
+    Args:
+        symbols (list): The ticker symbols.
+
+    Returns:
+        dict: ``(price, change_percent)`` by symbol, the change being None
+            when there is a single close. Symbols without prices are left
+            out.
+    """
+    changes = {}
+    for symbol, history in Finance.get_daily_closes(symbols).items():
+        price = float(history.iloc[-1])
+        change = None
+        if len(history) > 1 and history.iloc[-2]:
+            change = (price / float(history.iloc[-2]) - 1) * 100
+        changes[symbol] = (price, change)
+    return changes
+
+
+def render_digest(symbols, changes):
+    """Renders the digest of one watchlist.
+
+    Args:
+        symbols (list): The watched ticker symbols.
+        changes (dict): ``(price, change_percent)`` by symbol.
+
+    Returns:
+        str: The digest message.
+    """
+    lines = ["📋 Your watchlist digest", ""]
+    for symbol in symbols:
+        if symbol not in changes:
+            lines.append(f"{symbol}: no data")
+            continue
+        price, change = changes[symbol]
+        line = f"{symbol}: {price:.2f}"
+        if change is not None:
+            arrow = "📈" if change >= 0 else "📉"
+            line += f" ({change:+.2f}%) {arrow}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+@shared_task
+@overlap_lock()
+def send_watchlist_digests():
+    """Prices all watchlists and queues the digests.
+
+    Returns:
+        int: The number of queued digests.
+    """
+    if settings.MARKET_HOURS_MODE != "always":
+        market = get_calendar()
+        if not market.is_trading_day(market.today()):
+            logger.info(f"{market.name} is closed today, skipping digests")
+            return 0
+    watchlists = list(
+        Watchlist.objects
+        .filter(digest_enabled=True, user__telegram_user_id__isnull=False)
+        .select_related("user")
+        .prefetch_related("tickers")
+    )
+    watched = {
+        watchlist.pk: sorted(
+            ticker.symbol for ticker in watchlist.tickers.all()
+        )
+        for watchlist in watchlists
+    }
+    symbols = sorted(set().union(*watched.values()))
+    if not symbols:
+        return 0
+
+    changes = get_price_changes(symbols)
+    logger.info(
+        f"Priced {len(changes)} of {len(symbols)} symbols "
+        f"for {len(watchlists)} watchlists"
+    )
+    queued = []
+    for watchlist in watchlists:
+        if not watched[watchlist.pk]:
+            continue
+        deliver_watchlist_digest.delay(
+            watchlist.user.telegram_user_id,
+            render_digest(watched[watchlist.pk], changes),
+        )
+        queued.append(watchlist.pk)
+    Watchlist.objects.filter(pk__in=queued).update(last_digest=timezone.now())
+    return len(queued)
+
+
+@shared_task(
+    bind=True,
+    rate_limit=settings.WATCHLIST_DIGEST_RATE_LIMIT,
+    autoretry_for=(httpx.TransportError,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def deliver_watchlist_digest(self, telegram_user_id, message):
+    """Sends one digest to a Telegram user.
+
+    Args:
+        telegram_user_id (int): The Telegram user ID.
+        message (str): The digest message.
+    """
+    response = send_telegram_message(telegram_user_id, message)
+    if response.status_code == 429:
+        retry_after = (
+            response.json().get("parameters", {}).get("retry_after", 1)
+        )
+        raise self.retry(countdown=retry_after)
+    if response.is_error:
+        logger.error(
+            f"Could not send digest to {telegram_user_id}: {response.text}"
+        )
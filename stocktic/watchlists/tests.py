@@ -0,0 +1,283 @@
+"""This module contains the tests of the watchlists app.
+
+Classes:
+    WatchlistApiTestCase: Tests the watchlist endpoint of the API.
+    WatchlistDigestTestCase: Tests the pricing and queueing of digests.
+    WatchCommandTestCase: Tests the watchlist commands of the bot.
+"""
+
+from unittest import mock
+
+import pandas as pd
+from aiogram.filters import CommandObject
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+from tickers.models import Ticker
+from users.models import User
+
+from telegram_bot.handlers.watchlist_handlers import cmd_unwatch, cmd_watch
+from telegram_bot.services import SymbolIndex
+from watchlists.models import Watchlist
+from watchlists.tasks import send_watchlist_digests
+
+WATCHLIST_URL = "/api/v1/watchlists/me/"
+
+
+def create_tickers(*symbols):
+    """Creates a ticker per symbol.
+
+    Args:
+        *symbols: The ticker symbols.
+
+    Returns:
+        dict: The tickers by symbol.
+    """
+    return {symbol: Ticker.objects.create(symbol=symbol) for symbol in symbols}
+
+
+class WatchlistApiTestCase(TestCase):
+    """Tests the watchlist endpoint of the API."""
+
+    def setUp(self):
+        """Sets up an authenticated client and three tickers."""
+        self.user = User.objects.create_user(
+            email="watcher@example.com", password="password"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        create_tickers("AAPL", "MSFT", "TSLA")
+
+    def test_requires_authentication(self):
+        """Tests that anonymous users cannot read a watchlist."""
+        response = APIClient().get(WATCHLIST_URL)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_get_before_first_update(self):
+        """Tests that an empty watchlist is returned until one is saved."""
+        response = self.client.get(WATCHLIST_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["tickers"], [])
+        self.assertIsNone(response.data["id"])
+        self.assertFalse(Watchlist.objects.exists())
+
+    def test_put_creates_then_updates(self):
+        """Tests that updates are saved on the watchlist of the user."""
+        response = self.client.put(
+            WATCHLIST_URL, {"tickers": ["MSFT", "AAPL", "MSFT"]}, "json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(response.data["tickers"]), ["AAPL", "MSFT"])
+
+        response = self.client.patch(
+            WATCHLIST_URL, {"digest_enabled": False}, "json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        watchlist = Watchlist.objects.get(user=self.user)
+        self.assertFalse(watchlist.digest_enabled)
+        self.assertEqual(watchlist.tickers.count(), 2)
+
+        response = self.client.get(WATCHLIST_URL)
+        self.assertEqual(response.data["id"], watchlist.pk)
+
+    def test_unknown_ticker(self):
+        """Tests that an unknown ticker symbol is rejected."""
+        response = self.client.put(
+            WATCHLIST_URL, {"tickers": ["AAPL", "NOPE"]}, "json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Watchlist.objects.exists())
+
+    @override_settings(WATCHLIST_MAX_TICKERS=2)
+    def test_too_many_tickers(self):
+        """Tests that a watchlist holds at most the configured tickers."""
+        response = self.client.put(
+            WATCHLIST_URL, {"tickers": ["AAPL", "MSFT", "TSLA"]}, "json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("tickers", response.data)
+
+
+@override_settings(MARKET_HOURS_MODE="always")
+@mock.patch("watchlists.tasks.deliver_watchlist_digest")
+@mock.patch("watchlists.tasks.Finance.get_daily_closes")
+class WatchlistDigestTestCase(TestCase):
+    """Tests the pricing and queueing of digests."""
+
+    def setUp(self):
+        """Sets up overlapping watchlists of three users."""
+        tickers = create_tickers("AAPL", "MSFT", "TSLA", "NVDA")
+        self.watchlists = {}
+        for telegram_user_id, symbols in (
+            (1, ["AAPL", "MSFT"]),
+            (2, ["MSFT", "TSLA"]),
+            (None, ["NVDA"]),
+        ):
+            user = User.objects.create_user(
+                email=f"user{telegram_user_id}@example.com",
+                password="password",
+                telegram_user_id=telegram_user_id,
+            )
+            watchlist = Watchlist.objects.create(user=user)
+            watchlist.tickers.set(tickers[symbol] for symbol in symbols)
+            self.watchlists[telegram_user_id] = watchlist
+
+    def test_prices_union_of_symbols_once(
+        self, get_daily_closes, deliver_watchlist_digest
+    ):
+        """Tests that all watchlists are priced with one download."""
+        get_daily_closes.return_value = {
+            "AAPL": pd.Series([100.0, 110.0]),
+            "MSFT": pd.Series([400.0]),
+        }
+
+        self.assertEqual(send_watchlist_digests(), 2)
+
+        get_daily_closes.assert_called_once_with(["AAPL", "MSFT", "TSLA"])
+        self.assertEqual(
+            deliver_watchlist_digest.delay.call_args_list,
+            [
+                mock.call(
+                    1,
+                    "📋 Your watchlist digest\n\n"
+                    "AAPL: 110.00 (+10.00%) 📈\n"
+                    "MSFT: 400.00",
+                ),
+                mock.call(
+                    2,
+                    "📋 Your watchlist digest\n\nMSFT: 400.00\nTSLA: no data",
+                ),
+            ],
+        )
+        self.assertIsNotNone(
+            Watchlist.objects.get(pk=self.watchlists[1].pk).last_digest
+        )
+        self.assertIsNone(
+            Watchlist.objects.get(pk=self.watchlists[None].pk).last_digest
+        )
+
+    def test_disabled_digests(
+        self, get_daily_closes, deliver_watchlist_digest
+    ):
+        """Tests that nothing is priced without an enabled digest."""
+        Watchlist.objects.update(digest_enabled=False)
+
+        self.assertEqual(send_watchlist_digests(), 0)
+
+        get_daily_closes.assert_not_called()
+        deliver_watchlist_digest.delay.assert_not_called()
+
+
+@mock.patch("telegram_bot.handlers.watchlist_handlers.get_repository")
+class WatchCommandTestCase(TestCase):
+    """Tests the watchlist commands of the bot.
+
+    The handlers are called without the registration check, with the
+    session it would resolve.
+    """
+
+    def setUp(self):
+        """Sets up a message, a symbol index and a watched ticker."""
+        self.session = {"access_token": "token"}
+        self.message = mock.AsyncMock()
+        self.symbol_index = SymbolIndex()
+        self.symbol_index.load([
+            ("AAPL", "Apple Inc.", "3T"),
+            ("MSFT", "Microsoft Corp", "3T"),
+            ("TSLA", "Tesla Inc.", "1T"),
+        ])
+        self.repository = mock.AsyncMock()
+        self.repository.get_watchlist.return_value = ["TSLA"]
+
+    async def watch(self, args):
+        """Sends ``/watch`` with arguments.
+
+        Args:
+            args (str): The command arguments.
+        """
+        await cmd_watch.__wrapped__(
+            self.message,
+            mock.AsyncMock(),
+            command=CommandObject(command="watch", args=args),
+            symbol_index=self.symbol_index,
+            session=self.session,
+        )
+
+    async def unwatch(self, args):
+        """Sends ``/unwatch`` with arguments.
+
+        Args:
+            args (str): The command arguments.
+        """
+        await cmd_unwatch.__wrapped__(
+            self.message,
+            mock.AsyncMock(),
+            command=CommandObject(command="unwatch", args=args),
+            session=self.session,
+        )
+
+    def reply(self):
+        """Returns the text of the last reply.
+
+        Returns:
+            str: The reply.
+        """
+        return self.message.answer.call_args.args[0]
+
+    async def test_watch_without_symbols(self, get_repository):
+        """Tests that ``/watch`` without symbols shows its usage."""
+        get_repository.return_value = self.repository
+        await self.watch(" , ")
+
+        self.assertEqual(self.reply(), "Usage: /watch AAPL MSFT")
+        self.repository.set_watchlist.assert_not_called()
+
+    async def test_watch_unknown_symbol(self, get_repository):
+        """Tests that ``/watch`` rejects symbols missing from the index."""
+        get_repository.return_value = self.repository
+        await self.watch("aapl nope")
+
+        self.assertEqual(self.reply(), "Unknown ticker symbols: NOPE")
+        self.repository.set_watchlist.assert_not_called()
+
+    async def test_watch_adds_symbols(self, get_repository):
+        """Tests that ``/watch`` appends new symbols once each."""
+        get_repository.return_value = self.repository
+        self.repository.set_watchlist.return_value = ["TSLA", "AAPL", "MSFT"]
+        await self.watch("aapl, msft tsla AAPL")
+
+        self.repository.set_watchlist.assert_awaited_once_with(
+            self.session, ["TSLA", "AAPL", "MSFT"]
+        )
+        self.assertEqual(self.reply(), "Your watchlist: AAPL, MSFT, TSLA")
+
+    async def test_watch_rejected_by_api(self, get_repository):
+        """Tests that ``/watch`` reports an update the API rejects."""
+        get_repository.return_value = self.repository
+        self.repository.set_watchlist.return_value = None
+        await self.watch("AAPL")
+
+        self.assertIn("Could not update your watchlist", self.reply())
+
+    async def test_unwatch_without_symbols(self, get_repository):
+        """Tests that ``/unwatch`` without symbols shows its usage."""
+        get_repository.return_value = self.repository
+        await self.unwatch(None)
+
+        self.assertEqual(self.reply(), "Usage: /unwatch AAPL")
+        self.repository.get_watchlist.assert_not_called()
+
+    async def test_unwatch_removes_symbols(self, get_repository):
+        """Tests that ``/unwatch`` keeps the other watched symbols."""
+        get_repository.return_value = self.repository
+        self.repository.get_watchlist.return_value = ["TSLA", "AAPL"]
+        self.repository.set_watchlist.return_value = []
+        await self.unwatch("tsla aapl")
+
+        self.repository.set_watchlist.assert_awaited_once_with(
+            self.session, []
+        )
+        self.assertEqual(
+            self.reply(),
+            "Your watchlist is empty. Add tickers with /watch AAPL MSFT",
+        )
@@ -1,5 +1,9 @@
 """This module initializes the Telegram bot instance.
 
+When ``TELEGRAM_API_URL`` is set, the bot talks to that server instead
+of the public Bot API, e.g. a local Bot API server or the fake server
+from ``telegram_bot.devtools``.
+
 Attributes:
     TELEGRAM_BOT_TOKEN (str): The token for the Telegram bot.
     bot (Bot): The instance of the Telegram bot.
@@ -9,9 +13,21 @@ import os
 
 from aiogram import Bot
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+
+from telegram_bot.settings import BotSettings as settings
 
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 
+session = None
+if settings.TELEGRAM_API_URL:
+    session = AiohttpSession(
+        api=TelegramAPIServer.from_base(settings.TELEGRAM_API_URL)
+    )
+
 bot = Bot(
-    token=TELEGRAM_BOT_TOKEN, default=DefaultBotProperties(parse_mode="HTML")
+    token=TELEGRAM_BOT_TOKEN,
+    session=session,
+    default=DefaultBotProperties(parse_mode="HTML"),
 )
@@ -0,0 +1,147 @@
+r"""This module compares the latency of the bot's data access modes.
+
+It runs the same read operations through the HTTP repository and the ORM
+repository for a registered Telegram user and prints the mean, median
+and 95th percentile latency of each operation. Run it from the
+repository root, with the API running for the HTTP mode and the Django
+settings pointing at the same database::
+
+    python -m telegram_bot.devtools.benchmark_repositories \
+        --telegram-user-id 123456 --symbol AAPL --iterations 200
+
+Functions:
+    measure: Measures the latency of an operation.
+    benchmark: Benchmarks the read operations of a repository.
+    print_report: Prints the latency summary of a benchmark.
+    run: Benchmarks the selected data access modes.
+    main: Runs the benchmark from the command line.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from telegram_bot.repositories import BaseRepository, HttpRepository
+from telegram_bot.services.api_client import close_api_client
+
+
+async def measure(operation, iterations, concurrency) -> list:
+    """Measures the latency of an operation.
+
+    Args:
+        operation (Callable): A coroutine function without arguments.
+        iterations (int): How many times the operation is run.
+        concurrency (int): How many operations run at once.
+
+    Returns:
+        list: The latency of each run, in milliseconds.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def run():
+        async with semaphore:
+            started = time.perf_counter()
+            await operation()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(run() for _ in range(iterations)))
+    return latencies
+
+
+async def benchmark(
+    repository: BaseRepository,
+    telegram_user_id,
+    symbol,
+    iterations,
+    concurrency,
+) -> dict:
+    """Benchmarks the read operations of a repository.
+
+    Args:
+        repository (BaseRepository): The repository to benchmark.
+        telegram_user_id (int): The Telegram user ID of a registered user.
+        symbol (str): The ticker symbol to look up.
+        iterations (int): How many times each operation is run.
+        concurrency (int): How many operations run at once.
+
+    Returns:
+        dict: The latencies in milliseconds by operation name.
+    """
+    session = await repository.get_session(telegram_user_id)
+    if session is None:
+        raise SystemExit(f"User {telegram_user_id} is not registered")
+    operations = {
+        "get_session": lambda: repository.get_session(telegram_user_id),
+        "get_ticker": lambda: repository.get_ticker(session, symbol),
+        "get_dashboard": lambda: repository.get_dashboard(session),
+    }
+    return {
+        name: await measure(operation, iterations, concurrency)
+        for name, operation in operations.items()
+    }
+
+
+def print_report(mode, results) -> None:
+    """Prints the latency summary of a benchmark.
+
+    Args:
+        mode (str): The data access mode.
+        results (dict): The latencies in milliseconds by operation name.
+    """
+    for name, latencies in results.items():
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(  # noqa: T201
+            f"{mode:<5} {name:<14} "
+            f"mean {statistics.fmean(latencies):7.2f} ms  "
+            f"p50 {statistics.median(latencies):7.2f} ms  "
+            f"p95 {p95:7.2f} ms"
+        )
+
+
+async def run(args) -> None:
+    """Benchmarks the selected data access modes.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+    """
+    for mode in args.modes:
+        if mode == "orm":
+            from telegram_bot.repositories.orm_repository import (
+                OrmRepository,
+            )
+
+            repository = OrmRepository()
+        else:
+            repository = HttpRepository()
+        await repository.start()
+        try:
+            results = await benchmark(
+                repository,
+                args.telegram_user_id,
+                args.symbol,
+                args.iterations,
+                args.concurrency,
+            )
+        finally:
+            await repository.close()
+        print_report(mode, results)
+    await close_api_client()
+
+
+def main() -> None:
+    """Runs the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--telegram-user-id", type=int, required=True)
+    parser.add_argument("--symbol", default="AAPL")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--modes", nargs="+", choices=["http", "orm"], default=["http", "orm"]
+    )
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
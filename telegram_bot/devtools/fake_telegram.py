@@ -0,0 +1,369 @@
+"""This module provides a fake Telegram Bot API server for offline testing.
+
+The server implements the few Bot API methods the bot uses, records
+every message the bot sends and lets a test push updates, which are
+delivered either through ``getUpdates`` or, once a webhook has been
+set, by POSTing them to the webhook with the configured secret token.
+Point the bot at it with ``TELEGRAM_API_URL=http://127.0.0.1:8081``.
+
+Run it standalone with::
+
+    python -m telegram_bot.devtools.fake_telegram --port 8081
+
+and push updates with ``POST /_fake/updates`` (a single update or a list
+of updates as JSON); sent messages are listed at ``GET /_fake/messages``.
+
+Classes:
+    FakeTelegramServer: An in-process fake of the Telegram Bot API.
+
+Functions:
+    make_message_update: Builds a text message update.
+    make_callback_update: Builds an inline keyboard button press update.
+    serve: Runs the fake server until cancelled.
+    main: Runs the fake server from the command line.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import logging
+import time
+
+from aiohttp import ClientSession, ClientTimeout, web
+
+logger = logging.getLogger(__name__)
+
+BOT_USER = {
+    "id": 1,
+    "is_bot": True,
+    "first_name": "StockTic",
+    "username": "stocktic_fake_bot",
+}
+MESSAGE_METHODS = {
+    "sendMessage",
+    "sendPhoto",
+    "sendDocument",
+    "editMessageText",
+}
+WEBHOOK_RETRIES = 5
+
+
+def make_message_update(user_id, text, message_id=1):
+    """Builds a text message update.
+
+    Commands (text starting with ``/``) get a ``bot_command`` entity, as
+    Telegram would send them.
+
+    Args:
+        user_id (int): The Telegram user and private chat ID.
+        text (str): The message text.
+        message_id (int): The message ID.
+
+    Returns:
+        dict: The update without an ``update_id``.
+    """
+    message = {
+        "message_id": message_id,
+        "date": int(time.time()),
+        "chat": {"id": user_id, "type": "private"},
+        "from": {"id": user_id, "is_bot": False, "first_name": "User"},
+        "text": text,
+    }
+    if text.startswith("/"):
+        message["entities"] = [
+            {
+                "type": "bot_command",
+                "offset": 0,
+                "length": len(text.split()[0]),
+            }
+        ]
+    return {"message": message}
+
+
+def make_callback_update(user_id, data, message_id=1):
+    """Builds an inline keyboard button press update.
+
+    Args:
+        user_id (int): The Telegram user and private chat ID.
+        data (str): The callback data of the pressed button.
+        message_id (int): The ID of the message with the keyboard.
+
+    Returns:
+        dict: The update without an ``update_id``.
+    """
+    user = {"id": user_id, "is_bot": False, "first_name": "User"}
+    return {
+        "callback_query": {
+            "id": f"{user_id}-{message_id}-{data}",
+            "from": user,
+            "chat_instance": str(user_id),
+            "data": data,
+            "message": {
+                "message_id": message_id,
+                "date": int(time.time()),
+                "chat": {"id": user_id, "type": "private"},
+                "from": BOT_USER,
+                "text": "",
+            },
+        }
+    }
+
+
+class FakeTelegramServer:
+    """An in-process fake of the Telegram Bot API.
+
+    Attributes:
+        app (web.Application): The aiohttp application.
+        sent (list): The recorded bot requests that send messages, as
+            dicts with ``method``, ``params`` and monotonic ``time``.
+        webhook (dict): The webhook set by the bot, or None.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the server."""
+        self.app = web.Application()
+        self.app.router.add_route("*", "/bot{token}/{method}", self.handle)
+        self.app.router.add_post("/_fake/updates", self.handle_push)
+        self.app.router.add_get("/_fake/messages", self.handle_messages)
+        self.sent = []
+        self.webhook = None
+        self._update_ids = itertools.count(1)
+        self._message_ids = itertools.count(1)
+        self._pending = []
+        self._has_updates = asyncio.Condition()
+        self._deliveries = asyncio.Queue()
+        self._delivery_tasks = []
+        self._waiters = {}
+        self._runner = None
+
+    async def start(self, host="127.0.0.1", port=8081) -> None:
+        """Starts serving on the given address.
+
+        Args:
+            host (str): The host to listen on.
+            port (int): The port to listen on.
+        """
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        logger.info(f"Fake Telegram API listening on {host}:{port}")
+
+    async def stop(self) -> None:
+        """Stops the server and the webhook deliveries."""
+        self._stop_deliveries()
+        if self._runner:
+            await self._runner.cleanup()
+
+    async def push_update(self, update) -> int:
+        """Queues an update for the bot.
+
+        Args:
+            update (dict): The update without an ``update_id``.
+
+        Returns:
+            int: The assigned update ID.
+        """
+        update = {"update_id": next(self._update_ids), **update}
+        if self.webhook:
+            self._deliveries.put_nowait(update)
+        else:
+            async with self._has_updates:
+                self._pending.append(update)
+                self._has_updates.notify_all()
+        return update["update_id"]
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Handles a Bot API method call.
+
+        Args:
+            request (web.Request): The request from the bot.
+
+        Returns:
+            web.Response: The Bot API response.
+        """
+        method = request.match_info["method"]
+        params = dict(await request.post())
+        params.update(request.query)
+        handler = getattr(self, f"api_{method}", None)
+        if handler:
+            result = await handler(params)
+        elif method in MESSAGE_METHODS:
+            result = self.record_message(method, params)
+        else:
+            result = True
+        return web.json_response({"ok": True, "result": result})
+
+    async def handle_push(self, request: web.Request) -> web.Response:
+        """Queues the updates posted by a test.
+
+        Args:
+            request (web.Request): A request with an update or a list of
+                updates as JSON.
+
+        Returns:
+            web.Response: The assigned update IDs.
+        """
+        updates = await request.json()
+        if isinstance(updates, dict):
+            updates = [updates]
+        ids = [await self.push_update(update) for update in updates]
+        return web.json_response({"update_ids": ids})
+
+    async def handle_messages(self, request: web.Request) -> web.Response:
+        """Lists the messages sent by the bot.
+
+        Args:
+            request (web.Request): The request.
+
+        Returns:
+            web.Response: The recorded messages.
+        """
+        return web.json_response([
+            {"method": item["method"], "params": item["params"]}
+            for item in self.sent
+        ])
+
+    def wait_for_message(self, chat_id) -> asyncio.Future:
+        """Returns a future for the next message sent to a chat.
+
+        Args:
+            chat_id (int): The chat to wait on.
+
+        Returns:
+            asyncio.Future: Resolves to the recorded message.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(int(chat_id), []).append(future)
+        return future
+
+    def record_message(self, method, params) -> dict:
+        """Records a message sent by the bot.
+
+        Args:
+            method (str): The Bot API method.
+            params (dict): The method parameters.
+
+        Returns:
+            dict: The sent message as Telegram would return it.
+        """
+        record = {"method": method, "params": params, "time": time.monotonic()}
+        self.sent.append(record)
+        for future in self._waiters.pop(int(params.get("chat_id", 0)), []):
+            if not future.done():
+                future.set_result(record)
+        return {
+            "message_id": next(self._message_ids),
+            "date": int(time.time()),
+            "chat": {"id": int(params.get("chat_id", 0)), "type": "private"},
+            "from": BOT_USER,
+            "text": params.get("text", ""),
+        }
+
+    async def api_getMe(self, params) -> dict:
+        """Returns the fake bot user."""
+        return BOT_USER
+
+    async def api_getUpdates(self, params) -> list:
+        """Returns pending updates, waiting up to the long-poll timeout."""
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 100))
+        timeout = float(params.get("timeout", 0))
+        async with self._has_updates:
+            self._pending = [
+                item for item in self._pending if item["update_id"] >= offset
+            ]
+            if not self._pending and timeout:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._has_updates.wait(), min(timeout, 5)
+                    )
+            return self._pending[:limit]
+
+    async def api_setWebhook(self, params) -> bool:
+        """Stores the webhook and starts delivering updates to it."""
+        self._stop_deliveries()
+        self.webhook = {
+            "url": params["url"],
+            "secret_token": params.get("secret_token"),
+            "max_connections": int(params.get("max_connections", 40)),
+        }
+        for update in self._pending:
+            self._deliveries.put_nowait(update)
+        self._pending = []
+        self._delivery_tasks = [
+            asyncio.create_task(self._deliver())
+            for _ in range(self.webhook["max_connections"])
+        ]
+        return True
+
+    async def api_deleteWebhook(self, params) -> bool:
+        """Removes the webhook."""
+        self._stop_deliveries()
+        self.webhook = None
+        return True
+
+    async def api_getWebhookInfo(self, params) -> dict:
+        """Returns the webhook state."""
+        return {
+            "url": self.webhook["url"] if self.webhook else "",
+            "has_custom_certificate": False,
+            "pending_update_count": self._deliveries.qsize(),
+        }
+
+    async def _deliver(self) -> None:
+        headers = {}
+        if self.webhook["secret_token"]:
+            headers["X-Telegram-Bot-Api-Secret-Token"] = self.webhook[
+                "secret_token"
+            ]
+        async with ClientSession(timeout=ClientTimeout(total=60)) as session:
+            while True:
+                update = await self._deliveries.get()
+                for attempt in range(WEBHOOK_RETRIES):
+                    try:
+                        async with session.post(
+                            self.webhook["url"], json=update, headers=headers
+                        ) as response:
+                            if response.status < 400:
+                                break
+                    except OSError as e:
+                        logger.warning(f"Webhook delivery failed: {e}")
+                    await asyncio.sleep(0.1 * 2**attempt)
+                else:
+                    logger.error(f"Dropped update {update['update_id']}")
+
+    def _stop_deliveries(self) -> None:
+        for task in self._delivery_tasks:
+            task.cancel()
+        self._delivery_tasks = []
+
+
+async def serve(host, port) -> None:
+    """Runs the fake server until cancelled.
+
+    Args:
+        host (str): The host to listen on.
+        port (int): The port to listen on.
+    """
+    server = FakeTelegramServer()
+    await server.start(host, port)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main() -> None:
+    """Runs the fake server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+"""This module load-tests the bot dispatcher against local fakes.
+
+The bot built by ``main.create_dispatcher`` runs in-process against the
+fake Telegram Bot API, the stub StockTic API and a fake market data
+provider with a configurable latency, so the measurement covers the
+dispatcher, the handlers and the bot's own services but no external
+system. Simulated users run the ``/start``, ``/ticker_info`` and
+``/register_notification`` flows concurrently, each waiting for the
+bot's reply before sending the next update, as a real user would.
+
+The report lists the updates processed per second, the handler latency
+(from the dispatcher receiving an update to its handler returning), the
+reply latency per flow step (from the update being queued to the reply
+reaching the fake Telegram API) and the event loop lag. Run it with the
+same ``PYTHONPATH`` as the bot::
+
+    python -m telegram_bot.devtools.load_test --users 200 --rounds 3
+
+Classes:
+    FakeFinance: A fake market data provider with a fixed latency.
+    LoadStats: Collects the measurements of a load test.
+
+Functions:
+    percentiles: Summarizes latencies as percentiles.
+    simulate_user: Runs the flows of one simulated user.
+    run_load_test: Runs a load test and returns its measurements.
+    main: Runs a load test from the command line.
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import os
+import random
+import statistics
+import time
+from collections import defaultdict
+
+from telegram_bot.devtools.fake_telegram import (
+    FakeTelegramServer,
+    make_callback_update,
+    make_message_update,
+)
+from telegram_bot.devtools.stub_api import StubStockTicApi
+
+logger = logging.getLogger(__name__)
+
+FLOWS = {
+    "start": [
+        ("message", "/start"),
+        ("callback", "register_no"),
+    ],
+    "ticker_info": [
+        ("message", "/ticker_info"),
+        ("message", "{symbol}"),
+    ],
+    "register_notification": [
+        ("message", "/register_notification"),
+        ("message", "{symbol}"),
+        ("message", "{price}"),
+        ("callback", "more_than"),
+        ("callback", "telegram"),
+    ],
+}
+
+
+class FakeFinance:
+    """A fake market data provider with a fixed latency.
+
+    It replaces ``AsyncFinance`` in the reply renderers.
+
+    Attributes:
+        latency (float): The delay of every call, in seconds.
+        calls (int): The number of calls made.
+    """
+
+    latency = 0.2
+    calls = 0
+
+    def __init__(self, symbol, timeout=None) -> None:
+        """Initializes the provider for a symbol.
+
+        Args:
+            symbol (str): The ticker symbol.
+            timeout (float, optional): Ignored.
+        """
+        self.symbol = symbol
+
+    async def _fetch(self, value):
+        FakeFinance.calls += 1
+        await asyncio.sleep(self.latency)
+        return value
+
+    async def get_info(self) -> dict:
+        """Returns fixed company information."""
+        return await self._fetch({
+            "longName": f"{self.symbol} Holdings Inc.",
+            "sector": "Technology",
+            "industry": "Software",
+            "previousClose": 100.0,
+            "marketCap": 10**11,
+            "trailingPE": 25.0,
+            "trailingEps": 4.0,
+            "dividendYield": 1.0,
+            "beta": 1.1,
+        })
+
+    async def get_latest_price(self) -> float:
+        """Returns a fixed price."""
+        return await self._fetch(100.0)
+
+    async def get_news(self) -> list:
+        """Returns no news."""
+        return await self._fetch([])
+
+    @classmethod
+    async def get_latest_prices(cls, symbols, timeout=None) -> dict:
+        """Returns a fixed price for every symbol."""
+        return await cls(None)._fetch(dict.fromkeys(symbols, 100.0))
+
+
+class LoadStats:
+    """Collects the measurements of a load test.
+
+    Attributes:
+        handler_latencies (list): The handler latencies, in seconds.
+        reply_latencies (dict): The reply latencies by flow step, in
+            seconds.
+        loop_lags (list): The event loop lag samples, in seconds.
+        timeouts (int): The number of updates left without a reply.
+        errors (int): The number of updates whose handler raised.
+    """
+
+    def __init__(self) -> None:
+        """Initializes empty measurements."""
+        self.handler_latencies = []
+        self.reply_latencies = defaultdict(list)
+        self.loop_lags = []
+        self.timeouts = 0
+        self.errors = 0
+        self.started = self.finished = time.monotonic()
+
+    async def handler_timer(self, handler, event, data):
+        """Measures the handler latency, as a dispatcher outer
+        middleware.
+
+        Args:
+            handler (Callable): The next handler.
+            event (Update): The update.
+            data (dict): The handler data.
+
+        Returns:
+            Any: The result of the handler.
+        """
+        started = time.perf_counter()
+        try:
+            return await handler(event, data)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.handler_latencies.append(time.perf_counter() - started)
+
+    async def sample_loop_lag(self, interval=0.05) -> None:
+        """Samples the event loop lag until cancelled.
+
+        Args:
+            interval (float): The sampling interval, in seconds.
+        """
+        while True:
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            self.loop_lags.append(max(time.perf_counter() - expected, 0))
+
+    def report(self) -> str:
+        """Formats the measurements.
+
+        Returns:
+            str: The report.
+        """
+        elapsed = self.finished - self.started
+        updates = len(self.handler_latencies)
+        lines = [
+            f"Updates: {updates} in {elapsed:.2f}s "
+            f"({updates / elapsed:.1f}/s), "
+            f"{self.timeouts} without reply, {self.errors} errors",
+            f"{'handler':<32} {percentiles(self.handler_latencies)}",
+        ]
+        lines.extend(
+            f"{'reply ' + step:<32} {percentiles(latencies)}"
+            for step, latencies in sorted(self.reply_latencies.items())
+        )
+        lines.append(f"{'event loop lag':<32} {percentiles(self.loop_lags)}")
+        return "\n".join(lines)
+
+
+def percentiles(latencies) -> str:
+    """Summarizes latencies as percentiles.
+
+    Args:
+        latencies (list): The latencies, in seconds.
+
+    Returns:
+        str: The median, 95th and 99th percentiles and the maximum, in
+            milliseconds.
+    """
+    if len(latencies) < 2:
+        return "n/a"
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return (
+        f"p50 {statistics.median(latencies) * 1000:8.1f} ms  "
+        f"p95 {cuts[94] * 1000:8.1f} ms  "
+        f"p99 {cuts[98] * 1000:8.1f} ms  "
+        f"max {max(latencies) * 1000:8.1f} ms"
+    )
+
+
+async def simulate_user(telegram, stats, user_id, symbols, args) -> None:
+    """Runs the flows of one simulated user.
+
+    Args:
+        telegram (FakeTelegramServer): The fake Telegram API.
+        stats (LoadStats): The measurements to add to.
+        user_id (int): The Telegram user ID.
+        symbols (list): The ticker symbols to pick from.
+        args (argparse.Namespace): The load test options.
+    """
+    rng = random.Random(user_id)
+    message_ids = itertools.count(1)
+    for _ in range(args.rounds):
+        for flow, steps in FLOWS.items():
+            values = {
+                "symbol": rng.choice(symbols),
+                "price": f"{rng.uniform(10, 500):.2f}",
+            }
+            for index, (kind, payload) in enumerate(steps):
+                payload = payload.format(**values)
+                if kind == "message":
+                    update = make_message_update(
+                        user_id, payload, next(message_ids)
+                    )
+                else:
+                    update = make_callback_update(
+                        user_id, payload, next(message_ids)
+                    )
+                reply = telegram.wait_for_message(user_id)
+                started = time.monotonic()
+                await telegram.push_update(update)
+                try:
+                    record = await asyncio.wait_for(reply, args.timeout)
+                except TimeoutError:
+                    stats.timeouts += 1
+                    break
+                stats.reply_latencies[f"{flow}[{index}]"].append(
+                    record["time"] - started
+                )
+                if args.think_time:
+                    await asyncio.sleep(rng.expovariate(1 / args.think_time))
+
+
+async def run_load_test(args) -> LoadStats:
+    """Runs a load test and returns its measurements.
+
+    The bot modules read their settings on import, so they are imported
+    here, after the environment points them at the fakes.
+
+    Args:
+        args (argparse.Namespace): The load test options.
+
+    Returns:
+        LoadStats: The measurements.
+    """
+    os.environ.update(
+        TELEGRAM_BOT_TOKEN="123456:load-test",
+        TELEGRAM_API_URL=f"http://127.0.0.1:{args.telegram_port}",
+        API_BASE_URL=f"http://127.0.0.1:{args.api_port}",
+        BOT_MODE="polling",
+        DATA_ACCESS="http",
+    )
+    from bot_instance import bot
+    from main import create_dispatcher
+
+    from telegram_bot.services import replies
+
+    replies.AsyncFinance = FakeFinance
+    FakeFinance.latency = args.market_latency
+
+    symbols = [f"T{number:03d}" for number in range(args.symbols)]
+    telegram = FakeTelegramServer()
+    api = StubStockTicApi(symbols, latency=args.api_latency)
+    await telegram.start(port=args.telegram_port)
+    await api.start(port=args.api_port)
+
+    stats = LoadStats()
+    dp = create_dispatcher()
+    dp.update.outer_middleware(stats.handler_timer)
+    polling = asyncio.create_task(
+        dp.start_polling(bot, handle_signals=False, polling_timeout=5)
+    )
+    sampler = asyncio.create_task(stats.sample_loop_lag())
+    try:
+        await asyncio.sleep(0.5)
+        stats.started = time.monotonic()
+        await asyncio.gather(
+            *(
+                simulate_user(telegram, stats, 10_000 + user, symbols, args)
+                for user in range(args.users)
+            )
+        )
+        stats.finished = time.monotonic()
+    finally:
+        sampler.cancel()
+        await dp.stop_polling()
+        await polling
+        await api.stop()
+        await telegram.stop()
+    logger.info(
+        f"{api.requests} API requests, {FakeFinance.calls} market data calls"
+    )
+    return stats
+
+
+def main() -> None:
+    """Runs a load test from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--think-time", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--api-latency", type=float, default=0.01)
+    parser.add_argument("--market-latency", type=float, default=0.2)
+    parser.add_argument("--telegram-port", type=int, default=8081)
+    parser.add_argument("--api-port", type=int, default=8082)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    logger.setLevel(logging.INFO)
+    stats = asyncio.run(run_load_test(args))
+    print(stats.report())  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
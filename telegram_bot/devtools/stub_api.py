@@ -0,0 +1,220 @@
+"""This module provides an in-memory stub of the StockTic API.
+
+The stub implements the endpoints the bot calls, with the same paths and
+response shapes, so the bot can run without Django, a database or a
+market data provider. Every Telegram user is treated as registered, and
+an optional delay simulates the latency of the real API. Point the bot
+at it with ``API_BASE_URL=http://127.0.0.1:8082``.
+
+Classes:
+    StubStockTicApi: An in-memory stub of the StockTic API.
+
+Functions:
+    make_token: Builds an unsigned access token for a user.
+"""
+
+import asyncio
+import base64
+import itertools
+import json
+import logging
+import time
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+TOKEN_LIFETIME = 3600
+
+
+def make_token(user_id) -> str:
+    """Builds an unsigned access token for a user.
+
+    The bot only reads the claims of its tokens, so the signature is a
+    placeholder.
+
+    Args:
+        user_id (int): The StockTic user ID.
+
+    Returns:
+        str: A JWT carrying the ``user_id`` and ``exp`` claims.
+    """
+    claims = {"user_id": user_id, "exp": int(time.time()) + TOKEN_LIFETIME}
+    parts = [{"alg": "none", "typ": "JWT"}, claims]
+    encoded = [
+        base64.urlsafe_b64encode(json.dumps(part).encode()).rstrip(b"=")
+        for part in parts
+    ]
+    return b".".join([*encoded, b"stub"]).decode()
+
+
+class StubStockTicApi:
+    """An in-memory stub of the StockTic API.
+
+    The StockTic user ID of a Telegram user is the Telegram user ID.
+
+    Attributes:
+        app (web.Application): The aiohttp application.
+        tickers (dict): The tickers by symbol.
+        notifications (dict): The notifications by ID.
+        watchlists (dict): The watched ticker symbols by user ID.
+        latency (float): The delay added to every response, in seconds.
+        requests (int): The number of requests served.
+    """
+
+    def __init__(self, symbols, latency=0.0) -> None:
+        """Initializes the stub.
+
+        Args:
+            symbols (Iterable): The ticker symbols the stub knows.
+            latency (float): The delay added to every response, in
+                seconds.
+        """
+        self.tickers = {
+            symbol: {
+                "id": ticker_id,
+                "symbol": symbol,
+                "name": f"{symbol} Holdings Inc.",
+                "stock_exchange": "NASDAQ",
+                "last_sale": "$100.00",
+                "market_cap": f"{ticker_id}B",
+            }
+            for ticker_id, symbol in enumerate(symbols, start=1)
+        }
+        self.notifications = {}
+        self.watchlists = {}
+        self.latency = latency
+        self.requests = 0
+        self._notification_ids = itertools.count(1)
+        self._runner = None
+
+        self.app = web.Application(middlewares=[self._delay])
+        routes = self.app.router
+        routes.add_post("/token/by-telegram-id/", self.create_token)
+        routes.add_post("/users/", self.create_user)
+        routes.add_get("/users/me/", self.get_dashboard)
+        routes.add_get("/tickers/symbols/", self.list_symbols)
+        routes.add_get("/tickers/get_by_symbol/", self.get_ticker)
+        routes.add_post("/notifications/", self.create_notification)
+        routes.add_delete(
+            "/notifications/{notification_id}/", self.delete_notification
+        )
+        routes.add_get("/watchlists/me/", self.get_watchlist)
+        routes.add_patch("/watchlists/me/", self.update_watchlist)
+
+    async def start(self, host="127.0.0.1", port=8082) -> None:
+        """Starts serving on the given address.
+
+        Args:
+            host (str): The host to listen on.
+            port (int): The port to listen on.
+        """
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        logger.info(f"Stub StockTic API listening on {host}:{port}")
+
+    async def stop(self) -> None:
+        """Stops the server."""
+        if self._runner:
+            await self._runner.cleanup()
+
+    @web.middleware
+    async def _delay(self, request, handler):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    async def create_token(self, request: web.Request) -> web.Response:
+        """Issues an access token for a Telegram user."""
+        data = await request.json()
+        access = make_token(int(data["telegram_user_id"]))
+        return web.json_response({"access": access})
+
+    async def create_user(self, request: web.Request) -> web.Response:
+        """Accepts a user registration."""
+        data = await request.json()
+        data.pop("password", None)
+        return web.json_response(data, status=201)
+
+    async def get_dashboard(self, request: web.Request) -> web.Response:
+        """Returns the user with their notifications."""
+        user_id = self._user_id(request)
+        notifications = [
+            notification
+            for notification in self.notifications.values()
+            if notification["user"] == user_id
+        ]
+        return web.json_response({
+            "id": user_id,
+            "telegram_user_id": user_id,
+            "notifications": notifications,
+        })
+
+    async def list_symbols(self, request: web.Request) -> web.Response:
+        """Returns the compact ticker list."""
+        return web.json_response(
+            [
+                [ticker["symbol"], ticker["name"], ticker["market_cap"]]
+                for ticker in self.tickers.values()
+            ],
+            headers={"ETag": f'"{len(self.tickers)}"'},
+        )
+
+    async def get_ticker(self, request: web.Request) -> web.Response:
+        """Returns a ticker by its symbol."""
+        ticker = self.tickers.get(request.query.get("symbol", "").upper())
+        if ticker is None:
+            return web.json_response({"detail": "Not found."}, status=404)
+        return web.json_response(ticker)
+
+    async def create_notification(self, request: web.Request) -> web.Response:
+        """Creates a notification."""
+        data = await request.json()
+        ticker = next(
+            ticker
+            for ticker in self.tickers.values()
+            if ticker["id"] == data["ticker"]
+        )
+        notification = {
+            **data,
+            "id": next(self._notification_ids),
+            "ticker": ticker,
+        }
+        self.notifications[notification["id"]] = notification
+        return web.json_response(notification, status=201)
+
+    async def delete_notification(self, request: web.Request) -> web.Response:
+        """Deletes a notification."""
+        notification_id = int(request.match_info["notification_id"])
+        self.notifications.pop(notification_id, None)
+        return web.Response(status=204)
+
+    async def get_watchlist(self, request: web.Request) -> web.Response:
+        """Returns the watchlist of the user."""
+        user_id = self._user_id(request)
+        return web.json_response({
+            "tickers": self.watchlists.get(user_id, []),
+            "digest_enabled": True,
+            "last_digest": None,
+        })
+
+    async def update_watchlist(self, request: web.Request) -> web.Response:
+        """Replaces the watched tickers of the user."""
+        data = await request.json()
+        unknown = [
+            symbol for symbol in data["tickers"] if symbol not in self.tickers
+        ]
+        if unknown:
+            return web.json_response({"tickers": unknown}, status=400)
+        user_id = self._user_id(request)
+        self.watchlists[user_id] = list(dict.fromkeys(data["tickers"]))
+        return await self.get_watchlist(request)
+
+    @staticmethod
+    def _user_id(request) -> int:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload))["user_id"]
@@ -3,9 +3,13 @@ __all__ = (
     "ticker_router",
     "notification_router",
     "common_router",
+    "inline_router",
+    "watchlist_router",
 )
 
 from .common_handlers import common_router
+from .inline_handlers import inline_router
 from .notification_handlers import notification_router
 from .registration_handlers import registration_router
 from .ticker_handlers import ticker_router
+from .watchlist_handlers import watchlist_router
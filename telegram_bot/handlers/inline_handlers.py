@@ -0,0 +1,42 @@
+"""This module contains the inline query handler of the Telegram bot.
+
+Typing ``@bot <text>`` in any chat suggests matching ticker symbols from
+the in-process symbol index. Choosing a suggestion sends the bare symbol,
+so it also answers the bot's "Please provide a ticker symbol" prompts.
+
+Functions:
+    inline_symbol_search: Suggests ticker symbols for an inline query.
+"""
+
+from aiogram import Router, types
+
+from telegram_bot.services import SymbolIndex
+from telegram_bot.settings import BotSettings as settings
+
+inline_router = Router()
+
+
+@inline_router.inline_query()
+async def inline_symbol_search(
+    inline_query: types.InlineQuery, symbol_index: SymbolIndex
+) -> None:
+    """Suggests ticker symbols for an inline query.
+
+    Args:
+        inline_query (types.InlineQuery): The inline query from the user.
+        symbol_index (SymbolIndex): The symbol search index.
+    """
+    results = [
+        types.InlineQueryResultArticle(
+            id=symbol,
+            title=symbol,
+            description=name,
+            input_message_content=types.InputTextMessageContent(
+                message_text=symbol
+            ),
+        )
+        for symbol, name in symbol_index.search(inline_query.query)
+    ]
+    await inline_query.answer(
+        results, cache_time=settings.INLINE_CACHE_TIME, is_personal=False
+    )
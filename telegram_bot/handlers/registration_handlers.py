@@ -3,23 +3,21 @@ for the Telegram bot. It includes functions for initiating the registration
 process, processing user-provided email and telephone number, and verifying
 the collected information.
 
-The handlers use the aiogram library for Telegram bot interactions, httpx
-for making asynchronous HTTP requests to the StockTic API, and Django's
+The handlers use the aiogram library for Telegram bot interactions, the
+configured repository for reading and writing StockTic users, and Django's
 validators for validating email addresses.
 """
 
 import logging
 import re
 
-import httpx
 from aiogram import Router, types
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from django.core import validators
 from django.core.exceptions import ValidationError
 
-from telegram_bot.services.bot_service import get_jwt_token
-from telegram_bot.settings import BotSettings as settings
+from telegram_bot.repositories import RepositoryError, get_repository
 from telegram_bot.states import RegistrationStates
 
 logging.basicConfig(level=logging.INFO)
@@ -38,10 +36,13 @@ async def cmd_register(message: types.Message, state: FSMContext) -> None:
     """
     telegram_user_id = message.from_user.id
 
-    # Check if the user is already registered by attempting to get a JWT token
-    token = await get_jwt_token(telegram_user_id)
+    try:
+        session = await get_repository().get_session(telegram_user_id)
+    except RepositoryError as e:
+        await message.answer(f"An error occurred: {e}")
+        return
 
-    if token:
+    if session:
         # User is already registered
         await message.answer("You are already registered.")
         return
@@ -111,58 +112,33 @@ async def process_verification(
         data = await state.get_data()
         logger.info("Collected data from state: %s", data)
 
-        async with httpx.AsyncClient() as client:
-            try:
-                logger.info(
-                    "Sending POST request to %s",
-                    f"{settings.API_BASE_URL}/users/",
-                )
-
-                response = await client.post(
-                    f"{settings.API_BASE_URL}/users/",
-                    json={
-                        "email": data["email"],
-                        "telephone": data["telephone"],
-                        "telegram_user_id": message.from_user.id,
-                        "password": "defaultpassword",
-                    },
-                )
-
-                logger.info("Received response: %s", response.status_code)
-
-                if response.status_code == 201:
-                    logger.info("User registration successful")
-                    await message.answer(
-                        f"Registration successful! "
-                        f"Welcome {message.from_user.full_name}!"
-                    )
-                    await state.clear()
-                elif response.status_code == 400:
-                    logger.info("Email already registered")
-                    await message.answer(
-                        "This email is already registered. "
-                        "Please try with a different email."
-                    )
-                    await state.clear()
-                else:
-                    logger.error(
-                        "Unexpected response: %s", response.status_code
-                    )
-                    await message.answer(
-                        "An error occurred. Please try again later."
-                    )
-
-            except httpx.RequestError as e:
-                logger.error("Request error occurred: %s", e)
-                await message.answer(f"Request error occurred: {e}")
-
-            except httpx.HTTPError as e:
-                logger.error("HTTP error occurred: %s", e)
-                await message.answer(f"HTTP error occurred: {e}")
+        try:
+            created = await get_repository().create_user(
+                email=data["email"],
+                telephone=data["telephone"],
+                telegram_user_id=message.from_user.id,
+            )
+        except RepositoryError as e:
+            logger.error("Registration failed: %s", e)
+            await message.answer("An error occurred. Please try again later.")
+            return
+
+        if created:
+            logger.info("User registration successful")
+            await message.answer(
+                f"Registration successful! "
+                f"Welcome {message.from_user.full_name}!"
+            )
+        else:
+            logger.info("Email already registered")
+            await message.answer(
+                "This email is already registered. "
+                "Please try with a different email."
+            )
+        await state.clear()
     else:
         logger.info("User cancelled the registration process")
         await state.clear()
         await message.answer(
-            "Registration cancelled. "
-            "You can start over by typing /register."
+            "Registration cancelled. You can start over by typing /register."
         )
@@ -3,24 +3,32 @@ for the Telegram bot. It includes functions for retrieving ticker information,
 latest price, and news related to a ticker symbol.
 
 The handlers use the aiogram library for Telegram bot interactions and
-custom utilities for formatting and financial data retrieval.
+custom utilities for formatting and financial data retrieval. Market data
+is fetched through AsyncFinance, so a slow yfinance call only occupies a
+worker thread and never blocks updates from other users. Rendered replies
+are cached per command and symbol, see ``telegram_bot.services.replies``.
+``/compare`` fetches the data of several tickers concurrently and renders
+it as one table.
 """
 
 import re
-from datetime import datetime
 
-import pytz
 from aiogram import Router, types
-from aiogram.filters import Command
+from aiogram.filters import Command, CommandObject
 from aiogram.fsm.context import FSMContext
-from custom_utils.utils import format_market_cap
-from tickers.services import Finance
 
+from telegram_bot.services import OutgoingMessageQueue, get_reply
+from telegram_bot.services.replies import (
+    normalize_symbol,
+    render_comparison,
+)
 from telegram_bot.settings import BotSettings as settings
 from telegram_bot.states import TickerStates
 
 ticker_router = Router()
 
+SYMBOL_RE = re.compile(r"^[A-Z0-9][A-Z0-9.\-^=]{0,14}$")
+
 
 @ticker_router.message(Command("ticker_info"))
 async def cmd_ticker_info(message: types.Message, state: FSMContext) -> None:
@@ -34,7 +42,9 @@ async def cmd_ticker_info(message: types.Message, state: FSMContext) -> None:
     await message.answer("Please provide a ticker symbol:")
 
 
-@ticker_router.message(TickerStates.waiting_for_ticker_info)
+@ticker_router.message(
+    TickerStates.waiting_for_ticker_info, flags={"throttle": "ticker_info"}
+)
 async def process_ticker_info(
     message: types.Message, state: FSMContext
 ) -> None:
@@ -44,29 +54,9 @@ async def process_ticker_info(
         message (types.Message): The message object from the user.
         state (FSMContext): The finite state machine context.
     """
-    ticker = message.text.upper()
-    finance = Finance(ticker)
-    info = finance.get_info()
-    if info:
-        try:
-            info["marketCap"] = format_market_cap(
-                int(info.get("marketCap", "N/A"))
-            )
-        except ValueError:
-            info["marketCap"] = "N/A"
-        response = (
-            f"Ticker Information for {ticker}:\n"
-            f"Name: {info.get('longName', 'N/A')}\n"
-            f"Sector: {info.get('sector', 'N/A')}\n"
-            f"Industry: {info.get('industry', 'N/A')}\n"
-            f"Price: {info.get('previousClose', 'N/A')}\n"
-            f"Market Cap: {info.get('marketCap')}\n"
-            f"PE Ratio: {finance.get_pe_ratio()}\n"
-            f"EPS: {finance.get_eps()}\n"
-            f"Dividend Yield: {finance.get_dividend_yield()}\n"
-            f"Beta: {finance.get_beta()}\n"
-        )
-    else:
+    ticker = normalize_symbol(message.text)
+    response = await get_reply("ticker_info", ticker)
+    if response is None:
         response = f"Could not retrieve information for ticker {ticker}."
 
     await message.answer(response)
@@ -85,7 +75,9 @@ async def cmd_latest_price(message: types.Message, state: FSMContext) -> None:
     await message.answer("Please provide a ticker symbol:")
 
 
-@ticker_router.message(TickerStates.waiting_for_latest_price)
+@ticker_router.message(
+    TickerStates.waiting_for_latest_price, flags={"throttle": "latest_price"}
+)
 async def process_latest_price(
     message: types.Message, state: FSMContext
 ) -> None:
@@ -95,12 +87,9 @@ async def process_latest_price(
         message (types.Message): The message object from the user.
         state (FSMContext): The finite state machine context.
     """
-    ticker = message.text.upper()
-    finance = Finance(ticker)
-    latest_price = finance.get_latest_price()
-    if latest_price is not None:
-        response = f"The latest price for {ticker} is ${latest_price:.2f}."
-    else:
+    ticker = normalize_symbol(message.text)
+    response = await get_reply("latest_price", ticker)
+    if response is None:
         response = f"Could not retrieve the latest price for ticker {ticker}."
 
     await message.answer(response)
@@ -124,40 +113,66 @@ async def request_ticker_for_news(
     await state.set_state(TickerStates.waiting_for_ticker_news)
 
 
-@ticker_router.message(TickerStates.waiting_for_ticker_news)
-async def fetch_news(message: types.Message, state: FSMContext) -> None:
+@ticker_router.message(
+    TickerStates.waiting_for_ticker_news, flags={"throttle": "news"}
+)
+async def fetch_news(
+    message: types.Message,
+    state: FSMContext,
+    message_queue: OutgoingMessageQueue,
+) -> None:
     """Fetches the latest news for the provided ticker symbol.
 
+    Articles are sent through the outgoing message queue, which merges
+    them into as few messages as possible and paces them within
+    Telegram's rate limits.
+
     Args:
         message (types.Message): The message object from the user.
         state (FSMContext): The finite state machine context.
+        message_queue (OutgoingMessageQueue): The outgoing message queue.
     """
-    symbol = message.text.strip().upper()
-    finance = Finance(symbol)
-    news = finance.get_news()
-
-    if news:
-        await message.answer(f"Latest news for {symbol}:")
-        for article in news:  # Limit to the top 5 articles
-            related_tickers = " ".join(
-                [
-                    "#" + re.sub(r"[^a-zA-Z]", "", ticker.lower())
-                    for ticker in article["relatedTickers"]
-                ]
-            )
-            timestamp = article["providerPublishTime"]
-            dt = datetime.fromtimestamp(timestamp, pytz.utc)
-            formatted_time = dt.astimezone(
-                pytz.timezone(settings.TIME_ZONE)
-            ).strftime("%d-%b-%Y %H:%M (%Z)")
-            response = (
-                f"Title: {article['title']}\n"
-                f"Published: {formatted_time}\n"
-                f"Link: {article['link']}\n\n"
-                f"Related Tickers: {related_tickers}\n"
-            )
-            await message.answer(response)
+    symbol = normalize_symbol(message.text)
+    replies = await get_reply("news", symbol)
+
+    if replies:
+        for reply in replies:
+            message_queue.send(message.chat.id, reply)
     else:
         await message.answer(f"No news found for {symbol}.")
 
     await state.clear()
+
+
+@ticker_router.message(Command("compare"), flags={"throttle": "compare"})
+async def cmd_compare(message: types.Message, command: CommandObject) -> None:
+    """Compares the key metrics of several tickers in one table.
+
+    Usage: ``/compare AAPL MSFT NVDA``.
+
+    Args:
+        message (types.Message): The message object from the user.
+        command (CommandObject): The parsed command with its arguments.
+    """
+    symbols = list(
+        dict.fromkeys(re.split(r"[\s,]+", (command.args or "").upper()))
+    )
+    symbols = [symbol for symbol in symbols if symbol]
+    invalid = [symbol for symbol in symbols if not SYMBOL_RE.match(symbol)]
+    if len(symbols) < 2 or invalid:
+        await message.answer(
+            "Please provide two or more ticker symbols, "
+            "e.g. /compare AAPL MSFT NVDA"
+        )
+        return
+    if len(symbols) > settings.COMPARE_MAX_SYMBOLS:
+        await message.answer(
+            f"Please compare at most {settings.COMPARE_MAX_SYMBOLS} "
+            "tickers at once."
+        )
+        return
+
+    response = await render_comparison(symbols)
+    if response is None:
+        response = "Could not retrieve data for these tickers."
+    await message.answer(response)
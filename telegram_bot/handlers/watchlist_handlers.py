@@ -0,0 +1,155 @@
+"""This module contains the watchlist handlers of the Telegram bot.
+
+Users add tickers with ``/watch``, remove them with ``/unwatch`` and
+list them with ``/watchlist``. Watched tickers are summarised in a daily
+digest sent by the StockTic task queue.
+
+Functions:
+    parse_symbols: Parses the ticker symbols of a command.
+    format_watchlist: Formats the watched tickers for a reply.
+    cmd_watchlist: Lists the watched tickers.
+    cmd_watch: Adds tickers to the watchlist.
+    cmd_unwatch: Removes tickers from the watchlist.
+"""
+
+import logging
+import re
+
+from aiogram import Router, types
+from aiogram.filters import Command, CommandObject
+from aiogram.fsm.context import FSMContext
+
+from telegram_bot.repositories import RepositoryError, get_repository
+from telegram_bot.services import SymbolIndex
+from telegram_bot.services.decorators import require_registration
+
+watchlist_router = Router()
+logger = logging.getLogger(__name__)
+
+
+def parse_symbols(command: CommandObject) -> list:
+    """Parses the ticker symbols of a command.
+
+    Args:
+        command (CommandObject): The parsed command with its arguments.
+
+    Returns:
+        list: The upper-cased symbols without duplicates, in order.
+    """
+    symbols = re.split(r"[\s,]+", (command.args or "").upper())
+    return list(dict.fromkeys(symbol for symbol in symbols if symbol))
+
+
+def format_watchlist(symbols) -> str:
+    """Formats the watched tickers for a reply.
+
+    Args:
+        symbols (list): The watched ticker symbols.
+
+    Returns:
+        str: The reply.
+    """
+    if not symbols:
+        return "Your watchlist is empty. Add tickers with /watch AAPL MSFT"
+    return "Your watchlist: " + ", ".join(sorted(symbols))
+
+
+@watchlist_router.message(Command("watchlist"))
+@require_registration
+async def cmd_watchlist(
+    message: types.Message, state: FSMContext, session: dict
+) -> None:
+    """Lists the watched tickers.
+
+    Args:
+        message (types.Message): The message object from the user.
+        state (FSMContext): The finite state machine context.
+        session (dict): The session of the user.
+    """
+    try:
+        symbols = await get_repository().get_watchlist(session)
+    except RepositoryError as e:
+        logger.error(f"Failed to load watchlist: {e}")
+        await message.answer("An error occurred. Please try again later.")
+        return
+    await message.answer(format_watchlist(symbols))
+
+
+@watchlist_router.message(Command("watch"))
+@require_registration
+async def cmd_watch(
+    message: types.Message,
+    state: FSMContext,
+    command: CommandObject,
+    symbol_index: SymbolIndex,
+    session: dict,
+) -> None:
+    """Adds tickers to the watchlist.
+
+    Args:
+        message (types.Message): The message object from the user.
+        state (FSMContext): The finite state machine context.
+        command (CommandObject): The parsed command with its arguments.
+        symbol_index (SymbolIndex): The symbol search index.
+        session (dict): The session of the user.
+    """
+    symbols = parse_symbols(command)
+    if not symbols:
+        await message.answer("Usage: /watch AAPL MSFT")
+        return
+    unknown = [symbol for symbol in symbols if symbol not in symbol_index]
+    if len(symbol_index) and unknown:
+        await message.answer(f"Unknown ticker symbols: {', '.join(unknown)}")
+        return
+
+    repository = get_repository()
+    try:
+        watched = await repository.get_watchlist(session)
+        updated = await repository.set_watchlist(
+            session, list(dict.fromkeys([*watched, *symbols]))
+        )
+    except RepositoryError as e:
+        logger.error(f"Failed to update watchlist: {e}")
+        await message.answer("An error occurred. Please try again later.")
+        return
+    if updated is None:
+        await message.answer(
+            "Could not update your watchlist. Please check the ticker "
+            "symbols and the size of your watchlist."
+        )
+        return
+    await message.answer(format_watchlist(updated))
+
+
+@watchlist_router.message(Command("unwatch"))
+@require_registration
+async def cmd_unwatch(
+    message: types.Message,
+    state: FSMContext,
+    command: CommandObject,
+    session: dict,
+) -> None:
+    """Removes tickers from the watchlist.
+
+    Args:
+        message (types.Message): The message object from the user.
+        state (FSMContext): The finite state machine context.
+        command (CommandObject): The parsed command with its arguments.
+        session (dict): The session of the user.
+    """
+    symbols = parse_symbols(command)
+    if not symbols:
+        await message.answer("Usage: /unwatch AAPL")
+        return
+
+    repository = get_repository()
+    try:
+        watched = await repository.get_watchlist(session)
+        updated = await repository.set_watchlist(
+            session, [symbol for symbol in watched if symbol not in symbols]
+        )
+    except RepositoryError as e:
+        logger.error(f"Failed to update watchlist: {e}")
+        await message.answer("An error occurred. Please try again later.")
+        return
+    await message.answer(format_watchlist(updated or []))
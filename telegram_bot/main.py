@@ -2,25 +2,41 @@
 
 Functions:
     register_routers: Registers routers to the dispatcher.
+    create_dispatcher: Creates the dispatcher with its services.
     main: Main function to run the bot with dispatcher and start
-        polling updates from Telegram.
+        receiving updates from Telegram.
 """
 
 import asyncio
 import logging
 
 from aiogram import Dispatcher
-from aiogram.fsm.storage.memory import MemoryStorage
 from bot_config import BotConfig
 from bot_instance import bot
 from handlers import (
     common_router,
+    inline_router,
     notification_router,
     registration_router,
     ticker_router,
+    watchlist_router,
 )
+from tickers.services import AsyncFinance
 
-from telegram_bot.services import start_bot
+from telegram_bot.repositories import close_repository, init_repository
+from telegram_bot.services import (
+    BotMetrics,
+    OutgoingMessageQueue,
+    SymbolIndex,
+    ThrottlingMiddleware,
+    close_api_client,
+    create_events_isolation,
+    create_fsm_storage,
+    init_api_client,
+    start_bot,
+    start_webhook,
+)
+from telegram_bot.settings import BotSettings as settings
 
 logging.basicConfig(level=logging.INFO)
 
@@ -35,24 +51,64 @@ def register_routers(dp: Dispatcher) -> None:
     dp.include_router(registration_router)
     dp.include_router(ticker_router)
     dp.include_router(notification_router)
+    dp.include_router(inline_router)
+    dp.include_router(watchlist_router)
 
 
-async def main() -> None:
-    """Main function to run the bot with dispatcher and start polling
-    updates from Telegram.
+def create_dispatcher() -> Dispatcher:
+    """Creates the dispatcher with its routers and services.
+
+    Returns:
+        Dispatcher: The dispatcher, with the services started and stopped
+            by its startup and shutdown hooks.
     """
     config = BotConfig(
         admin_ids=[463092387],
         welcome_message="Welcome to the bot! 🤖",
     )
 
-    dp = Dispatcher(storage=MemoryStorage())
+    storage = create_fsm_storage()
+    dp = Dispatcher(
+        storage=storage, events_isolation=create_events_isolation(storage)
+    )
     dp["config"] = config
 
+    message_queue = OutgoingMessageQueue(bot)
+    dp["message_queue"] = message_queue
+    symbol_index = SymbolIndex()
+    dp["symbol_index"] = symbol_index
+
     register_routers(dp)
+    if settings.METRICS_ENABLED:
+        BotMetrics().install(dp)
+    if settings.THROTTLE_ENABLED:
+        ThrottlingMiddleware().install(dp)
+    dp.startup.register(init_repository)
+    dp.startup.register(message_queue.start)
+    dp.startup.register(symbol_index.start)
+    dp.shutdown.register(close_api_client)
+    dp.shutdown.register(close_repository)
+    dp.shutdown.register(message_queue.stop)
+    dp.shutdown.register(symbol_index.stop)
+    return dp
+
+
+async def main() -> None:
+    """Main function to run the bot with dispatcher and start receiving
+    updates from Telegram.
+
+    Updates are received by long polling or, when ``BOT_MODE`` is
+    ``webhook``, by the webhook server.
+    """
+    AsyncFinance.set_max_workers(settings.MARKET_DATA_MAX_WORKERS)
+    init_api_client()
+    dp = create_dispatcher()
 
     try:
-        await start_bot(dp, bot)
+        if settings.BOT_MODE == "webhook":
+            await start_webhook(dp, bot)
+        else:
+            await start_bot(dp, bot)
     except Exception as e:
         logging.error(f"An error occurred: {e}")
 
@@ -0,0 +1,18 @@
+__all__ = [
+    "BaseRepository",
+    "HttpRepository",
+    "RepositoryError",
+    "close_repository",
+    "create_repository",
+    "get_repository",
+    "init_repository",
+]
+
+from .base import BaseRepository, RepositoryError
+from .factory import (
+    close_repository,
+    create_repository,
+    get_repository,
+    init_repository,
+)
+from .http_repository import HttpRepository
@@ -0,0 +1,152 @@
+"""This module defines the data access interface of the Telegram bot.
+
+Handlers read and write StockTic users, tickers and notifications
+through a repository, so the same handlers work whether the data is
+reached over the HTTP API or directly through the Django ORM.
+
+A session is the mapping ``require_registration`` resolves for every
+update and hands to the handler: it carries the StockTic ``user_id``
+and, for the HTTP repository, the access ``token``.
+
+Classes:
+    RepositoryError: Raised when the data source cannot be reached.
+    BaseRepository: The data access interface of the bot.
+"""
+
+from abc import ABC, abstractmethod
+from decimal import Decimal
+
+
+class RepositoryError(Exception):
+    """Raised when the data source cannot be reached or fails."""
+
+
+class BaseRepository(ABC):
+    """The data access interface of the bot."""
+
+    async def start(self) -> None:
+        """Acquires the resources of the repository on bot startup."""
+
+    async def close(self) -> None:
+        """Releases the resources of the repository on bot shutdown."""
+
+    @abstractmethod
+    async def get_session(self, telegram_user_id) -> dict | None:
+        """Returns the session of a Telegram user.
+
+        Args:
+            telegram_user_id (int): The Telegram user ID.
+
+        Returns:
+            dict: The ``user_id`` and ``token`` of the user, or None if the
+                user is not registered.
+        """
+
+    @abstractmethod
+    async def create_user(self, email, telephone, telegram_user_id) -> bool:
+        """Registers a user.
+
+        Args:
+            email (str): The email address.
+            telephone (str): The telephone number.
+            telegram_user_id (int): The Telegram user ID.
+
+        Returns:
+            bool: True if the user has been created, False if the email
+                address is already registered.
+        """
+
+    @abstractmethod
+    async def get_ticker(self, session, symbol) -> dict | None:
+        """Returns a ticker by its symbol.
+
+        Args:
+            session (dict): The session of the user.
+            symbol (str): The ticker symbol.
+
+        Returns:
+            dict: The ``id``, ``symbol`` and ``name`` of the ticker, or None
+                if it does not exist.
+        """
+
+    @abstractmethod
+    async def create_notification(
+        self, session, ticker_id, value, notification_type, criteria
+    ) -> None:
+        """Creates a price notification for the user.
+
+        Args:
+            session (dict): The session of the user.
+            ticker_id (int): The ID of the ticker.
+            value (float): The price threshold.
+            notification_type (str): ``email``, ``telegram`` or ``all``.
+            criteria (str): ``more_than`` or ``less_than``.
+        """
+
+    @abstractmethod
+    async def get_dashboard(self, session) -> dict:
+        """Returns the user with their notifications and tickers.
+
+        Args:
+            session (dict): The session of the user.
+
+        Returns:
+            dict: The user data in the shape of the ``/users/me/``
+                endpoint.
+        """
+
+    async def find_notification(self, session, ticker_id, value):
+        """Finds a notification of the user by ticker and value.
+
+        Args:
+            session (dict): The session of the user.
+            ticker_id (int): The ID of the ticker.
+            value (float): The price threshold.
+
+        Returns:
+            dict: The notification, or None if there is no match.
+        """
+        dashboard = await self.get_dashboard(session)
+        return next(
+            (
+                notification
+                for notification in dashboard["notifications"]
+                if notification["ticker"]["id"] == ticker_id
+                and Decimal(str(notification["notification_value"]))
+                == Decimal(str(value))
+            ),
+            None,
+        )
+
+    @abstractmethod
+    async def delete_notification(self, session, notification_id) -> None:
+        """Deletes a notification of the user.
+
+        Args:
+            session (dict): The session of the user.
+            notification_id (int): The ID of the notification.
+        """
+
+    @abstractmethod
+    async def get_watchlist(self, session) -> list:
+        """Returns the watched ticker symbols of the user.
+
+        Args:
+            session (dict): The session of the user.
+
+        Returns:
+            list: The watched ticker symbols.
+        """
+
+    @abstractmethod
+    async def set_watchlist(self, session, symbols) -> list | None:
+        """Replaces the watched ticker symbols of the user.
+
+        Args:
+            session (dict): The session of the user.
+            symbols (list): The ticker symbols to watch.
+
+        Returns:
+            list: The watched ticker symbols, or None if the symbols were
+                rejected because one does not exist or there are too many.
+        """
@@ -0,0 +1,67 @@
+"""This module selects the data access mode of the Telegram bot.
+
+``DATA_ACCESS=http`` (the default) goes through the StockTic API, while
+``DATA_ACCESS=orm`` queries the database in-process. The ORM repository
+is imported only when selected, so the HTTP mode does not need database
+access or a configured Django project.
+
+Functions:
+    create_repository: Creates the configured repository.
+    init_repository: Creates the shared repository on bot startup.
+    get_repository: Returns the shared repository.
+    close_repository: Releases the shared repository on bot shutdown.
+"""
+
+import logging
+
+from telegram_bot.repositories.base import BaseRepository
+from telegram_bot.repositories.http_repository import HttpRepository
+from telegram_bot.settings import BotSettings as settings
+
+logger = logging.getLogger(__name__)
+
+_repository: BaseRepository | None = None
+
+
+def create_repository() -> BaseRepository:
+    """Creates the configured repository.
+
+    Returns:
+        BaseRepository: The ORM repository if ``DATA_ACCESS`` is ``orm``,
+            otherwise the HTTP repository.
+    """
+    if settings.DATA_ACCESS == "orm":
+        from telegram_bot.repositories.orm_repository import OrmRepository
+
+        return OrmRepository()
+    return HttpRepository()
+
+
+async def init_repository() -> None:
+    """Creates the shared repository on bot startup."""
+    global _repository
+    if _repository is None:
+        _repository = create_repository()
+        await _repository.start()
+        logger.info(f"Using {settings.DATA_ACCESS} data access")
+
+
+def get_repository() -> BaseRepository:
+    """Returns the shared repository, creating it if the bot has not
+    started.
+
+    Returns:
+        BaseRepository: The shared repository.
+    """
+    global _repository
+    if _repository is None:
+        _repository = create_repository()
+    return _repository
+
+
+async def close_repository() -> None:
+    """Releases the shared repository on bot shutdown."""
+    global _repository
+    if _repository is not None:
+        await _repository.close()
+        _repository = None
@@ -0,0 +1,191 @@
+"""This module provides the HTTP repository of the Telegram bot.
+
+Every operation is a request to the StockTic API through the shared,
+pooled API client, authenticated with the cached access token of the
+user.
+
+Classes:
+    HttpRepository: Reads and writes bot data through the StockTic API.
+"""
+
+import httpx
+
+from telegram_bot.repositories.base import BaseRepository, RepositoryError
+from telegram_bot.services.api_client import get_api_client
+from telegram_bot.services.bot_service import get_session
+from telegram_bot.settings import BotSettings as settings
+
+
+def auth_headers(session) -> dict:
+    """Builds the authorization headers for a session.
+
+    Args:
+        session (dict): The session of the user.
+
+    Returns:
+        dict: The headers carrying the access token.
+    """
+    return {"Authorization": f"Bearer {session['token']}"}
+
+
+class HttpRepository(BaseRepository):
+    """Reads and writes bot data through the StockTic API."""
+
+    async def get_session(self, telegram_user_id) -> dict | None:
+        """Returns the cached session of a Telegram user.
+
+        Args:
+            telegram_user_id (int): The Telegram user ID.
+
+        Returns:
+            dict: The ``user_id`` and ``token`` of the user, or None if the
+                user is not registered.
+        """
+        try:
+            return await get_session(telegram_user_id)
+        except httpx.HTTPError as e:
+            raise RepositoryError(str(e)) from e
+
+    async def create_user(self, email, telephone, telegram_user_id) -> bool:
+        """Registers a user through the API.
+
+        Args:
+            email (str): The email address.
+            telephone (str): The telephone number.
+            telegram_user_id (int): The Telegram user ID.
+
+        Returns:
+            bool: True if the user has been created, False if the email
+                address is already registered.
+        """
+        response = await self._request(
+            "post",
+            "/users/",
+            json={
+                "email": email,
+                "telephone": telephone,
+                "telegram_user_id": telegram_user_id,
+                "password": "defaultpassword",
+            },
+            allow={400},
+        )
+        return response.status_code == 201
+
+    async def get_ticker(self, session, symbol) -> dict | None:
+        """Returns a ticker by its symbol.
+
+        Args:
+            session (dict): The session of the user.
+            symbol (str): The ticker symbol.
+
+        Returns:
+            dict: The ticker, or None if it does not exist.
+        """
+        response = await self._request(
+            "get",
+            "/tickers/get_by_symbol/",
+            params={"symbol": symbol},
+            headers=auth_headers(session),
+            allow={404},
+        )
+        return response.json() if response.status_code == 200 else None
+
+    async def create_notification(
+        self, session, ticker_id, value, notification_type, criteria
+    ) -> None:
+        """Creates a price notification for the user.
+
+        Args:
+            session (dict): The session of the user.
+            ticker_id (int): The ID of the ticker.
+            value (float): The price threshold.
+            notification_type (str): ``email``, ``telegram`` or ``all``.
+            criteria (str): ``more_than`` or ``less_than``.
+        """
+        await self._request(
+            "post",
+            "/notifications/",
+            json={
+                "user": session["user_id"],
+                "ticker": ticker_id,
+                "notification_value": value,
+                "notification_type": notification_type,
+                "notification_criteria": criteria,
+            },
+            headers=auth_headers(session),
+        )
+
+    async def get_dashboard(self, session) -> dict:
+        """Returns the user with their notifications and tickers.
+
+        Args:
+            session (dict): The session of the user.
+
+        Returns:
+            dict: The response of the ``/users/me/`` endpoint.
+        """
+        response = await self._request(
+            "get", "/users/me/", headers=auth_headers(session)
+        )
+        return response.json()
+
+    async def delete_notification(self, session, notification_id) -> None:
+        """Deletes a notification of the user.
+
+        Args:
+            session (dict): The session of the user.
+            notification_id (int): The ID of the notification.
+        """
+        await self._request(
+            "delete",
+            f"/notifications/{notification_id}/",
+            headers=auth_headers(session),
+        )
+
+    async def get_watchlist(self, session) -> list:
+        """Returns the watched ticker symbols of the user.
+
+        Args:
+            session (dict): The session of the user.
+
+        Returns:
+            list: The watched ticker symbols.
+        """
+        response = await self._request(
+            "get", "/watchlists/me/", headers=auth_headers(session)
+        )
+        return response.json()["tickers"]
+
+    async def set_watchlist(self, session, symbols) -> list | None:
+        """Replaces the watched ticker symbols of the user.
+
+        Args:
+            session (dict): The session of the user.
+            symbols (list): The ticker symbols to watch.
+
+        Returns:
+            list: The watched ticker symbols, or None if the API rejected
+                them.
+        """
+        response = await self._request(
+            "patch",
+            "/watchlists/me/",
+            json={"tickers": symbols},
+            headers=auth_headers(session),
+            allow={400},
+        )
+        if response.status_code == 400:
+            return None
+        return response.json()["tickers"]
+
+    @staticmethod
+    async def _request(method, path, allow=(), **kwargs) -> httpx.Response:
+        try:
+            response = await get_api_client().request(
+                method, f"{settings.API_BASE_URL}{path}", **kwargs
+            )
+            if response.status_code not in allow:
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise RepositoryError(str(e)) from e
+        return response
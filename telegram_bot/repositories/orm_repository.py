@@ -0,0 +1,272 @@
+"""This module provides the ORM repository of the Telegram bot.
+
+The bot runs from the same repository as the Django project, so instead
+of calling the API it can query the database directly: no HTTP round
+trip, JSON encoding or token minting per command. The synchronous ORM
+calls run through ``sync_to_async`` on a dedicated thread pool, so
+several queries run at once without blocking the event loop. Each
+thread keeps its connection open for ``DATABASE_CONN_MAX_AGE`` seconds,
+and after each call only an expired or broken connection is closed.
+With ``DATABASE_POOL`` enabled in the Django settings, the connection is
+returned to the psycopg pool after each call instead.
+
+Table version stamps used for ETags live in the Django cache, so other
+processes only see the bot's writes when ``CACHE_URL`` points to a
+shared cache.
+
+Classes:
+    OrmRepository: Reads and writes bot data through the Django ORM.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+
+os.environ.setdefault(
+    "DJANGO_SETTINGS_MODULE", f"config.{os.getenv('ENV_NAME', 'dev')}"
+)
+django.setup()
+
+from asgiref.sync import sync_to_async  # noqa: E402
+from django.db import DatabaseError, close_old_connections  # noqa: E402
+from django.db.models import Prefetch  # noqa: E402
+from notifications.models import Notification  # noqa: E402
+from tickers.models import Ticker  # noqa: E402
+from users.models import User  # noqa: E402
+from users.serializers import UserDashboardSerializer  # noqa: E402
+from watchlists.models import Watchlist  # noqa: E402
+from watchlists.serializers import WatchlistSerializer  # noqa: E402
+
+from telegram_bot.repositories.base import (  # noqa: E402
+    BaseRepository,
+    RepositoryError,
+)
+from telegram_bot.settings import BotSettings as settings  # noqa: E402
+
+
+class OrmRepository(BaseRepository):
+    """Reads and writes bot data through the Django ORM.
+
+    Attributes:
+        executor (ThreadPoolExecutor): The threads running the queries.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the repository and its thread pool."""
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.DB_MAX_WORKERS,
+            thread_name_prefix="bot-orm",
+        )
+
+    async def close(self) -> None:
+        """Shuts down the thread pool."""
+        self.executor.shutdown(wait=True)
+
+    async def get_session(self, telegram_user_id) -> dict | None:
+        """Returns the session of a Telegram user.
+
+        Args:
+            telegram_user_id (int): The Telegram user ID.
+
+        Returns:
+            dict: The ``user_id`` of the user and no token, or None if the
+                user is not registered.
+        """
+        user_id = await self._run(
+            lambda: (
+                User.objects
+                .filter(telegram_user_id=telegram_user_id)
+                .values_list("id", flat=True)
+                .first()
+            )
+        )
+        if user_id is None:
+            return None
+        return {"user_id": user_id, "token": None}
+
+    async def create_user(self, email, telephone, telegram_user_id) -> bool:
+        """Registers a user.
+
+        Args:
+            email (str): The email address.
+            telephone (str): The telephone number.
+            telegram_user_id (int): The Telegram user ID.
+
+        Returns:
+            bool: True if the user has been created, False if the email
+                address is already registered.
+        """
+
+        def create():
+            if User.objects.filter(email=email).exists():
+                return False
+            User.objects.create_user(
+                email=email,
+                telephone=telephone,
+                telegram_user_id=telegram_user_id,
+                password="defaultpassword",
+            )
+            return True
+
+        return await self._run(create)
+
+    async def get_ticker(self, session, symbol) -> dict | None:
+        """Returns a ticker by its symbol.
+
+        Args:
+            session (dict): The session of the user.
+            symbol (str): The ticker symbol.
+
+        Returns:
+            dict: The ticker, or None if it does not exist.
+        """
+        return await self._run(
+            lambda: (
+                Ticker.objects
+                .filter(symbol=symbol)
+                .values("id", "symbol", "name")
+                .first()
+            )
+        )
+
+    async def create_notification(
+        self, session, ticker_id, value, notification_type, criteria
+    ) -> None:
+        """Creates a price notification for the user.
+
+        Args:
+            session (dict): The session of the user.
+            ticker_id (int): The ID of the ticker.
+            value (float): The price threshold.
+            notification_type (str): ``email``, ``telegram`` or ``all``.
+            criteria (str): ``more_than`` or ``less_than``.
+        """
+        await self._run(
+            lambda: Notification.objects.create(
+                user_id=session["user_id"],
+                ticker_id=ticker_id,
+                notification_value=value,
+                notification_type=notification_type,
+                notification_criteria=criteria,
+            )
+        )
+
+    async def get_dashboard(self, session) -> dict:
+        """Returns the user with their notifications and tickers.
+
+        Args:
+            session (dict): The session of the user.
+
+        Returns:
+            dict: The user data in the shape of the ``/users/me/``
+                endpoint.
+        """
+
+        def load():
+            notifications = Notification.objects.select_related(
+                "ticker"
+            ).order_by("date_created")
+            user = User.objects.prefetch_related(
+                Prefetch("notifications", queryset=notifications)
+            ).get(pk=session["user_id"])
+            return UserDashboardSerializer(user).data
+
+        return await self._run(load)
+
+    async def find_notification(self, session, ticker_id, value):
+        """Finds a notification of the user by ticker and value.
+
+        Args:
+            session (dict): The session of the user.
+            ticker_id (int): The ID of the ticker.
+            value (float): The price threshold.
+
+        Returns:
+            dict: The notification, or None if there is no match.
+        """
+        return await self._run(
+            lambda: (
+                Notification.objects
+                .filter(
+                    user_id=session["user_id"],
+                    ticker_id=ticker_id,
+                    notification_value=value,
+                )
+                .values()
+                .first()
+            )
+        )
+
+    async def delete_notification(self, session, notification_id) -> None:
+        """Deletes a notification of the user.
+
+        Args:
+            session (dict): The session of the user.
+            notification_id (int): The ID of the notification.
+        """
+        await self._run(
+            lambda: Notification.objects.filter(
+                pk=notification_id, user_id=session["user_id"]
+            ).delete()
+        )
+
+    async def get_watchlist(self, session) -> list:
+        """Returns the watched ticker symbols of the user.
+
+        Args:
+            session (dict): The session of the user.
+
+        Returns:
+            list: The watched ticker symbols.
+        """
+        return await self._run(
+            lambda: list(
+                Ticker.objects.filter(
+                    watchlists__user_id=session["user_id"]
+                ).values_list("symbol", flat=True)
+            )
+        )
+
+    async def set_watchlist(self, session, symbols) -> list | None:
+        """Replaces the watched ticker symbols of the user.
+
+        The symbols are validated like the ``/watchlists/me/`` endpoint
+        does.
+
+        Args:
+            session (dict): The session of the user.
+            symbols (list): The ticker symbols to watch.
+
+        Returns:
+            list: The watched ticker symbols, or None if the symbols were
+                rejected.
+        """
+
+        def update():
+            watchlist = Watchlist.objects.filter(
+                user_id=session["user_id"]
+            ).first()
+            serializer = WatchlistSerializer(
+                watchlist, data={"tickers": symbols}, partial=True
+            )
+            if not serializer.is_valid():
+                return None
+            serializer.save(user_id=session["user_id"])
+            return serializer.data["tickers"]
+
+        return await self._run(update)
+
+    async def _run(self, query):
+        def call():
+            try:
+                return query()
+            finally:
+                close_old_connections()
+
+        try:
+            return await sync_to_async(
+                call, thread_sensitive=False, executor=self.executor
+            )()
+        except (DatabaseError, User.DoesNotExist) as e:
+            raise RepositoryError(str(e)) from e
@@ -0,0 +1,154 @@
+"""This module runs the Telegram bot as a set of supervised worker
+processes.
+
+The supervisor starts ``BOT_WORKERS`` processes, each running the bot
+from ``main``, restarts any worker that exits unexpectedly with an
+exponential backoff, and forwards SIGINT/SIGTERM so workers can finish
+in-flight updates during deploys. Conversation state survives worker
+restarts when the Redis FSM storage is enabled.
+
+Telegram allows only one ``getUpdates`` consumer per bot token, so in
+polling mode the runner always starts a single worker. In webhook mode
+the workers share the webhook port and Telegram's connections are spread
+across them by the kernel. Webhook mode without ``WEBHOOK_SECRET`` stops
+the runner before any worker starts.
+
+Functions:
+    run_worker: Entry point of a worker process.
+    resolve_worker_count: Returns the number of workers to start.
+    start_worker: Starts a worker process.
+    stop_workers: Stops the workers, killing those that do not exit in time.
+    supervise: Starts the workers and keeps them running.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import signal
+import time
+
+from telegram_bot.settings import BotSettings as settings
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+RESTART_BACKOFF_MIN = 1
+RESTART_BACKOFF_MAX = 60
+HEALTHY_UPTIME = 60
+SHUTDOWN_TIMEOUT = 30
+
+
+def run_worker() -> None:
+    """Entry point of a worker process."""
+    from main import main
+
+    asyncio.run(main())
+
+
+def resolve_worker_count() -> int:
+    """Returns the number of workers to start.
+
+    Returns:
+        int: The configured number of workers, limited to one unless the
+            bot can share intake and state between processes.
+    """
+    workers = max(settings.BOT_WORKERS, 1)
+    if workers > 1 and settings.FSM_STORAGE != "redis":
+        logger.warning(
+            "Memory FSM storage cannot be shared between processes; "
+            "starting a single worker. Set FSM_STORAGE=redis to scale."
+        )
+        return 1
+    if workers > 1 and settings.BOT_MODE != "webhook":
+        logger.warning(
+            "Polling allows a single getUpdates consumer per bot token; "
+            "starting a single worker."
+        )
+        return 1
+    return workers
+
+
+def start_worker(context, slot):
+    """Starts a worker process.
+
+    Args:
+        context (multiprocessing.context.BaseContext): The process context.
+        slot (int): The worker slot number.
+
+    Returns:
+        multiprocessing.Process: The started worker process.
+    """
+    process = context.Process(target=run_worker, name=f"bot-worker-{slot}")
+    process.start()
+    logger.info(f"Started {process.name} (pid {process.pid})")
+    return process
+
+
+def stop_workers(workers) -> None:
+    """Stops the workers, killing those that do not exit in time.
+
+    Args:
+        workers (Iterable): The worker processes.
+    """
+    for process in workers:
+        if process.is_alive():
+            process.terminate()
+    deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+    for process in workers:
+        process.join(max(deadline - time.monotonic(), 0))
+        if process.is_alive():
+            logger.error(f"{process.name} did not stop in time, killing it")
+            process.kill()
+
+
+def supervise() -> None:
+    """Starts the workers and keeps them running until a stop signal.
+
+    Raises:
+        SystemExit: If webhook mode is configured without a secret.
+    """
+    if settings.BOT_MODE == "webhook" and not settings.WEBHOOK_SECRET:
+        raise SystemExit("WEBHOOK_SECRET must be set in webhook mode")
+    context = multiprocessing.get_context("spawn")
+    stopping = False
+
+    def request_stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        logger.info(f"Received signal {signum}, stopping workers")
+
+    signal.signal(signal.SIGINT, request_stop)
+    signal.signal(signal.SIGTERM, request_stop)
+
+    slots = range(resolve_worker_count())
+    workers = {slot: start_worker(context, slot) for slot in slots}
+    started_at = dict.fromkeys(slots, time.monotonic())
+    backoff = dict.fromkeys(slots, RESTART_BACKOFF_MIN)
+    restart_at = {}
+
+    while not stopping:
+        time.sleep(0.5)
+        now = time.monotonic()
+        for slot, process in workers.items():
+            if process.is_alive():
+                continue
+            if slot in restart_at:
+                if now >= restart_at[slot]:
+                    del restart_at[slot]
+                    workers[slot] = start_worker(context, slot)
+                    started_at[slot] = now
+                continue
+            if now - started_at[slot] > HEALTHY_UPTIME:
+                backoff[slot] = RESTART_BACKOFF_MIN
+            logger.error(
+                f"{process.name} exited with code {process.exitcode}, "
+                f"restarting in {backoff[slot]}s"
+            )
+            restart_at[slot] = now + backoff[slot]
+            backoff[slot] = min(backoff[slot] * 2, RESTART_BACKOFF_MAX)
+
+    stop_workers(workers.values())
+
+
+if __name__ == "__main__":
+    supervise()
@@ -1,3 +1,24 @@
-__all__ = ["start_bot"]
+__all__ = [
+    "BotMetrics",
+    "OutgoingMessageQueue",
+    "SymbolIndex",
+    "ThrottlingMiddleware",
+    "close_api_client",
+    "create_events_isolation",
+    "create_fsm_storage",
+    "get_api_client",
+    "get_reply",
+    "init_api_client",
+    "start_bot",
+    "start_webhook",
+]
 
+from .api_client import close_api_client, get_api_client, init_api_client
 from .bot_service import start_bot
+from .message_queue import OutgoingMessageQueue
+from .metrics import BotMetrics
+from .replies import get_reply
+from .storage import create_events_isolation, create_fsm_storage
+from .symbol_index import SymbolIndex
+from .throttling import ThrottlingMiddleware
+from .webhook import start_webhook
@@ -0,0 +1,81 @@
+"""This module manages the shared HTTP client the bot uses to talk to the
+StockTic API.
+
+A single application-scoped ``httpx.AsyncClient`` keeps connections
+alive between handlers, so API calls reuse pooled TCP/TLS connections
+instead of opening a new one per request. The client is created when
+the bot starts and closed by the dispatcher's shutdown hook.
+
+Functions:
+    create_api_client: Creates a configured HTTP client.
+    init_api_client: Creates the shared client when the bot starts.
+    get_api_client: Returns the shared client.
+    close_api_client: Closes the shared client on bot shutdown.
+"""
+
+import importlib.util
+import logging
+
+import httpx
+
+from telegram_bot.settings import BotSettings as settings
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+
+
+def create_api_client() -> httpx.AsyncClient:
+    """Creates a configured HTTP client.
+
+    HTTP/2 is enabled only when requested and the ``h2`` package is
+    installed.
+
+    Returns:
+        httpx.AsyncClient: The HTTP client.
+    """
+    http2 = settings.API_HTTP2 and importlib.util.find_spec("h2") is not None
+    return httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(
+            settings.API_TIMEOUT, connect=settings.API_CONNECT_TIMEOUT
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.API_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.API_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.API_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def init_api_client() -> None:
+    """Creates the shared client when the bot starts.
+
+    Creating the client does no I/O, so it is a plain function; the
+    connections are opened by the first requests.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_api_client()
+        logger.info("StockTic API client started")
+
+
+def get_api_client() -> httpx.AsyncClient:
+    """Returns the shared client, creating it if the bot has not started.
+
+    Returns:
+        httpx.AsyncClient: The shared HTTP client.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_api_client()
+    return _client
+
+
+async def close_api_client() -> None:
+    """Closes the shared client on bot shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("StockTic API client closed")
@@ -1,20 +1,31 @@
 """This module provides services for the Telegram bot, including functions
 to start the bot, retrieve JWT tokens, and check user registration status.
 
+Access tokens and the user IDs they carry are cached per Telegram user,
+for at most ``TOKEN_CACHE_TTL`` seconds, so authenticated commands do
+not call the API in the common case.
+
 The services use the aiogram library for Telegram bot interactions
 and httpx for making asynchronous HTTP requests to the StockTic API.
 """
 
+import base64
+import json
 import logging
+import time
 
 import httpx
 from aiogram import Dispatcher
 
+from telegram_bot.services.api_client import get_api_client
+from telegram_bot.services.cache import AsyncTTLCache
 from telegram_bot.settings import BotSettings as settings
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+session_cache = AsyncTTLCache(ttl=settings.TOKEN_CACHE_TTL)
+
 
 async def start_bot(dp: Dispatcher, bot):
     """Start bot with dispatcher.
@@ -29,6 +40,115 @@ async def start_bot(dp: Dispatcher, bot):
         logging.error(f"An error occurred while polling: {e}")
 
 
+def decode_token_claims(token: str) -> dict:
+    """Decode the claims of a JWT without verifying its signature.
+
+    The API verifies the signature on every request; the bot only reads
+    the user ID and expiry of tokens it has just received from the API.
+
+    Args:
+        token (str): The JWT.
+
+    Returns:
+        dict: The token claims.
+    """
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload))
+
+
+async def fetch_session(telegram_user_id: int) -> dict | None:
+    """Fetch a fresh access token for a Telegram user from the API.
+
+    Args:
+        telegram_user_id (int): The Telegram user ID.
+
+    Returns:
+        dict: The access token, the StockTic user ID and the token expiry
+            timestamp, or None if the user is not registered.
+    """
+    client = get_api_client()
+    try:
+        response = await client.post(
+            f"{settings.API_BASE_URL}/token/by-telegram-id/",
+            json={"telegram_user_id": telegram_user_id},
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return None  # User not found
+        raise e
+
+    token = response.json().get("access")
+    claims = decode_token_claims(token)
+    return {
+        "token": token,
+        "user_id": int(claims["user_id"]),
+        "expires_at": claims["exp"],
+    }
+
+
+def session_ttl(session: dict) -> float:
+    """Compute how long a session can be served from the cache.
+
+    Args:
+        session (dict): The session returned by fetch_session.
+
+    Returns:
+        float: The cache lifetime in seconds, ending shortly before the
+            access token expires and at most ``TOKEN_CACHE_TTL``.
+    """
+    remaining = (
+        session["expires_at"] - time.time() - settings.TOKEN_EXPIRY_MARGIN
+    )
+    return min(max(remaining, 0), settings.TOKEN_CACHE_TTL)
+
+
+async def get_session(telegram_user_id: int) -> dict | None:
+    """Get the cached session of a Telegram user.
+
+    Sessions are cached until shortly before their token expires. Once a
+    token enters its refresh window, the cached session is still returned
+    and a new one is fetched in the background, so handlers never wait
+    for a token in the common case. A session with less than
+    ``TOKEN_EXPIRY_MARGIN`` seconds left is never returned: a new one is
+    fetched and awaited instead.
+
+    Args:
+        telegram_user_id (int): The Telegram user ID.
+
+    Returns:
+        dict: The session, or None if the user is not registered.
+    """
+
+    def factory():
+        return fetch_session(telegram_user_id)
+
+    session = await session_cache.get_or_set(
+        telegram_user_id, factory, ttl=session_ttl
+    )
+    if not session:
+        return session
+    remaining = session["expires_at"] - time.time()
+    if remaining < settings.TOKEN_EXPIRY_MARGIN:
+        session_cache.delete(telegram_user_id)
+        return await session_cache.fill(
+            telegram_user_id, factory, ttl=session_ttl
+        )
+    if remaining < settings.TOKEN_REFRESH_AHEAD:
+        session_cache.refresh(telegram_user_id, factory, ttl=session_ttl)
+    return session
+
+
+def invalidate_session(telegram_user_id: int) -> None:
+    """Drop the cached session of a Telegram user.
+
+    Args:
+        telegram_user_id (int): The Telegram user ID.
+    """
+    session_cache.delete(telegram_user_id)
+
+
 async def get_jwt_token(telegram_user_id):
     """Get JWT token using Telegram ID.
 
@@ -38,18 +158,8 @@ async def get_jwt_token(telegram_user_id):
     Returns:
         str: The JWT token if the user is registered, otherwise None.
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{settings.API_BASE_URL}/token/by-telegram-id/",
-                json={"telegram_user_id": telegram_user_id},
-            )
-            response.raise_for_status()
-            return response.json().get("access")
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                return None  # User not found
-            raise e
+    session = await get_session(telegram_user_id)
+    return session["token"] if session else None
 
 
 async def check_user_registration(user_id: int) -> dict:
@@ -68,14 +178,14 @@ async def check_user_registration(user_id: int) -> dict:
 
         headers = {"Authorization": f"Bearer {token}"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{settings.API_BASE_URL}/users/get_by_telegram_id/",
-                params={"telegram_user_id": user_id},
-                headers=headers,
-            )
-            if response.status_code == 200 and response.json():
-                return response.json()  # Return user data
+        client = get_api_client()
+        response = await client.get(
+            f"{settings.API_BASE_URL}/users/get_by_telegram_id/",
+            params={"telegram_user_id": user_id},
+            headers=headers,
+        )
+        if response.status_code == 200 and response.json():
+            return response.json()  # Return user data
 
     except httpx.RequestError as e:
         logger.error(
@@ -0,0 +1,166 @@
+"""This module provides an in-process asynchronous TTL cache for the
+Telegram bot.
+
+Concurrent misses for the same key share a single fill, so a burst of
+updates from one user (or about one symbol) triggers one upstream call
+instead of one per update.
+
+Classes:
+    AsyncTTLCache: A TTL cache with single-flight fills.
+"""
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class AsyncTTLCache:
+    """A TTL cache with single-flight fills.
+
+    Attributes:
+        ttl (float): The default lifetime of an entry in seconds.
+        maxsize (int): The maximum number of entries kept.
+    """
+
+    def __init__(self, ttl, maxsize=10_000) -> None:
+        """Initializes the cache.
+
+        Args:
+            ttl (float): The default lifetime of an entry in seconds.
+            maxsize (int): The maximum number of entries kept.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = {}
+        self._inflight = {}
+
+    def __contains__(self, key) -> bool:
+        """Checks whether a fresh entry exists for the key.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            bool: True if a fresh entry exists.
+        """
+        return self.get(key, _MISSING) is not _MISSING
+
+    def get(self, key, default=None):
+        """Returns the fresh value for a key.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): The value returned on a miss.
+
+        Returns:
+            Any: The cached value, or the default on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return default
+        return value
+
+    def set(self, key, value, ttl=None) -> None:
+        """Stores a value for a key.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+            ttl (float, optional): The lifetime of the entry in seconds.
+        """
+        if len(self._entries) >= self.maxsize:
+            self._evict()
+        ttl = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, key) -> None:
+        """Removes the entry for a key.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        self._entries.clear()
+
+    async def get_or_set(self, key, factory, ttl=None):
+        """Returns the cached value or fills it from the factory.
+
+        Args:
+            key (Hashable): The cache key.
+            factory (Callable): A coroutine function producing the value.
+            ttl (float | Callable, optional): The lifetime of the entry,
+                or a function computing it from the value.
+
+        Returns:
+            Any: The cached or freshly produced value.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        return await self.fill(key, factory, ttl)
+
+    async def fill(self, key, factory, ttl=None):
+        """Fills a key from the factory, sharing in-flight fills.
+
+        ``None`` results are returned but not stored.
+
+        Args:
+            key (Hashable): The cache key.
+            factory (Callable): A coroutine function producing the value.
+            ttl (float | Callable, optional): The lifetime of the entry,
+                or a function computing it from the value.
+
+        Returns:
+            Any: The freshly produced value.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fill(key, factory, ttl))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    def refresh(self, key, factory, ttl=None) -> None:
+        """Schedules a background fill unless one is already running.
+
+        Args:
+            key (Hashable): The cache key.
+            factory (Callable): A coroutine function producing the value.
+            ttl (float | Callable, optional): The lifetime of the entry,
+                or a function computing it from the value.
+        """
+        if key in self._inflight:
+            return
+        task = asyncio.ensure_future(self.fill(key, factory, ttl))
+        task.add_done_callback(self._log_refresh_error)
+
+    async def _fill(self, key, factory, ttl):
+        value = await factory()
+        if value is not None:
+            self.set(key, value, ttl(value) if callable(ttl) else ttl)
+        return value
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+            del self._entries[key]
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+    @staticmethod
+    def _log_refresh_error(task) -> None:
+        if not task.cancelled() and task.exception():
+            logger.error(
+                f"Background cache refresh failed: {task.exception()}"
+            )
@@ -2,17 +2,20 @@
 allowing access to certain handlers in the Telegram bot.
 
 The decorator uses the aiogram library for Telegram bot interactions and
-httpx for making asynchronous HTTP requests to the StockTic API.
+the configured repository, whose HTTP mode caches sessions, so registered
+users pass the check without extra requests to the StockTic API.
+
+The session is resolved again for every update and handed to the handler
+as its ``session`` argument. It is never stored in the FSM data, where an
+access token would outlive its expiry between the steps of a dialog.
 """
 
 from functools import wraps
 
-import httpx
 from aiogram import types
 from aiogram.fsm.context import FSMContext
 
-from telegram_bot.services.bot_service import get_jwt_token
-from telegram_bot.settings import BotSettings as settings
+from telegram_bot.repositories import RepositoryError, get_repository
 
 
 def require_registration(handler):
@@ -27,12 +30,16 @@ def require_registration(handler):
 
     @wraps(handler)
     async def wrapper(
-        message: types.Message, state: FSMContext, *args, **kwargs
+        event: types.Message | types.CallbackQuery,
+        state: FSMContext,
+        *args,
+        **kwargs,
     ):
         """Wrapper function to check user registration.
 
         Args:
-            message (types.Message): The message object from the user.
+            event (types.Message | types.CallbackQuery): The message or
+                callback query from the user.
             state (FSMContext): The finite state machine context.
             *args: Variable length argument list.
             **kwargs: Arbitrary keyword arguments.
@@ -41,45 +48,18 @@ def require_registration(handler):
             Callable: The original handler function if the user is registered,
                       otherwise None.
         """
-        user_id = message.from_user.id
+        try:
+            session = await get_repository().get_session(event.from_user.id)
+        except RepositoryError as e:
+            await event.answer(f"An error occurred: {e}")
+            return None
 
-        # Get JWT token
-        token = await get_jwt_token(user_id)
-        if not token:
-            await message.answer(
+        if not session:
+            await event.answer(
                 "You are not registered. Please register first."
             )
             return None
 
-        headers = {"Authorization": f"Bearer {token}"}
-        async with httpx.AsyncClient() as client:
-            try:
-                user_response = await client.get(
-                    f"{settings.API_BASE_URL}/users/get_by_telegram_id/",
-                    params={"telegram_user_id": user_id},
-                    headers=headers,
-                )
-                if (
-                    user_response.status_code != 200
-                    or not user_response.json()
-                ):
-                    await message.answer(
-                        "User not found. Please register first."
-                    )
-                    return None
-
-                user_data = user_response.json()
-                # Save data in FSMContext
-                await state.update_data(
-                    user_id=user_data["id"], token=token, headers=headers
-                )
-            except httpx.RequestError as e:
-                await message.answer(f"Request error occurred: {e}")
-                return None
-            except httpx.HTTPError as e:
-                await message.answer(f"HTTP error occurred: {e}")
-                return None
-
-        return await handler(message, state, *args, **kwargs)
+        return await handler(event, state, *args, session=session, **kwargs)
 
     return wrapper
@@ -0,0 +1,289 @@
+"""This module provides the outgoing message queue of the Telegram bot.
+
+Telegram limits a bot to about 30 messages per second overall and about
+one message per second per chat, and answers bursts beyond that with
+429 errors. Replies are therefore queued per chat and sent by a single
+scheduler that paces them by a global and a per-chat budget. Small
+consecutive messages to the same chat are merged up to Telegram's
+message length limit, and a 429 pauses the chat for the ``retry_after``
+Telegram asks for before the message is retried. An unexpected error
+while sending fails only the messages of that request, and the chat
+keeps being served. The error is logged, so callers that do not await
+the message are not warned about an unretrieved exception.
+
+Classes:
+    OutgoingMessageQueue: Paces and merges outgoing messages per chat.
+
+Functions:
+    split_text: Splits a text into chunks within the length limit.
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError, TelegramRetryAfter
+
+from telegram_bot.settings import BotSettings as settings
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_MAX_LENGTH = 4096
+MERGE_SEPARATOR = "\n\n"
+
+
+def split_text(text, limit=MESSAGE_MAX_LENGTH):
+    """Splits a text into chunks within the length limit.
+
+    Chunks are cut at the last line break before the limit when there is
+    one.
+
+    Args:
+        text (str): The text to split.
+        limit (int): The maximum length of a chunk.
+
+    Returns:
+        list: The chunks of the text.
+    """
+    chunks = []
+    while len(text) > limit:
+        cut = text.rfind("\n", 0, limit)
+        cut = cut if cut > 0 else limit
+        chunks.append(text[:cut])
+        text = text[cut:].lstrip("\n")
+    chunks.append(text)
+    return chunks
+
+
+@dataclass
+class _Outgoing:
+    text: str
+    options: dict
+    futures: list = field(default_factory=list)
+    attempts: int = 0
+
+    def can_merge(self, other) -> bool:
+        return (
+            self.options == other.options
+            and len(self.text) + len(MERGE_SEPARATOR) + len(other.text)
+            <= MESSAGE_MAX_LENGTH
+        )
+
+    def merge(self, other) -> None:
+        self.text = f"{self.text}{MERGE_SEPARATOR}{other.text}"
+        self.futures.extend(other.futures)
+
+
+class OutgoingMessageQueue:
+    """Paces and merges outgoing messages per chat.
+
+    Messages to one chat are sent in order, one request at a time.
+    Messages to different chats are sent concurrently within the global
+    budget.
+
+    Attributes:
+        bot (Bot): The bot that sends the messages.
+        global_interval (float): The minimum time between two sends.
+        chat_interval (float): The minimum time between two sends to the
+            same chat.
+        max_retries (int): How many times a rate-limited message is
+            retried before it is dropped.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        global_rate=None,
+        chat_rate=None,
+        max_retries=None,
+    ) -> None:
+        """Initializes the queue.
+
+        Args:
+            bot (Bot): The bot that sends the messages.
+            global_rate (float, optional): The messages per second across
+                all chats.
+            chat_rate (float, optional): The messages per second per chat.
+            max_retries (int, optional): How many times a rate-limited
+                message is retried before it is dropped.
+        """
+        self.bot = bot
+        self.global_interval = 1 / (
+            global_rate or settings.MESSAGE_QUEUE_GLOBAL_RATE
+        )
+        self.chat_interval = 1 / (
+            chat_rate or settings.MESSAGE_QUEUE_CHAT_RATE
+        )
+        self.max_retries = (
+            settings.MESSAGE_QUEUE_MAX_RETRIES
+            if max_retries is None
+            else max_retries
+        )
+        self._chats = {}
+        self._chat_ready_at = {}
+        self._busy = set()
+        self._schedule = []
+        self._sequence = itertools.count()
+        self._global_ready_at = 0.0
+        self._wakeup = asyncio.Event()
+        self._sending = set()
+        self._scheduler = None
+
+    def send(self, chat_id, text, merge=True, **options) -> asyncio.Future:
+        """Queues a text message.
+
+        Args:
+            chat_id (int): The chat to send the message to.
+            text (str): The message text. Longer texts are split.
+            merge (bool): Whether the message may be merged with other
+                queued messages to the chat.
+            **options: Keyword arguments for ``Bot.send_message``.
+
+        Returns:
+            asyncio.Future: Resolves to the sent message, or to None if
+                Telegram refused the message. Any other error while
+                sending is set as its exception, which need not be
+                retrieved.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._chats.setdefault(chat_id, deque())
+        was_idle = not queue
+        future = loop.create_future()
+        future.add_done_callback(self._mark_retrieved)
+        chunks = split_text(text)
+        for index, chunk in enumerate(chunks):
+            item = _Outgoing(chunk, options)
+            if index == len(chunks) - 1:
+                item.futures.append(future)
+            if merge and queue and queue[-1].can_merge(item):
+                queue[-1].merge(item)
+            else:
+                queue.append(item)
+        if was_idle and chat_id not in self._busy:
+            self._schedule_chat(chat_id)
+        return future
+
+    async def start(self) -> None:
+        """Starts the scheduler."""
+        if self._scheduler is None or self._scheduler.done():
+            self._scheduler = asyncio.create_task(self._run())
+
+    async def stop(self, timeout=10) -> None:
+        """Sends the queued messages and stops the scheduler.
+
+        Args:
+            timeout (float): How long to wait for queued messages, in
+                seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while (self._schedule or self._sending) and (
+            time.monotonic() < deadline
+        ):
+            await asyncio.sleep(0.05)
+        if self._scheduler:
+            self._scheduler.cancel()
+            self._scheduler = None
+        dropped = sum(len(queue) for queue in self._chats.values())
+        if dropped:
+            logger.warning(f"Dropped {dropped} queued messages on shutdown")
+        for queue in self._chats.values():
+            for item in queue:
+                self._resolve(item, None)
+        self._chats.clear()
+
+    def _schedule_chat(self, chat_id) -> None:
+        ready_at = self._chat_ready_at.get(chat_id, 0.0)
+        heapq.heappush(
+            self._schedule, (ready_at, next(self._sequence), chat_id)
+        )
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._schedule:
+                self._forget_idle_chats()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            ready_at = max(self._schedule[0][0], self._global_ready_at)
+            delay = ready_at - time.monotonic()
+            if delay > 0:
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                continue
+            _, _, chat_id = heapq.heappop(self._schedule)
+            queue = self._chats.get(chat_id)
+            if not queue:
+                continue
+            now = time.monotonic()
+            self._global_ready_at = now + self.global_interval
+            self._chat_ready_at[chat_id] = now + self.chat_interval
+            self._busy.add(chat_id)
+            task = asyncio.create_task(self._deliver(chat_id, queue.popleft()))
+            self._sending.add(task)
+            task.add_done_callback(self._sending.discard)
+
+    async def _deliver(self, chat_id, item) -> None:
+        try:
+            message = await self.bot.send_message(
+                chat_id=chat_id, text=item.text, **item.options
+            )
+        except TelegramRetryAfter as e:
+            item.attempts += 1
+            retry_at = time.monotonic() + e.retry_after
+            self._chat_ready_at[chat_id] = retry_at
+            if item.attempts <= self.max_retries:
+                logger.warning(
+                    f"Rate limited sending to {chat_id}, "
+                    f"retrying in {e.retry_after}s"
+                )
+                self._chats.setdefault(chat_id, deque()).appendleft(item)
+            else:
+                logger.error(f"Dropped message to {chat_id} after retries")
+                self._resolve(item, None)
+        except TelegramAPIError as e:
+            logger.error(f"Could not send message to {chat_id}: {e}")
+            self._resolve(item, None)
+        except Exception as e:
+            logger.exception(f"Unexpected error sending to {chat_id}")
+            self._fail(item, e)
+        else:
+            self._resolve(item, message)
+        finally:
+            self._busy.discard(chat_id)
+            if self._chats.get(chat_id):
+                self._schedule_chat(chat_id)
+            else:
+                self._chats.pop(chat_id, None)
+
+    def _forget_idle_chats(self) -> None:
+        now = time.monotonic()
+        self._chat_ready_at = {
+            chat_id: ready_at
+            for chat_id, ready_at in self._chat_ready_at.items()
+            if ready_at > now or chat_id in self._busy
+        }
+
+    @staticmethod
+    def _resolve(item, result) -> None:
+        for future in item.futures:
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _mark_retrieved(future) -> None:
+        if not future.cancelled():
+            future.exception()
+
+    @staticmethod
+    def _fail(item, error) -> None:
+        for future in item.futures:
+            if not future.done():
+                future.set_exception(error)
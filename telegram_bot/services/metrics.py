@@ -0,0 +1,315 @@
+"""This module collects latency and event loop metrics of the bot.
+
+A middleware times every update and every handler call, counting the
+calls in flight and the ones that raised, and a background task samples
+how late the event loop wakes up from a short sleep. A late wakeup means
+some code blocked the loop; lags above ``METRICS_LOOP_LAG_WARNING`` are
+logged as they happen, so the blocking call can be found from the logs.
+
+The metrics are served in the Prometheus text format on
+``METRICS_HOST:METRICS_PORT/metrics`` and summarised in the logs every
+``METRICS_LOG_INTERVAL`` seconds. With several worker processes each
+worker serves its own metrics; a worker that cannot bind the port only
+logs them.
+
+Classes:
+    Histogram: A cumulative histogram with fixed bucket bounds.
+    BotMetrics: Collects, serves and logs the bot metrics.
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from collections import defaultdict
+
+from aiogram import BaseMiddleware, Dispatcher
+from aiohttp import web
+
+from telegram_bot.settings import BotSettings as settings
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+)
+HANDLER_EVENTS = ("message", "callback_query", "inline_query")
+
+
+class Histogram:
+    """A cumulative histogram with fixed bucket bounds.
+
+    Attributes:
+        bounds (tuple): The upper bounds of the buckets, in seconds.
+        counts (list): The number of observations per bucket, with a
+            last bucket for observations above every bound.
+        sum (float): The sum of the observations.
+        count (int): The number of observations.
+        max (float): The largest observation.
+    """
+
+    def __init__(self, bounds=DURATION_BUCKETS) -> None:
+        """Initializes an empty histogram.
+
+        Args:
+            bounds (tuple): The upper bounds of the buckets, in seconds.
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value) -> None:
+        """Records an observation.
+
+        Args:
+            value (float): The observed value, in seconds.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def quantile(self, q) -> float:
+        """Estimates a quantile as the upper bound of its bucket.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float: The estimate, or the largest observation if it falls
+                in the last bucket.
+        """
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def render(self, name, labels="") -> list:
+        """Renders the histogram in the Prometheus text format.
+
+        Args:
+            name (str): The metric name.
+            labels (str): The labels, as ``key="value"`` pairs.
+
+        Returns:
+            list: The sample lines.
+        """
+        prefix = f"{labels}," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.extend([
+            f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}',
+            f"{name}_sum{suffix} {self.sum}",
+            f"{name}_count{suffix} {self.count}",
+        ])
+        return lines
+
+
+class BotMetrics(BaseMiddleware):
+    """Collects, serves and logs the bot metrics.
+
+    Installed with ``install``, the instance is both an outer middleware
+    of the dispatcher's updates, labelled ``update:<type>``, and an inner
+    middleware of the message, callback query and inline query handlers
+    of every router, labelled ``<module>.<handler>``.
+
+    Attributes:
+        durations (dict): The duration histograms by label.
+        in_flight (dict): The number of running calls by label.
+        errors (dict): The number of calls that raised by label.
+        loop_lag (Histogram): The event loop lag samples.
+    """
+
+    def __init__(self) -> None:
+        """Initializes empty metrics."""
+        self.durations = defaultdict(Histogram)
+        self.in_flight = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.loop_lag = Histogram()
+        self._window = defaultdict(Histogram)
+        self._window_errors = defaultdict(int)
+        self._window_lag = Histogram()
+        self._tasks = []
+        self._runner = None
+
+    def install(self, dp: Dispatcher) -> None:
+        """Registers the middleware and the background tasks.
+
+        Args:
+            dp (Dispatcher): The dispatcher, with its routers included.
+        """
+        dp.update.outer_middleware(self)
+        for event_name in HANDLER_EVENTS:
+            dp.observers[event_name].middleware(self)
+        dp.startup.register(self.start)
+        dp.shutdown.register(self.stop)
+
+    async def __call__(self, handler, event, data):
+        """Times a handler or update and counts it while it runs.
+
+        Args:
+            handler (Callable): The next handler in the chain.
+            event (TelegramObject): The event.
+            data (dict): The handler data.
+
+        Returns:
+            Any: The result of the handler.
+        """
+        label = self._label(event, data)
+        self.in_flight[label] += 1
+        started = time.perf_counter()
+        try:
+            return await handler(event, data)
+        except Exception:
+            self.errors[label] += 1
+            self._window_errors[label] += 1
+            raise
+        finally:
+            duration = time.perf_counter() - started
+            self.in_flight[label] -= 1
+            self.durations[label].observe(duration)
+            self._window[label].observe(duration)
+
+    async def start(self) -> None:
+        """Starts the loop lag sampler, the log summary and the metrics
+        endpoint.
+        """
+        self._tasks = [
+            asyncio.create_task(self._sample_loop_lag()),
+            asyncio.create_task(self._log_forever()),
+        ]
+        if settings.METRICS_PORT:
+            app = web.Application()
+            app.router.add_get("/metrics", self.handle_metrics)
+            self._runner = web.AppRunner(app)
+            await self._runner.setup()
+            site = web.TCPSite(
+                self._runner, settings.METRICS_HOST, settings.METRICS_PORT
+            )
+            try:
+                await site.start()
+            except OSError as e:
+                logger.warning(f"Metrics endpoint not started: {e}")
+
+    async def stop(self) -> None:
+        """Stops the background tasks and logs a last summary."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+        self.log_summary()
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        """Serves the metrics in the Prometheus text format.
+
+        Args:
+            request (web.Request): The scrape request.
+
+        Returns:
+            web.Response: The metrics.
+        """
+        return web.Response(
+            text=self.render(), content_type="text/plain", charset="utf-8"
+        )
+
+    def render(self) -> str:
+        """Renders the metrics in the Prometheus text format.
+
+        Returns:
+            str: The metrics.
+        """
+        lines = ["# TYPE stocktic_bot_handler_duration_seconds histogram"]
+        for label, histogram in sorted(self.durations.items()):
+            lines.extend(
+                histogram.render(
+                    "stocktic_bot_handler_duration_seconds",
+                    f'handler="{label}"',
+                )
+            )
+        lines.append("# TYPE stocktic_bot_handler_in_flight gauge")
+        lines.extend(
+            f'stocktic_bot_handler_in_flight{{handler="{label}"}} {value}'
+            for label, value in sorted(self.in_flight.items())
+        )
+        lines.append("# TYPE stocktic_bot_handler_errors_total counter")
+        lines.extend(
+            f'stocktic_bot_handler_errors_total{{handler="{label}"}} '
+            f"{self.errors[label]}"
+            for label in sorted(self.durations)
+        )
+        lines.append("# TYPE stocktic_bot_event_loop_lag_seconds histogram")
+        lines.extend(
+            self.loop_lag.render("stocktic_bot_event_loop_lag_seconds")
+        )
+        return "\n".join(lines) + "\n"
+
+    def log_summary(self) -> None:
+        """Logs the metrics since the last summary and starts a new
+        window.
+        """
+        for label, histogram in sorted(self._window.items()):
+            logger.info(
+                f"{label}: {histogram.count} calls, "
+                f"{self._window_errors[label]} errors, "
+                f"p50 <= {histogram.quantile(0.5)}s, "
+                f"p95 <= {histogram.quantile(0.95)}s, "
+                f"max {histogram.max:.3f}s, "
+                f"{self.in_flight[label]} in flight"
+            )
+        if self._window_lag.count:
+            logger.info(
+                f"Event loop lag: p95 <= {self._window_lag.quantile(0.95)}s, "
+                f"max {self._window_lag.max:.3f}s"
+            )
+        self._window.clear()
+        self._window_errors.clear()
+        self._window_lag = Histogram()
+
+    async def _sample_loop_lag(self) -> None:
+        interval = settings.METRICS_LOOP_LAG_INTERVAL
+        while True:
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            lag = max(time.perf_counter() - expected, 0.0)
+            self.loop_lag.observe(lag)
+            self._window_lag.observe(lag)
+            if lag > settings.METRICS_LOOP_LAG_WARNING:
+                logger.warning(
+                    f"Event loop was blocked for {lag * 1000:.0f} ms"
+                )
+
+    async def _log_forever(self) -> None:
+        while True:
+            await asyncio.sleep(settings.METRICS_LOG_INTERVAL)
+            self.log_summary()
+
+    @staticmethod
+    def _label(event, data) -> str:
+        handler = data.get("handler")
+        if handler is None:
+            return f"update:{event.event_type}"
+        callback = handler.callback
+        module = callback.__module__.rsplit(".", 1)[-1]
+        return f"{module}.{callback.__name__}"
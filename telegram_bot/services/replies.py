@@ -0,0 +1,316 @@
+"""This module renders and caches the bot's replies to market data
+commands.
+
+Replies depend only on the command and the symbol, not on the user, so
+they are cached per ``(command, symbol)`` with a TTL matching how fast
+the data changes. Concurrent requests for the same reply share one fill,
+so a popular symbol costs one upstream fetch per TTL window however many
+users ask for it.
+
+``/compare`` replies depend on a list of symbols, so the data behind
+them is cached per symbol instead: company information for as long as a
+ticker information reply and prices for as long as a latest price reply.
+A comparison then only fetches the symbols missing from the cache, all
+prices in one batched request and all company information concurrently.
+
+Attributes:
+    reply_cache (AsyncTTLCache): The cache of rendered replies.
+    market_data_cache (AsyncTTLCache): The cache of company information
+        and prices per symbol.
+    RENDERERS (dict): The reply renderers by command name.
+
+Functions:
+    normalize_symbol: Normalizes a ticker symbol typed by a user.
+    reply_key: Returns the reply cache key of a command and a symbol.
+    render_ticker_info: Renders the ticker information reply.
+    render_latest_price: Renders the latest price reply.
+    render_news: Renders the news replies.
+    get_reply: Returns the rendered reply, using the cache when possible.
+    get_info: Returns the company information of a symbol.
+    get_latest_prices: Returns the latest prices of several symbols.
+    render_comparison: Renders the comparison table of several symbols.
+"""
+
+import asyncio
+import html
+import re
+from datetime import datetime
+
+import pytz
+from custom_utils.utils import format_market_cap
+from tickers.services import AsyncFinance, Finance
+
+from telegram_bot.services.cache import AsyncTTLCache
+from telegram_bot.settings import BotSettings as settings
+
+reply_cache = AsyncTTLCache(ttl=60, maxsize=settings.REPLY_CACHE_MAXSIZE)
+market_data_cache = AsyncTTLCache(ttl=60, maxsize=settings.REPLY_CACHE_MAXSIZE)
+
+COMPARISON_COLUMNS = (
+    ("Symbol", 7),
+    ("Price", 9),
+    ("Cap", 8),
+    ("P/E", 7),
+    ("EPS", 7),
+    ("Beta", 5),
+    ("Div", 5),
+)
+
+
+def normalize_symbol(text) -> str:
+    """Normalizes a ticker symbol typed by a user.
+
+    Args:
+        text (str): The text of the message.
+
+    Returns:
+        str: The symbol without surrounding whitespace, in upper case.
+    """
+    return text.strip().upper()
+
+
+def reply_key(command, symbol) -> tuple:
+    """Returns the reply cache key of a command and a symbol.
+
+    Args:
+        command (str): The command name, a key of ``RENDERERS``.
+        symbol (str): The ticker symbol, as typed by the user.
+
+    Returns:
+        tuple: The command and the normalized symbol.
+    """
+    return command, normalize_symbol(symbol)
+
+
+async def render_ticker_info(symbol):
+    """Renders the ticker information reply.
+
+    Args:
+        symbol (str): The ticker symbol.
+
+    Returns:
+        str: The reply, or None if the information is unavailable.
+    """
+    finance = AsyncFinance(symbol, timeout=settings.MARKET_DATA_TIMEOUT)
+    info = await finance.get_info()
+    if not info:
+        return None
+    metrics = Finance.key_metrics(info)
+    try:
+        market_cap = format_market_cap(int(metrics["market_cap"]))
+    except (TypeError, ValueError):
+        market_cap = "N/A"
+    return (
+        f"Ticker Information for {symbol}:\n"
+        f"Name: {info.get('longName', 'N/A')}\n"
+        f"Sector: {info.get('sector', 'N/A')}\n"
+        f"Industry: {info.get('industry', 'N/A')}\n"
+        f"Price: {info.get('previousClose', 'N/A')}\n"
+        f"Market Cap: {market_cap}\n"
+        f"PE Ratio: {metrics['pe_ratio']}\n"
+        f"EPS: {metrics['eps']}\n"
+        f"Dividend Yield: {metrics['dividend_yield']}%\n"
+        f"Beta: {metrics['beta']}\n"
+    )
+
+
+async def render_latest_price(symbol):
+    """Renders the latest price reply.
+
+    Args:
+        symbol (str): The ticker symbol.
+
+    Returns:
+        str: The reply, or None if the price is unavailable.
+    """
+    finance = AsyncFinance(symbol, timeout=settings.MARKET_DATA_TIMEOUT)
+    latest_price = await finance.get_latest_price()
+    if latest_price is None:
+        return None
+    return f"The latest price for {symbol} is ${latest_price:.2f}."
+
+
+async def render_news(symbol):
+    """Renders the news replies.
+
+    Args:
+        symbol (str): The ticker symbol.
+
+    Returns:
+        list: The header and one message per article, or None if there
+            is no news.
+    """
+    finance = AsyncFinance(symbol, timeout=settings.MARKET_DATA_TIMEOUT)
+    news = await finance.get_news()
+    if not news:
+        return None
+    replies = [f"Latest news for {symbol}:"]
+    time_zone = pytz.timezone(settings.TIME_ZONE)
+    for article in news:
+        content = article.get("content") or {}
+        if not content.get("title"):
+            continue
+        stock_tickers = (content.get("finance") or {}).get("stockTickers")
+        related_tickers = " ".join([
+            "#" + re.sub(r"[^a-zA-Z]", "", ticker["symbol"].lower())
+            for ticker in stock_tickers or []
+        ])
+        try:
+            dt = datetime.fromisoformat(content["pubDate"])
+            formatted_time = dt.astimezone(time_zone).strftime(
+                "%d-%b-%Y %H:%M (%Z)"
+            )
+        except (KeyError, TypeError, ValueError):
+            formatted_time = "N/A"
+        url = content.get("canonicalUrl") or content.get("clickThroughUrl")
+        replies.append(
+            f"Title: {content['title']}\n"
+            f"Published: {formatted_time}\n"
+            f"Link: {(url or {}).get('url', 'N/A')}\n\n"
+            f"Related Tickers: {related_tickers}\n"
+        )
+    return replies
+
+
+RENDERERS = {
+    "ticker_info": render_ticker_info,
+    "latest_price": render_latest_price,
+    "news": render_news,
+}
+
+
+async def get_reply(command, symbol):
+    """Returns the rendered reply, using the cache when possible.
+
+    Args:
+        command (str): The command name, a key of ``RENDERERS``.
+        symbol (str): The ticker symbol, normalized with
+            ``normalize_symbol``.
+
+    Returns:
+        Any: The rendered reply, or None if the data is unavailable.
+            Unavailable replies are not cached.
+    """
+    key = reply_key(command, symbol)
+    return await reply_cache.get_or_set(
+        key,
+        lambda: RENDERERS[command](key[1]),
+        ttl=getattr(settings, f"REPLY_CACHE_TTL_{command.upper()}"),
+    )
+
+
+async def get_info(symbol):
+    """Returns the company information of a symbol.
+
+    Args:
+        symbol (str): The ticker symbol.
+
+    Returns:
+        dict: The company information, or None if it is unavailable.
+    """
+    return await market_data_cache.get_or_set(
+        ("info", symbol),
+        lambda: AsyncFinance(
+            symbol, timeout=settings.MARKET_DATA_TIMEOUT
+        ).get_info(),
+        ttl=settings.REPLY_CACHE_TTL_TICKER_INFO,
+    )
+
+
+async def get_latest_prices(symbols):
+    """Returns the latest prices of several symbols.
+
+    Cached prices are reused and the others are fetched in one request.
+
+    Args:
+        symbols (list): The ticker symbols.
+
+    Returns:
+        dict: The latest price by symbol. Symbols without a price are
+            left out.
+    """
+    prices = {}
+    for symbol in symbols:
+        price = market_data_cache.get(("price", symbol))
+        if price is not None:
+            prices[symbol] = price
+    missing = [symbol for symbol in symbols if symbol not in prices]
+    if missing:
+        fetched = await AsyncFinance.get_latest_prices(
+            missing, timeout=settings.MARKET_DATA_TIMEOUT
+        )
+        for symbol, price in fetched.items():
+            market_data_cache.set(
+                ("price", symbol),
+                price,
+                ttl=settings.REPLY_CACHE_TTL_LATEST_PRICE,
+            )
+        prices.update(fetched)
+    return prices
+
+
+def _format_value(value, spec) -> str:
+    try:
+        return format(float(value), spec)
+    except (TypeError, ValueError):
+        return "-"
+
+
+def _comparison_row(symbol, info, price) -> list:
+    info = info or {}
+    metrics = Finance.key_metrics(info)
+    if price is None:
+        price = info.get("currentPrice") or info.get("previousClose")
+    market_cap = metrics["market_cap"]
+    return [
+        symbol,
+        _format_value(price, ".2f"),
+        format_market_cap(market_cap) if market_cap else "-",
+        _format_value(metrics["pe_ratio"], ".1f"),
+        _format_value(metrics["eps"], ".2f"),
+        _format_value(metrics["beta"], ".2f"),
+        _format_value(metrics["dividend_yield"], ".2f"),
+    ]
+
+
+async def render_comparison(symbols):
+    """Renders the comparison table of several symbols.
+
+    Company information and prices are fetched concurrently, so the
+    reply takes about as long as the slowest single fetch.
+
+    Args:
+        symbols (list): The ticker symbols.
+
+    Returns:
+        str: The reply as HTML, or None if no data is available for any
+            of the symbols.
+    """
+    infos, prices = await asyncio.gather(
+        asyncio.gather(*(get_info(symbol) for symbol in symbols)),
+        get_latest_prices(symbols),
+    )
+    if not any(infos) and not prices:
+        return None
+    rows = [[title for title, _ in COMPARISON_COLUMNS]]
+    rows.extend(
+        _comparison_row(symbol, info, prices.get(symbol))
+        for symbol, info in zip(symbols, infos, strict=True)
+    )
+    lines = [
+        "".join(
+            f"{cell:<{width}}"
+            for cell, (_, width) in zip(row, COMPARISON_COLUMNS, strict=True)
+        ).rstrip()
+        for row in rows
+    ]
+    missing = [
+        symbol
+        for symbol, info in zip(symbols, infos, strict=True)
+        if not info and symbol not in prices
+    ]
+    table = "\n".join(lines)
+    reply = f"<pre>{html.escape(table)}</pre>"
+    if missing:
+        reply += f"\nNo data for: {html.escape(', '.join(missing))}"
+    return reply
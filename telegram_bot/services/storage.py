@@ -0,0 +1,56 @@
+"""This module creates the FSM storage used by the bot dispatcher.
+
+Memory storage keeps conversation state inside one process, so it is
+lost on restart and cannot be shared between workers. Redis storage keeps
+it outside the bot, with TTLs so abandoned flows expire on their own.
+
+Functions:
+    create_fsm_storage: Creates the configured FSM storage.
+    create_events_isolation: Creates the event isolation for a storage.
+"""
+
+import logging
+
+from aiogram.fsm.storage.base import BaseEventIsolation, BaseStorage
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.fsm.storage.redis import DefaultKeyBuilder, RedisStorage
+
+from telegram_bot.settings import BotSettings as settings
+
+logger = logging.getLogger(__name__)
+
+
+def create_fsm_storage() -> BaseStorage:
+    """Creates the configured FSM storage.
+
+    Returns:
+        BaseStorage: Redis storage if ``FSM_STORAGE`` is ``redis``,
+            otherwise memory storage.
+    """
+    if settings.FSM_STORAGE == "redis":
+        logger.info("Using Redis FSM storage")
+        return RedisStorage.from_url(
+            settings.REDIS_URL,
+            key_builder=DefaultKeyBuilder(prefix="stocktic_fsm"),
+            state_ttl=settings.FSM_STATE_TTL,
+            data_ttl=settings.FSM_DATA_TTL,
+        )
+    return MemoryStorage()
+
+
+def create_events_isolation(storage: BaseStorage) -> BaseEventIsolation:
+    """Creates the event isolation for a storage.
+
+    With Redis storage several workers may receive updates from the same
+    chat, so updates are serialized per chat with a Redis lock.
+
+    Args:
+        storage (BaseStorage): The FSM storage of the dispatcher.
+
+    Returns:
+        BaseEventIsolation: The Redis event isolation, or None to keep
+            the dispatcher default.
+    """
+    if isinstance(storage, RedisStorage):
+        return storage.create_isolation()
+    return None
@@ -0,0 +1,217 @@
+"""This module provides the in-process symbol search index of the bot.
+
+The index is built from the compact ticker list of the StockTic API and
+answers prefix searches on symbols and on the words of company names
+with two binary searches, so inline queries never touch the API or the
+database per keystroke. Results for one- and two-character prefixes,
+which match the most tickers, are precomputed. The index is refreshed
+periodically with a conditional request, which costs a 304 when the
+ticker table has not changed.
+
+Classes:
+    SymbolIndex: A ranked prefix index of ticker symbols and names.
+
+Functions:
+    parse_market_cap: Parses a market cap value into a number.
+"""
+
+import asyncio
+import bisect
+import heapq
+import logging
+import re
+
+import httpx
+
+from telegram_bot.services.api_client import get_api_client
+from telegram_bot.settings import BotSettings as settings
+
+logger = logging.getLogger(__name__)
+
+MARKET_CAP_SUFFIXES = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+PRECOMPUTED_PREFIX_LENGTH = 2
+WORD_RE = re.compile(r"[A-Z0-9]+")
+NAME_STOP_WORDS = frozenset({
+    "AND",
+    "CLASS",
+    "CO",
+    "COMMON",
+    "CORP",
+    "CORPORATION",
+    "INC",
+    "LTD",
+    "PLC",
+    "SHARES",
+    "STOCK",
+    "THE",
+})
+
+
+def parse_market_cap(value):
+    """Parses a market cap value into a number.
+
+    Args:
+        value (str): A value such as ``"2.9T"``, ``"$1,234.5"`` or None.
+
+    Returns:
+        float: The market cap, or 0 if it cannot be parsed.
+    """
+    text = str(value or "").replace("$", "").replace(",", "").strip()
+    multiplier = MARKET_CAP_SUFFIXES.get(text[-1:].upper(), 1)
+    if multiplier != 1:
+        text = text[:-1]
+    try:
+        return float(text) * multiplier
+    except ValueError:
+        return 0.0
+
+
+class SymbolIndex:
+    """A ranked prefix index of ticker symbols and names.
+
+    Exact symbol matches rank first, then symbol prefix matches, then
+    matches on a word of the company name; ties are broken by market
+    cap.
+
+    Attributes:
+        tickers (list): The ``(symbol, name)`` pairs of the index.
+        etag (str): The ETag of the loaded ticker list.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty index."""
+        self.tickers = []
+        self.etag = None
+        self._caps = []
+        self._positions = {}
+        self._symbol_keys = []
+        self._name_keys = []
+        self._top = {}
+        self._refresher = None
+
+    def __len__(self) -> int:
+        """Returns the number of indexed tickers."""
+        return len(self.tickers)
+
+    def __contains__(self, symbol) -> bool:
+        """Checks whether a ticker symbol is indexed."""
+        return symbol.upper() in self._positions
+
+    def load(self, rows) -> None:
+        """Rebuilds the index from ticker rows.
+
+        Args:
+            rows (Iterable): ``(symbol, name, market_cap)`` rows.
+        """
+        tickers, caps, symbol_keys, name_keys = [], [], [], []
+        for position, (symbol, name, market_cap) in enumerate(rows):
+            symbol = symbol.upper()
+            tickers.append((symbol, name or ""))
+            caps.append(parse_market_cap(market_cap))
+            symbol_keys.append((symbol, position))
+            words = set(WORD_RE.findall((name or "").upper()))
+            name_keys.extend(
+                (word, position) for word in words - NAME_STOP_WORDS
+            )
+        symbol_keys.sort()
+        name_keys.sort()
+        top = {}
+        for symbol, position in symbol_keys:
+            for length in range(1, PRECOMPUTED_PREFIX_LENGTH + 1):
+                top.setdefault(symbol[:length], []).append(position)
+        limit = settings.INLINE_RESULTS_LIMIT
+        top = {
+            prefix: heapq.nlargest(limit, positions, key=caps.__getitem__)
+            for prefix, positions in top.items()
+        }
+        self.tickers, self._caps = tickers, caps
+        self._positions = {
+            symbol: pos for pos, (symbol, _) in enumerate(tickers)
+        }
+        self._symbol_keys, self._name_keys = symbol_keys, name_keys
+        self._top = top
+
+    def search(self, query, limit=None) -> list:
+        """Returns the best matching tickers for a query.
+
+        Args:
+            query (str): The text typed by the user.
+            limit (int, optional): The maximum number of results.
+
+        Returns:
+            list: The matching ``(symbol, name)`` pairs, best first.
+        """
+        limit = limit or settings.INLINE_RESULTS_LIMIT
+        query = query.strip().upper()
+        if not query or not self.tickers:
+            return []
+
+        if len(query) <= PRECOMPUTED_PREFIX_LENGTH and query in self._top:
+            symbol_matches = self._top[query]
+        else:
+            symbol_matches = heapq.nlargest(
+                limit,
+                self._prefix_range(self._symbol_keys, query),
+                key=self._caps.__getitem__,
+            )
+        exact = self._positions.get(query)
+        ranked = [] if exact is None else [exact]
+        ranked.extend(
+            position for position in symbol_matches if position != exact
+        )
+        if len(ranked) < limit:
+            seen = set(ranked)
+            name_matches = heapq.nlargest(
+                limit,
+                {
+                    position
+                    for position in self._prefix_range(self._name_keys, query)
+                    if position not in seen
+                },
+                key=self._caps.__getitem__,
+            )
+            ranked.extend(name_matches)
+        return [self.tickers[position] for position in ranked[:limit]]
+
+    async def refresh(self) -> bool:
+        """Reloads the index if the ticker list has changed.
+
+        Returns:
+            bool: True if the index has been rebuilt.
+        """
+        headers = {"If-None-Match": self.etag} if self.etag else {}
+        response = await get_api_client().get(
+            f"{settings.API_BASE_URL}/tickers/symbols/", headers=headers
+        )
+        if response.status_code == 304:
+            return False
+        response.raise_for_status()
+        self.load(response.json())
+        self.etag = response.headers.get("ETag")
+        logger.info(f"Symbol index loaded with {len(self)} tickers")
+        return True
+
+    async def start(self) -> None:
+        """Loads the index and starts the periodic refresh."""
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_forever())
+
+    async def stop(self) -> None:
+        """Stops the periodic refresh."""
+        if self._refresher:
+            self._refresher.cancel()
+            self._refresher = None
+
+    async def _refresh_forever(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"Could not refresh the symbol index: {e}")
+            await asyncio.sleep(settings.SYMBOL_INDEX_REFRESH_INTERVAL)
+
+    @staticmethod
+    def _prefix_range(keys, prefix):
+        start = bisect.bisect_left(keys, (prefix,))
+        end = bisect.bisect_left(keys, (prefix + "\uffff",))
+        return (position for _, position in keys[start:end])
@@ -0,0 +1,222 @@
+"""This module throttles the expensive commands of the bot per user.
+
+Handlers that fetch market data are marked with the ``throttle`` flag,
+whose value is the command name used for the reply cache. Each user has
+a token bucket per command holding up to ``THROTTLE_BURST`` requests and
+refilled at ``THROTTLE_RATE`` requests per second; a request that finds
+the bucket empty is answered with a cooldown message instead of reaching
+the handler. Requests whose reply is already cached cost nothing
+upstream, so they are never throttled and do not take a token.
+
+The buckets live in memory, or in Redis with ``THROTTLE_STORAGE=redis``
+so that all worker processes share them. If Redis cannot be reached,
+requests are let through rather than rejected.
+
+Classes:
+    MemoryTokenBuckets: Token buckets kept in the bot process.
+    RedisTokenBuckets: Token buckets shared through Redis.
+    ThrottlingMiddleware: Rejects requests beyond a user's budget.
+
+Functions:
+    create_token_buckets: Creates the configured token buckets.
+"""
+
+import logging
+import math
+import time
+
+from aiogram import BaseMiddleware, Dispatcher
+from aiogram.dispatcher.flags import get_flag
+from aiogram.types import Message
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from telegram_bot.services.replies import reply_cache, reply_key
+from telegram_bot.settings import BotSettings as settings
+
+logger = logging.getLogger(__name__)
+
+MEMORY_BUCKETS_MAXSIZE = 100_000
+TAKE_TOKEN_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call("HSET", KEYS[1], "tokens", tokens, "updated", now)
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class MemoryTokenBuckets:
+    """Token buckets kept in the bot process."""
+
+    def __init__(self) -> None:
+        """Initializes the buckets."""
+        self._buckets = {}
+
+    async def take(self, key, rate, capacity) -> float:
+        """Takes a token from a bucket.
+
+        Args:
+            key (str): The bucket key.
+            rate (float): The tokens added per second.
+            capacity (float): The maximum number of tokens.
+
+        Returns:
+            float: 0 if a token has been taken, otherwise the seconds
+                until the next token.
+        """
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / rate
+        if len(self._buckets) >= MEMORY_BUCKETS_MAXSIZE:
+            self._forget_full(now, rate, capacity)
+        self._buckets[key] = (tokens, now)
+        return wait
+
+    async def close(self) -> None:
+        """Releases the buckets."""
+        self._buckets.clear()
+
+    def _forget_full(self, now, rate, capacity) -> None:
+        self._buckets = {
+            key: (tokens, updated)
+            for key, (tokens, updated) in self._buckets.items()
+            if tokens + (now - updated) * rate < capacity
+        }
+
+
+class RedisTokenBuckets:
+    """Token buckets shared through Redis.
+
+    A bucket is a hash updated by a Lua script, so concurrent requests
+    from several workers cannot take the same token, and it expires once
+    it would be full again.
+    """
+
+    def __init__(self, url, prefix="stocktic_throttle") -> None:
+        """Initializes the buckets.
+
+        Args:
+            url (str): The Redis URL.
+            prefix (str): The prefix of the bucket keys.
+        """
+        self.prefix = prefix
+        self._redis = Redis.from_url(url)
+        self._take = self._redis.register_script(TAKE_TOKEN_SCRIPT)
+
+    async def take(self, key, rate, capacity) -> float:
+        """Takes a token from a bucket.
+
+        Args:
+            key (str): The bucket key.
+            rate (float): The tokens added per second.
+            capacity (float): The maximum number of tokens.
+
+        Returns:
+            float: 0 if a token has been taken, otherwise the seconds
+                until the next token.
+        """
+        wait = await self._take(
+            keys=[f"{self.prefix}:{key}"], args=[rate, capacity, time.time()]
+        )
+        return float(wait)
+
+    async def close(self) -> None:
+        """Closes the Redis connection."""
+        await self._redis.aclose()
+
+
+def create_token_buckets():
+    """Creates the configured token buckets.
+
+    Returns:
+        RedisTokenBuckets | MemoryTokenBuckets: Redis buckets if
+            ``THROTTLE_STORAGE`` is ``redis``, otherwise memory buckets.
+    """
+    if settings.THROTTLE_STORAGE == "redis":
+        return RedisTokenBuckets(settings.REDIS_URL)
+    return MemoryTokenBuckets()
+
+
+class ThrottlingMiddleware(BaseMiddleware):
+    """Rejects requests beyond a user's budget.
+
+    Attributes:
+        buckets (MemoryTokenBuckets | RedisTokenBuckets): The token
+            buckets.
+        rate (float): The requests per second allowed per user and
+            command.
+        burst (int): The requests a user can make at once per command.
+    """
+
+    def __init__(self, buckets=None, rate=None, burst=None) -> None:
+        """Initializes the middleware.
+
+        Args:
+            buckets (MemoryTokenBuckets | RedisTokenBuckets, optional):
+                The token buckets, by default the configured ones.
+            rate (float, optional): The requests per second allowed per
+                user and command.
+            burst (int, optional): The requests a user can make at once
+                per command.
+        """
+        self.buckets = buckets or create_token_buckets()
+        self.rate = rate or settings.THROTTLE_RATE
+        self.burst = burst or settings.THROTTLE_BURST
+
+    def install(self, dp: Dispatcher) -> None:
+        """Registers the middleware for the message handlers.
+
+        Args:
+            dp (Dispatcher): The dispatcher.
+        """
+        dp.message.middleware(self)
+        dp.shutdown.register(self.buckets.close)
+
+    async def __call__(self, handler, event, data):
+        """Calls the handler unless the user is over budget.
+
+        Args:
+            handler (Callable): The next handler in the chain.
+            event (TelegramObject): The event.
+            data (dict): The handler data.
+
+        Returns:
+            Any: The result of the handler, or None if throttled.
+        """
+        command = get_flag(data, "throttle")
+        if not command or not isinstance(event, Message) or not event.text:
+            return await handler(event, data)
+        if reply_key(command, event.text) in reply_cache:
+            return await handler(event, data)
+
+        try:
+            wait = await self.buckets.take(
+                f"{event.from_user.id}:{command}", self.rate, self.burst
+            )
+        except RedisError as e:
+            logger.warning(f"Throttling skipped, Redis unavailable: {e}")
+            wait = 0
+        if wait > 0:
+            await event.answer(
+                "You are sending requests too quickly. "
+                f"Please try again in {math.ceil(wait)} seconds."
+            )
+            return None
+        return await handler(event, data)
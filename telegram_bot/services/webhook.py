@@ -0,0 +1,182 @@
+"""This module runs the bot in webhook mode on an aiohttp server.
+
+Telegram pushes updates to the webhook instead of the bot long-polling
+for them. Each update is acknowledged immediately and processed in the
+background, with the number of updates processed at once bounded by a
+semaphore. When too many updates are pending the server answers 503, so
+Telegram redelivers them later instead of the bot queueing without
+limit. The listening socket is opened with ``SO_REUSEPORT``, so several
+worker processes can share one port behind a load balancer.
+
+Requests must carry ``WEBHOOK_SECRET`` in Telegram's secret token
+header, so the server refuses to start without one rather than accept
+updates posted by anyone.
+
+Classes:
+    BoundedRequestHandler: A webhook handler with bounded concurrency.
+
+Functions:
+    create_webhook_app: Creates the aiohttp application for the webhook.
+    start_webhook: Registers the webhook and serves updates until stopped.
+"""
+
+import asyncio
+import logging
+import signal
+
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import (
+    SimpleRequestHandler,
+    setup_application,
+)
+from aiohttp import web
+
+from telegram_bot.settings import BotSettings as settings
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedRequestHandler(SimpleRequestHandler):
+    """A webhook handler with bounded concurrency.
+
+    Attributes:
+        max_concurrency (int): The number of updates processed at once.
+        max_pending (int): The number of accepted, unfinished updates
+            above which new updates are rejected.
+        drain_timeout (float): How long to wait for pending updates on
+            shutdown, in seconds.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot: Bot,
+        max_concurrency: int,
+        max_pending: int,
+        drain_timeout: float = 10,
+        **kwargs,
+    ) -> None:
+        """Initializes the handler.
+
+        Args:
+            dispatcher (Dispatcher): The dispatcher instance.
+            bot (Bot): The bot instance.
+            max_concurrency (int): The number of updates processed at once.
+            max_pending (int): The number of accepted, unfinished updates
+                above which new updates are rejected.
+            drain_timeout (float): How long to wait for pending updates on
+                shutdown, in seconds.
+            **kwargs: Arguments passed to ``SimpleRequestHandler``.
+        """
+        super().__init__(
+            dispatcher=dispatcher, bot=bot, handle_in_background=True, **kwargs
+        )
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.drain_timeout = drain_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Accepts an update unless too many updates are pending.
+
+        Args:
+            request (web.Request): The webhook request from Telegram.
+
+        Returns:
+            web.Response: The response to Telegram.
+        """
+        if len(self._background_feed_update_tasks) >= self.max_pending:
+            logger.warning("Webhook backlog is full, asking for redelivery")
+            return web.Response(status=503, headers={"Retry-After": "1"})
+        return await super().handle(request)
+
+    __call__ = handle
+
+    async def _background_feed_update(self, bot: Bot, update: dict) -> None:
+        async with self._semaphore:
+            try:
+                await super()._background_feed_update(bot, update)
+            except Exception as e:
+                logger.error(f"An error occurred while handling update: {e}")
+
+    async def close(self) -> None:
+        """Waits for pending updates.
+
+        The bot session stays open for the dispatcher shutdown handlers,
+        which may still send queued messages, and is closed afterwards by
+        the application.
+        """
+        pending = set(self._background_feed_update_tasks)
+        if pending:
+            logger.info(f"Waiting for {len(pending)} pending updates")
+            await asyncio.wait(pending, timeout=self.drain_timeout)
+
+
+def create_webhook_app(dp: Dispatcher, bot: Bot) -> web.Application:
+    """Creates the aiohttp application for the webhook.
+
+    Args:
+        dp (Dispatcher): The dispatcher instance.
+        bot (Bot): The bot instance.
+
+    Returns:
+        web.Application: The application serving the webhook path and a
+            ``/healthz`` endpoint for load balancers.
+    """
+    app = web.Application()
+    handler = BoundedRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        max_concurrency=settings.WEBHOOK_MAX_CONCURRENCY,
+        max_pending=settings.WEBHOOK_MAX_PENDING,
+        secret_token=settings.WEBHOOK_SECRET,
+    )
+    handler.register(app, path=settings.WEBHOOK_PATH)
+    app.router.add_get("/healthz", lambda request: web.Response(text="ok"))
+    setup_application(app, dp, bot=bot)
+    app.on_shutdown.append(lambda app: bot.session.close())
+    return app
+
+
+async def start_webhook(dp: Dispatcher, bot: Bot) -> None:
+    """Registers the webhook and serves updates until stopped.
+
+    Args:
+        dp (Dispatcher): The dispatcher instance.
+        bot (Bot): The bot instance.
+
+    Raises:
+        RuntimeError: If ``WEBHOOK_SECRET`` is not set.
+    """
+    if not settings.WEBHOOK_SECRET:
+        raise RuntimeError("WEBHOOK_SECRET must be set in webhook mode")
+    runner = web.AppRunner(create_webhook_app(dp, bot))
+    await runner.setup()
+    site = web.TCPSite(
+        runner,
+        host=settings.WEBHOOK_HOST,
+        port=settings.WEBHOOK_PORT,
+        reuse_port=True,
+    )
+    await site.start()
+    logger.info(
+        f"Webhook server listening on "
+        f"{settings.WEBHOOK_HOST}:{settings.WEBHOOK_PORT}"
+    )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    try:
+        if settings.WEBHOOK_URL:
+            await bot.set_webhook(
+                url=settings.WEBHOOK_URL.rstrip("/") + settings.WEBHOOK_PATH,
+                secret_token=settings.WEBHOOK_SECRET,
+                max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+                allowed_updates=dp.resolve_used_update_types(),
+            )
+        await stop.wait()
+    finally:
+        await runner.cleanup()
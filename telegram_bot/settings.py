@@ -12,8 +12,164 @@ class BotSettings:
 
     Attributes:
         API_BASE_URL (str): The base URL for the API.
+        API_TIMEOUT (float): The read/write/pool timeout in seconds for
+            API requests.
+        API_CONNECT_TIMEOUT (float): The connect timeout in seconds for
+            API requests.
+        API_MAX_CONNECTIONS (int): The maximum number of connections in
+            the API client pool.
+        API_MAX_KEEPALIVE_CONNECTIONS (int): The maximum number of idle
+            keep-alive connections in the API client pool.
+        API_KEEPALIVE_EXPIRY (float): The idle time in seconds after which
+            keep-alive connections are closed.
+        API_HTTP2 (bool): Whether to use HTTP/2 when ``h2`` is installed.
+        TOKEN_CACHE_TTL (float): The maximum lifetime in seconds of cached
+            access tokens.
+        TOKEN_EXPIRY_MARGIN (float): How many seconds before expiry a cached
+            access token stops being used.
+        TOKEN_REFRESH_AHEAD (float): How many seconds of remaining lifetime
+            trigger a background token refresh.
+        MARKET_DATA_TIMEOUT (float): The timeout in seconds for a single
+            market data call.
+        MARKET_DATA_MAX_WORKERS (int): The maximum number of market data
+            calls running concurrently in the thread pool.
+        FSM_STORAGE (str): The FSM storage backend, ``memory`` or
+            ``redis``.
+        REDIS_URL (str): The URL of the Redis server.
+        FSM_STATE_TTL (int): The lifetime in seconds of stored FSM states.
+        FSM_DATA_TTL (int): The lifetime in seconds of stored FSM data.
+        BOT_WORKERS (int): The number of bot worker processes started by
+            the runner.
+        BOT_MODE (str): How the bot receives updates, ``polling`` or
+            ``webhook``.
+        TELEGRAM_API_URL (str): The base URL of the Telegram Bot API, for
+            a local Bot API or fake server. Empty for the public API.
+        WEBHOOK_URL (str): The public base URL Telegram sends updates to.
+            Empty to leave the registered webhook unchanged.
+        WEBHOOK_PATH (str): The path of the webhook endpoint.
+        WEBHOOK_SECRET (str): The secret token Telegram sends with every
+            webhook request. Required in webhook mode, where requests
+            without it are rejected.
+        WEBHOOK_HOST (str): The host the webhook server listens on.
+        WEBHOOK_PORT (int): The port the webhook server listens on.
+        WEBHOOK_MAX_CONCURRENCY (int): The number of updates a worker
+            processes at once.
+        WEBHOOK_MAX_PENDING (int): The number of unfinished updates above
+            which a worker asks Telegram to redeliver.
+        WEBHOOK_MAX_CONNECTIONS (int): The number of simultaneous
+            connections Telegram opens to the webhook.
+        MESSAGE_QUEUE_GLOBAL_RATE (float): The messages per second the bot
+            sends across all chats.
+        MESSAGE_QUEUE_CHAT_RATE (float): The messages per second the bot
+            sends to a single chat.
+        MESSAGE_QUEUE_MAX_RETRIES (int): How many times a rate-limited
+            message is retried before it is dropped.
+        SYMBOL_INDEX_REFRESH_INTERVAL (float): How often in seconds the
+            symbol search index checks the ticker list for changes.
+        INLINE_RESULTS_LIMIT (int): The number of suggestions returned for
+            an inline query.
+        INLINE_CACHE_TIME (int): How long in seconds Telegram may cache the
+            suggestions for an inline query.
+        REPLY_CACHE_TTL_TICKER_INFO (float): The lifetime in seconds of
+            cached ``/ticker_info`` replies.
+        REPLY_CACHE_TTL_LATEST_PRICE (float): The lifetime in seconds of
+            cached ``/latest_price`` replies.
+        REPLY_CACHE_TTL_NEWS (float): The lifetime in seconds of cached
+            ``/news`` replies.
+        REPLY_CACHE_MAXSIZE (int): The maximum number of cached replies.
+        COMPARE_MAX_SYMBOLS (int): The maximum number of tickers in one
+            ``/compare`` command.
+        DATA_ACCESS (str): How the bot reads and writes StockTic data,
+            ``http`` through the API or ``orm`` through the Django ORM
+            in-process.
+        DB_MAX_WORKERS (int): The maximum number of threads running ORM
+            queries in ``orm`` data access mode.
+        THROTTLE_ENABLED (bool): Whether expensive commands are
+            throttled per user.
+        THROTTLE_STORAGE (str): Where the token buckets are kept,
+            ``memory`` or ``redis``. Defaults to the FSM storage.
+        THROTTLE_RATE (float): The requests per second allowed per user
+            and command once the burst is spent.
+        THROTTLE_BURST (int): The requests a user can make at once per
+            command.
+        METRICS_ENABLED (bool): Whether handler and event loop metrics
+            are collected.
+        METRICS_HOST (str): The host of the metrics endpoint.
+        METRICS_PORT (int): The port of the metrics endpoint, 0 to only
+            log the metrics.
+        METRICS_LOG_INTERVAL (float): The interval in seconds between two
+            metric summaries in the logs.
+        METRICS_LOOP_LAG_INTERVAL (float): The interval in seconds
+            between two event loop lag samples.
+        METRICS_LOOP_LAG_WARNING (float): The event loop lag in seconds
+            above which a warning is logged.
         TIME_ZONE (str): The time zone for the bot.
     """
 
     API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
+    API_TIMEOUT = float(os.getenv("API_TIMEOUT", "10"))
+    API_CONNECT_TIMEOUT = float(os.getenv("API_CONNECT_TIMEOUT", "5"))
+    API_MAX_CONNECTIONS = int(os.getenv("API_MAX_CONNECTIONS", "100"))
+    API_MAX_KEEPALIVE_CONNECTIONS = int(
+        os.getenv("API_MAX_KEEPALIVE_CONNECTIONS", "20")
+    )
+    API_KEEPALIVE_EXPIRY = float(os.getenv("API_KEEPALIVE_EXPIRY", "30"))
+    API_HTTP2 = os.getenv("API_HTTP2", "true").lower() == "true"
+    TOKEN_CACHE_TTL = float(os.getenv("TOKEN_CACHE_TTL", "240"))
+    TOKEN_EXPIRY_MARGIN = float(os.getenv("TOKEN_EXPIRY_MARGIN", "10"))
+    TOKEN_REFRESH_AHEAD = float(os.getenv("TOKEN_REFRESH_AHEAD", "60"))
+    MARKET_DATA_TIMEOUT = float(os.getenv("MARKET_DATA_TIMEOUT", "10"))
+    MARKET_DATA_MAX_WORKERS = int(os.getenv("MARKET_DATA_MAX_WORKERS", "32"))
+    FSM_STORAGE = os.getenv("FSM_STORAGE", "memory")
+    REDIS_URL = os.getenv("REDIS_URL", "redis://127.0.0.1:6379/2")
+    FSM_STATE_TTL = int(os.getenv("FSM_STATE_TTL", str(60 * 60 * 24)))
+    FSM_DATA_TTL = int(os.getenv("FSM_DATA_TTL", str(60 * 60 * 24)))
+    BOT_WORKERS = int(os.getenv("BOT_WORKERS", "1"))
+    BOT_MODE = os.getenv("BOT_MODE", "polling")
+    TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL", "")
+    WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")
+    WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/telegram/webhook")
+    WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "")
+    WEBHOOK_HOST = os.getenv("WEBHOOK_HOST", "0.0.0.0")
+    WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8080"))
+    WEBHOOK_MAX_CONCURRENCY = int(os.getenv("WEBHOOK_MAX_CONCURRENCY", "64"))
+    WEBHOOK_MAX_PENDING = int(os.getenv("WEBHOOK_MAX_PENDING", "1000"))
+    WEBHOOK_MAX_CONNECTIONS = int(os.getenv("WEBHOOK_MAX_CONNECTIONS", "40"))
+    MESSAGE_QUEUE_GLOBAL_RATE = float(
+        os.getenv("MESSAGE_QUEUE_GLOBAL_RATE", "30")
+    )
+    MESSAGE_QUEUE_CHAT_RATE = float(os.getenv("MESSAGE_QUEUE_CHAT_RATE", "1"))
+    MESSAGE_QUEUE_MAX_RETRIES = int(
+        os.getenv("MESSAGE_QUEUE_MAX_RETRIES", "3")
+    )
+    SYMBOL_INDEX_REFRESH_INTERVAL = float(
+        os.getenv("SYMBOL_INDEX_REFRESH_INTERVAL", "600")
+    )
+    INLINE_RESULTS_LIMIT = int(os.getenv("INLINE_RESULTS_LIMIT", "20"))
+    INLINE_CACHE_TIME = int(os.getenv("INLINE_CACHE_TIME", "300"))
+    REPLY_CACHE_TTL_TICKER_INFO = float(
+        os.getenv("REPLY_CACHE_TTL_TICKER_INFO", "300")
+    )
+    REPLY_CACHE_TTL_LATEST_PRICE = float(
+        os.getenv("REPLY_CACHE_TTL_LATEST_PRICE", "15")
+    )
+    REPLY_CACHE_TTL_NEWS = float(os.getenv("REPLY_CACHE_TTL_NEWS", "120"))
+    REPLY_CACHE_MAXSIZE = int(os.getenv("REPLY_CACHE_MAXSIZE", "5000"))
+    COMPARE_MAX_SYMBOLS = int(os.getenv("COMPARE_MAX_SYMBOLS", "10"))
+    DATA_ACCESS = os.getenv("DATA_ACCESS", "http")
+    DB_MAX_WORKERS = int(os.getenv("DB_MAX_WORKERS", "16"))
+    THROTTLE_ENABLED = os.getenv("THROTTLE_ENABLED", "true").lower() == "true"
+    THROTTLE_STORAGE = os.getenv("THROTTLE_STORAGE", FSM_STORAGE)
+    THROTTLE_RATE = float(os.getenv("THROTTLE_RATE", "0.2"))
+    THROTTLE_BURST = int(os.getenv("THROTTLE_BURST", "5"))
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+    METRICS_PORT = int(os.getenv("METRICS_PORT", "9100"))
+    METRICS_LOG_INTERVAL = float(os.getenv("METRICS_LOG_INTERVAL", "300"))
+    METRICS_LOOP_LAG_INTERVAL = float(
+        os.getenv("METRICS_LOOP_LAG_INTERVAL", "0.1")
+    )
+    METRICS_LOOP_LAG_WARNING = float(
+        os.getenv("METRICS_LOOP_LAG_WARNING", "0.1")
+    )
     TIME_ZONE = os.getenv("TIME_ZONE", "UTC")
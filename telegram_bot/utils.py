@@ -62,9 +62,9 @@ def send_telegram_message(telegram_user_id, message):
         message (str): The message to be sent.
 
     Returns:
-        None
+        httpx.Response: The response of the Telegram Bot API.
     """
     bot_token = settings.TELEGRAM_BOT_TOKEN
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
     params = {"chat_id": telegram_user_id, "text": message}
-    httpx.post(url, params=params)
+    return httpx.post(url, params=params)